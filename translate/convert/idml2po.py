@@ -18,33 +18,43 @@
 
 """Convert IDML files to PO localization files."""
 
-from io import BytesIO
-
 from translate.convert import convert
 from translate.storage import factory
 from translate.storage.idml import INLINE_ELEMENTS, NO_TRANSLATE_ELEMENTS, open_idml
 from translate.storage.xml_extract.extract import (
-    IdMaker,
     ParseState,
+    add_postore_unit,
     build_idml_store,
-    make_postore_adder,
+    extract_units,
+    offset_placeable_ids,
 )
+from translate.storage.xml_extract.misc import map_parts
+
+
+def extract_idml_story(data):
+    """Extract the units of a story of an IDML package."""
+    parse_state = ParseState(NO_TRANSLATE_ELEMENTS, INLINE_ELEMENTS)
+    return extract_units(data, parse_state, build=build_idml_store)
 
 
-def convert_idml(inputfile, outputfile, template):
-    """Convert an IDML package to PO."""
+def convert_idml(inputfile, outputfile, template, jobs=1):
+    """Convert an IDML package to PO.
+
+    :param jobs: Number of processes extracting the stories of the package in
+        parallel, 0 for one per CPU.
+    """
     store = factory.getobject(outputfile)
 
     contents = open_idml(inputfile)
 
-    id_maker = IdMaker()  # Create it here to avoid having repeated ids.
-
-    for filename, translatable_file in contents.items():
-        parse_state = ParseState(NO_TRANSLATE_ELEMENTS, INLINE_ELEMENTS)
-        po_store_adder = make_postore_adder(store, id_maker, filename)
-        build_idml_store(
-            BytesIO(translatable_file), store, parse_state, store_adder=po_store_adder
-        )
+    # The ids are numbered across the stories to avoid having repeated ids.
+    id_offset = 0
+    extracted = map_parts(extract_idml_story, contents.values(), jobs)
+    for filename, (units, id_count) in zip(contents, extracted):
+        for placeables, xpath in units:
+            offset_placeable_ids(placeables, id_offset)
+            add_postore_unit(store, placeables, xpath, filename)
+        id_offset += id_count
 
     store.save()
     return True
@@ -55,6 +65,8 @@ def main(argv=None):
         "idml": ("po", convert_idml),
     }
     parser = convert.ConvertOptionParser(formats, description=__doc__)
+    parser.setjobsoptions()
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
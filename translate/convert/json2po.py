@@ -33,15 +33,22 @@ logger = logging.getLogger(__name__)
 class json2po:
     """Convert a JSON file to a PO file"""
 
-    def convert_store(self, input_store, duplicatestyle="msgctxt"):
-        """Converts a JSON file to a PO file"""
+    def convert_store(self, input_store, duplicatestyle="msgctxt", input_units=None):
+        """Converts a JSON file to a PO file
+
+        :param input_units: the units to convert instead of those of
+            ``input_store``, like the ones yielded while it is parsed.
+        """
         output_store = po.pofile()
         output_header = output_store.header()
-        output_header.addnote("extracted from %s" % input_store.filename, "developer")
-        for input_unit in input_store.units:
+        if input_units is None:
+            input_units = input_store.units
+        for input_unit in input_units:
             output_unit = self.convert_unit(input_unit, "developer")
             if output_unit is not None:
                 output_store.addunit(output_unit)
+        # The file name is only known once the input is read
+        output_header.addnote("extracted from %s" % input_store.filename, "developer")
         output_store.removeduplicates(duplicatestyle)
         return output_store
 
@@ -110,13 +117,17 @@ def convertjson(
 
     if filter is not None:
         filter = filter.split(",")
-    input_store = jsonl10n.JsonFile(input_file, filter=filter)
     convertor = json2po()
     if template_file is None:
+        # The units are converted as they are read
+        input_store = jsonl10n.JsonFile(filter=filter)
         output_store = convertor.convert_store(
-            input_store, duplicatestyle=duplicatestyle
+            input_store,
+            duplicatestyle=duplicatestyle,
+            input_units=input_store.iterparse(input_file),
         )
     else:
+        input_store = jsonl10n.JsonFile(input_file, filter=filter)
         template_store = jsonl10n.JsonFile(template_file)
         output_store = convertor.merge_store(
             template_store, input_store, blankmsgstr=pot, duplicatestyle=duplicatestyle
@@ -22,17 +22,30 @@ See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/command
 for examples and usage instructions.
 """
 
-from io import BytesIO
-
 from translate.convert import convert
 from translate.storage import factory
 from translate.storage.odf_io import open_odf
 from translate.storage.odf_shared import inline_elements, no_translate_content_elements
-from translate.storage.xml_extract.extract import ParseState, build_store
+from translate.storage.xml_extract.extract import (
+    ParseState,
+    add_store_unit,
+    extract_units,
+)
+from translate.storage.xml_extract.misc import map_parts
+
+
+def extract_odf_part(data):
+    """Extract the units of an XML file of an ODF package."""
+    parse_state = ParseState(no_translate_content_elements, inline_elements)
+    return extract_units(data, parse_state)
+
 
+def convertodf(inputfile, outputfile, templates, jobs=1):
+    """Convert an ODF package to XLIFF.
 
-def convertodf(inputfile, outputfile, templates):
-    """Convert an ODF package to XLIFF."""
+    :param jobs: Number of processes extracting the files of the package in
+        parallel, 0 for one per CPU.
+    """
 
     store = factory.getobject(outputfile)
 
@@ -42,9 +55,9 @@ def convertodf(inputfile, outputfile, templates):
         print("couldn't set origin filename")
 
     contents = open_odf(inputfile)
-    for data in contents.values():
-        parse_state = ParseState(no_translate_content_elements, inline_elements)
-        build_store(BytesIO(data), store, parse_state)
+    for units, _id_count in map_parts(extract_odf_part, contents.values(), jobs):
+        for placeables, xpath in units:
+            add_store_unit(store, placeables, xpath)
 
     store.save()
     return True
@@ -89,6 +102,8 @@ def main(argv=None):
         ("oth", ("xliff", convertodf)),  # Web page template
     )
     parser = convert.ConvertOptionParser(formats, description=__doc__)
+    parser.setjobsoptions()
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
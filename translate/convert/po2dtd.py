@@ -160,7 +160,7 @@ class po2dtd:
         return dtdunit
 
     def convertstore(self, inputstore, includefuzzy=False):
-        outputstore = dtd.dtdfile(android=self.android)
+        outputstore = dtd.dtdfile(android=self.android, validate=True)
         self.currentgroups = []
         for inputunit in inputstore.units:
             if (includefuzzy or not inputunit.isfuzzy()) and (
@@ -203,7 +203,7 @@ def convertdtd(
     if templatefile is None:
         convertor = po2dtd(android=android_dtd, remove_untranslated=remove_untranslated)
     else:
-        templatestore = dtd.dtdfile(templatefile, android=android_dtd)
+        templatestore = dtd.dtdfile(templatefile, android=android_dtd, validate=True)
         convertor = redtd(
             templatestore, android=android_dtd, remove_untranslated=remove_untranslated
         )
@@ -22,6 +22,7 @@ See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/command
 for examples and usage instructions.
 """
 
+import codecs
 import os
 import sys
 
@@ -44,14 +45,27 @@ class po2html:
             return unit.target
         return unit.source
 
-    def mergestore(self, inputstore, templatetext, includefuzzy):
-        """Convert a file to html format"""
+    def mergestore(self, inputstore, templatetext, includefuzzy, output=None):
+        """Convert a file to html format
+
+        The translated document is returned, unless it is written to the
+        output text stream while the template is parsed.
+        """
         self.inputstore = inputstore
         self.inputstore.require_index()
         self.includefuzzy = includefuzzy
-        output_store = html.htmlfile(inputfile=templatetext, callback=self.lookup)
+        output_store = html.htmlfile(
+            inputfile=templatetext, callback=self.lookup, output=output
+        )
         return output_store.filesrc
 
+    def mergefile(self, inputstore, templatefile, outputfile, includefuzzy):
+        """Write the translated template to the binary outputfile."""
+        writer = codecs.getwriter("utf-8")(outputfile)
+        self.mergestore(inputstore, templatefile, includefuzzy, writer)
+        # The output is referenced by the parsed template until it is collected
+        writer.flush()
+
 
 def converthtml(
     inputfile, outputfile, templatefile, includefuzzy=False, outputthreshold=None
@@ -66,8 +80,7 @@ def converthtml(
     if templatefile is None:
         raise ValueError("must have template file for HTML files")
     else:
-        outputstring = convertor.mergestore(inputstore, templatefile, includefuzzy)
-    outputfile.write(outputstring.encode("utf-8"))
+        convertor.mergefile(inputstore, templatefile, outputfile, includefuzzy)
     return 1
 
 
@@ -139,8 +152,7 @@ class PO2HtmlOptionParser(convert.ConvertOptionParser):
             return False
 
         convertor = po2html()
-        outputstring = convertor.mergestore(self.inputstore, templatefile, includefuzzy)
-        outputfile.write(outputstring.encode("utf-8"))
+        convertor.mergefile(self.inputstore, templatefile, outputfile, includefuzzy)
         return 1
 
     def recurse_template_files(self, options):
@@ -36,22 +36,19 @@ from translate.storage.idml import (
 )
 from translate.storage.xml_extract.extract import ParseState, process_idml_translatable
 from translate.storage.xml_extract.generate import apply_translations, replace_dom_text
+from translate.storage.xml_extract.misc import map_parts
 from translate.storage.xml_extract.unit_tree import XPathTree, build_unit_tree
 
 
-def translate_idml(template, input_file, translatable_files):
-    def load_dom_trees(template):
-        """Return a dict with translatable files in the template IDML package.
+def translate_idml(template, input_file, translatable_files, jobs=1):
+    """Return a dict with the translated files for the IDML package.
 
-        The keys are the filenames inside the IDML package, and the values are
-        the etrees for each of those translatable files.
-        """
-        idml_data = open_idml(template)
-        parser = etree.XMLParser(strip_cdata=False, resolve_entities=False)
-        return {
-            filename: etree.fromstring(data, parser).getroottree()
-            for filename, data in idml_data.items()
-        }
+    The keys are the filenames for the translatable files inside the template
+    IDML package, and the values are the translated XML documents.
+
+    :param jobs: Number of processes translating the files in parallel, 0 for
+        one per CPU.
+    """
 
     def load_unit_tree(input_file):
         """Return a dict with the translations grouped by files IDML package.
@@ -79,13 +76,8 @@ def translate_idml(template, input_file, translatable_files):
             for filename in translatable_files
         )
 
-    def translate_dom_trees(unit_trees, dom_trees):
-        """Return a dict with the translated files for the IDML package.
-
-        The keys are the filenames for the translatable files inside the
-        template IDML package, and the values are etree ElementTree instances
-        for each of those files.
-        """
+    def translate_dom_tree(filename):
+        """Return the translated XML document for a file of the IDML package."""
 
         def get_po_doms(unit):
             """Return a tuple with unit source and target DOM objects.
@@ -126,42 +118,39 @@ def translate_idml(template, input_file, translatable_files):
             return (source_dom, target_dom)
 
         make_parse_state = lambda: ParseState(NO_TRANSLATE_ELEMENTS, INLINE_ELEMENTS)
-        for filename, dom_tree in dom_trees.items():
-            file_unit_tree = unit_trees[filename]
-            apply_translations(
-                dom_tree.getroot(),
-                file_unit_tree,
-                replace_dom_text(
-                    make_parse_state,
-                    dom_retriever=get_po_doms,
-                    process_translatable=process_idml_translatable,
-                ),
-            )
-        return dom_trees
-
-    dom_trees = load_dom_trees(template)
+        parser = etree.XMLParser(strip_cdata=False, resolve_entities=False)
+        dom_tree = etree.fromstring(idml_data[filename], parser).getroottree()
+        apply_translations(
+            dom_tree.getroot(),
+            unit_trees[filename],
+            replace_dom_text(
+                make_parse_state,
+                dom_retriever=get_po_doms,
+                process_translatable=process_idml_translatable,
+            ),
+        )
+        return etree.tostring(
+            dom_tree, encoding="UTF-8", xml_declaration=True, standalone="yes"
+        )
+
+    idml_data = open_idml(template)
     unit_trees = load_unit_tree(input_file)
-    return translate_dom_trees(unit_trees, dom_trees)
+    return dict(zip(idml_data, map_parts(translate_dom_tree, idml_data, jobs)))
 
 
-def write_idml(template_zip, output_file, dom_trees):
+def write_idml(template_zip, output_file, translated_files):
     """Write the translated IDML package."""
     output_zip = ZipFile(output_file, "w", compression=ZIP_DEFLATED)
 
     # Copy the IDML package.
-    output_zip = copy_idml(template_zip, output_zip, dom_trees.keys())
+    output_zip = copy_idml(template_zip, output_zip, translated_files.keys())
 
     # Replace the translated files in the IDML package.
-    for filename, dom_tree in dom_trees.items():
-        output_zip.writestr(
-            filename,
-            etree.tostring(
-                dom_tree, encoding="UTF-8", xml_declaration=True, standalone="yes"
-            ),
-        )
+    for filename, data in translated_files.items():
+        output_zip.writestr(filename, data)
 
 
-def convertpo(input_file, output_file, template):
+def convertpo(input_file, output_file, template, jobs=1):
     """Create a translated IDML using an IDML template and a PO file."""
     # Now proceed with the conversion.
     template_zip = ZipFile(template, "r")
@@ -173,9 +162,11 @@ def convertpo(input_file, output_file, template):
     ]
 
     po_data = input_file.read()
-    dom_trees = translate_idml(template, BytesIO(po_data), translatable_files)
+    translated_files = translate_idml(
+        template, BytesIO(po_data), translatable_files, jobs
+    )
 
-    write_idml(template_zip, output_file, dom_trees)
+    write_idml(template_zip, output_file, translated_files)
     output_file.close()
     return True
 
@@ -187,6 +178,8 @@ def main(argv=None):
     parser = convert.ConvertOptionParser(
         formats, usetemplates=True, description=__doc__
     )
+    parser.setjobsoptions()
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
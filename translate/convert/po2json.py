@@ -34,6 +34,11 @@ class rejson:
         self.inputstore = inputstore
 
     def convertstore(self, includefuzzy=False, remove_untranslated=False):
+        self.translatestore(includefuzzy, remove_untranslated)
+        return bytes(self.ouputstore)
+
+    def translatestore(self, includefuzzy=False, remove_untranslated=False):
+        """Fill the output store with the translated template units."""
         self.includefuzzy = includefuzzy
         self.remove_untranslated = remove_untranslated
         self.inputstore.makeindex()
@@ -64,7 +69,6 @@ class rejson:
             else:
                 unit.target = unit.source
             self.ouputstore.addunit(unit)
-        return bytes(self.ouputstore)
 
 
 def convertjson(
@@ -84,8 +88,9 @@ def convertjson(
         raise ValueError("Must have template file for JSON files")
 
     convertor = rejson(templatefile, inputstore)
-    outputstring = convertor.convertstore(includefuzzy, remove_untranslated)
-    outputfile.write(outputstring)
+    convertor.translatestore(includefuzzy, remove_untranslated)
+    # Write the output directly instead of building it in memory first
+    convertor.ouputstore.serialize(outputfile)
     return True
 
 
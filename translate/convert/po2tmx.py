@@ -101,6 +101,12 @@ class tmxmultifile:
         #        self.multifile = open(filename, mode)
         self.tmxfile = tmx.tmxfile()
 
+    def openwriter(self, output, sourcelanguage):
+        """Writes the translation units to output as they are converted."""
+        self.tmxfile.setsourcelanguage(sourcelanguage)
+        self.tmxfile = tmx.tmxwriter(self.tmxfile, output)
+        self.tmxfile.open()
+
     def openoutputfile(self, subfile):
         """returns a pseudo-file object for the given subfile"""
 
@@ -117,10 +123,16 @@ class TmxOptionParser(convert.ArchiveConvertOptionParser):
     def recursiveprocess(self, options):
         if not options.targetlanguage:
             raise ValueError("You must specify the target language")
-        super().recursiveprocess(options)
+        self.sourcelanguage = options.sourcelanguage
         with open(options.output, "wb") as self.output:
-            self.outputarchive.tmxfile.setsourcelanguage(options.sourcelanguage)
-            self.outputarchive.tmxfile.serialize(self.output)
+            super().recursiveprocess(options)
+            self.outputarchive.tmxfile.close()
+
+    def openarchive(self, archivefilename, filepurpose, **kwargs):
+        archive = super().openarchive(archivefilename, filepurpose, **kwargs)
+        if filepurpose == "output":
+            archive.openwriter(self.output, self.sourcelanguage)
+        return archive
 
 
 def main(argv=None):
@@ -39,6 +39,7 @@ def convertpot(
     fuzzymatching=True,
     classes=None,
     classes_str=None,
+    cache_tm=False,
     **kwargs
 ):
     """Main conversion function."""
@@ -62,6 +63,7 @@ def convertpot(
         tm,
         min_similarity,
         fuzzymatching,
+        cache_tm=cache_tm,
         **kwargs
     )
     output_store.serialize(output_file)
@@ -76,6 +78,7 @@ def convert_stores(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    cache_tm=False,
     **kwargs
 ):
     """Actual conversion function, works on stores not files, returns
@@ -103,7 +106,11 @@ def convert_stores(
             matchers.append(matcher)
         if tm:
             matcher = pretranslate.memory(
-                tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+                tm,
+                max_candidates=1,
+                min_similarity=min_similarity,
+                max_length=1000,
+                use_cache=cache_tm,
             )
             matcher.addpercentage = False
             matchers.append(matcher)
@@ -336,6 +343,15 @@ def main(argv=None):
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    parser.add_option(
+        "",
+        "--cache-tm",
+        dest="cache_tm",
+        action="store_true",
+        default=False,
+        help="Keep the parsed translation memory in a binary cache next to it",
+    )
+    parser.passthrough.append("cache_tm")
 
     defaultsimilarity = 75
     parser.add_option(
@@ -136,6 +136,7 @@ class TestConvertCommand:
             "-h, --help",
             "--manpage",
             "--errorlevel=ERRORLEVEL",
+            "--profile-report=FORMAT",
             "-i INPUT, --input=INPUT",
             "-x EXCLUDE, --exclude=EXCLUDE",
             "-o OUTPUT, --output=OUTPUT",
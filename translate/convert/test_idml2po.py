@@ -1,12 +1,16 @@
 import os
 
 from translate.convert import idml2po, test_convert
+from translate.storage import po
 
 
 class TestIDML2POCommand(test_convert.TestConvertCommand):
     """Tests running actual idml2po commands on files"""
 
     convertmodule = idml2po
+    expected_options = [
+        "--jobs=JOBS",
+    ]
 
     def test_convert(self):
         self.run_command(
@@ -14,3 +18,20 @@ class TestIDML2POCommand(test_convert.TestConvertCommand):
             i=os.path.join(os.path.dirname(__file__), "test.idml"),
         )
         assert "THE HEADLINE HERE" in self.read_testfile("simple.po").decode()
+
+    def test_convert_jobs(self):
+        self.run_command(
+            o="simple.po",
+            i=os.path.join(os.path.dirname(__file__), "test.idml"),
+        )
+        self.run_command(
+            "--jobs=2",
+            o="jobs.po",
+            i=os.path.join(os.path.dirname(__file__), "test.idml"),
+        )
+        expected = po.pofile(self.read_testfile("simple.po"))
+        store = po.pofile(self.read_testfile("jobs.po"))
+        assert len(store.units) == len(expected.units) > 1
+        for unit, expected_unit in zip(store.units, expected.units):
+            assert unit.source == expected_unit.source
+            assert unit.getlocations() == expected_unit.getlocations()
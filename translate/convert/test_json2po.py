@@ -1,7 +1,7 @@
 from io import BytesIO
 
 from translate.convert import json2po, test_convert
-from translate.storage import jsonl10n
+from translate.storage import jsonl10n, po
 
 
 class TestJson2PO:
@@ -86,3 +86,14 @@ class TestJson2POCommand(test_convert.TestConvertCommand, TestJson2PO):
         "-t TEMPLATE, --template=TEMPLATE",
         "--filter",
     ]
+
+    def test_convert(self):
+        """checks the units streamed from the JSON file are converted"""
+        self.create_testfile(
+            "test.json", '{"a": "One", "b": {"c": "Two"}, "d": ["Three"]}'
+        )
+        self.run_command("test.json", "test.po", filter="a,c")
+        with self.open_testfile("test.po") as fh:
+            pofile = po.pofile(fh)
+        assert [unit.source for unit in pofile.units[1:]] == ["One", "Two"]
+        assert pofile.units[0].getnotes() == "extracted from test.json"
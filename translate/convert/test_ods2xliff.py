@@ -7,6 +7,9 @@ class TestODF2XLIFFCommand(test_convert.TestConvertCommand):
     """Tests running actual odf2xliff commands on files"""
 
     convertmodule = odf2xliff
+    expected_options = [
+        "--jobs=JOBS",
+    ]
 
     def test_convert(self):
         self.run_command(
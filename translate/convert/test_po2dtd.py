@@ -297,6 +297,13 @@ msgstr "Lig & Kleur"
         print(newdtd)
         assert newdtd == dtdexpected
 
+    def test_invalid_output(self, recwarn):
+        """test that no file is written when the translations break the DTD"""
+        posource = '#: simple.label\nmsgid "Simple"\nmsgstr "Bad &#x;"\n'
+        dtdtemplate = '<!ENTITY simple.label "Simple">\n'
+        assert self.convertdtd(posource, dtdtemplate) == ""
+        assert recwarn.pop(Warning)
+
     def test_untranslated_with_template(self):
         """test removing of untranslated entries in redtd"""
         posource = """#: simple.label
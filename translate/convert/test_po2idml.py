@@ -9,6 +9,7 @@ class TestPo2IDMLCommand(test_convert.TestConvertCommand):
     convertmodule = po2idml
     expected_options = [
         "-t TEMPLATE, --template=TEMPLATE",
+        "--jobs=JOBS",
     ]
 
     def test_convert(self):
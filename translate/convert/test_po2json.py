@@ -167,3 +167,20 @@ msgstr ""
             remove_untranslated=True,
         )
         assert json_out == expected_json
+
+    def test_convertjson(self):
+        """Test writing the converted file directly to the output"""
+        input_file = BytesIO(self.example_input_po.encode())
+        template_file = BytesIO(self.example_json_template.encode())
+        output_file = BytesIO()
+        assert po2json.convertjson(input_file, output_file, template_file)
+        assert (
+            output_file.getvalue()
+            == b"""{
+    "foo": "oof",
+    "bar": "bar",
+    "baz": "baz",
+    "qux": "qux"
+}
+"""
+        )
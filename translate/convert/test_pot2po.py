@@ -832,6 +832,7 @@ class TestPOT2POCommand(test_convert.TestConvertCommand, TestPOT2PO):
         "-t TEMPLATE, --template=TEMPLATE",
         "-P, --pot",
         "--tm",
+        "--cache-tm",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
     ]
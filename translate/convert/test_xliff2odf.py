@@ -9,6 +9,7 @@ class TestXLIFF2ODFommand(test_convert.TestConvertCommand):
     convertmodule = xliff2odf
     expected_options = [
         "-t TEMPLATE, --template=TEMPLATE",
+        "--jobs=JOBS",
     ]
 
     def test_convert(self):
@@ -33,20 +33,19 @@ from translate.storage.odf_io import copy_odf, open_odf
 from translate.storage.odf_shared import inline_elements, no_translate_content_elements
 from translate.storage.xml_extract.extract import ParseState
 from translate.storage.xml_extract.generate import apply_translations, replace_dom_text
+from translate.storage.xml_extract.misc import map_parts
 from translate.storage.xml_extract.unit_tree import XPathTree, build_unit_tree
 
 
-def translate_odf(template, input_file):
-    def load_dom_trees(template):
-        """Return a dict with translatable files in the template ODF package.
+def translate_odf(template, input_file, jobs=1):
+    """Return a dict with the translated files for the ODF package.
 
-        The keys are the filenames inside the ODF package, and the values are
-        the etrees for each of those translatable files.
-        """
-        odf_data = open_odf(template)
-        return {
-            filename: etree.parse(BytesIO(data)) for filename, data in odf_data.items()
-        }
+    The keys are the filenames for the translatable files inside the template
+    ODF package, and the values are the translated XML documents.
+
+    :param jobs: Number of processes translating the files in parallel, 0 for
+        one per CPU.
+    """
 
     def load_unit_tree(input_file):
         """Return a dict with the translations grouped by files ODF package.
@@ -76,29 +75,23 @@ def translate_odf(template, input_file):
             ]
         )
 
-    def translate_dom_trees(unit_trees, dom_trees):
-        """Return a dict with the translated files for the ODF package.
-
-        The keys are the filenames for the translatable files inside the
-        template ODF package, and the values are etree ElementTree instances
-        for each of those files.
-        """
+    def translate_dom_tree(filename):
+        """Return the translated XML document for a file of the ODF package."""
         make_parse_state = lambda: ParseState(
             no_translate_content_elements, inline_elements
         )
-        for filename, dom_tree in dom_trees.items():
-            file_unit_tree = unit_trees[filename]
-            apply_translations(
-                dom_tree.getroot(), file_unit_tree, replace_dom_text(make_parse_state)
-            )
-        return dom_trees
-
-    dom_trees = load_dom_trees(template)
+        dom_tree = etree.parse(BytesIO(odf_data[filename]))
+        apply_translations(
+            dom_tree.getroot(), unit_trees[filename], replace_dom_text(make_parse_state)
+        )
+        return etree.tostring(dom_tree, encoding="UTF-8", xml_declaration=True)
+
+    odf_data = open_odf(template)
     unit_trees = load_unit_tree(input_file)
-    return translate_dom_trees(unit_trees, dom_trees)
+    return dict(zip(odf_data, map_parts(translate_dom_tree, odf_data, jobs)))
 
 
-def write_odf(template, output_file, dom_trees):
+def write_odf(template, output_file, translated_files):
     """Write the translated ODF package.
 
     The resulting ODF package is a copy of the template ODF package, with the
@@ -108,19 +101,17 @@ def write_odf(template, output_file, dom_trees):
     output_zip = zipfile.ZipFile(output_file, "w", compression=zipfile.ZIP_DEFLATED)
 
     # Copy the ODF package.
-    output_zip = copy_odf(template_zip, output_zip, dom_trees.keys())
+    output_zip = copy_odf(template_zip, output_zip, translated_files.keys())
 
     # Overwrite the translated files to the ODF package.
-    for filename, dom_tree in dom_trees.items():
-        output_zip.writestr(
-            filename, etree.tostring(dom_tree, encoding="UTF-8", xml_declaration=True)
-        )
+    for filename, data in translated_files.items():
+        output_zip.writestr(filename, data)
 
 
-def convertxliff(input_file, output_file, template):
+def convertxliff(input_file, output_file, template, jobs=1):
     """Create a translated ODF using an ODF template and a XLIFF file."""
-    dom_trees = translate_odf(template, input_file)
-    write_odf(template, output_file, dom_trees)
+    translated_files = translate_odf(template, input_file, jobs)
+    write_odf(template, output_file, translated_files)
     output_file.close()
     return True
 
@@ -147,6 +138,8 @@ def main(argv=None):
     parser = convert.ConvertOptionParser(
         formats, usetemplates=True, description=__doc__
     )
+    parser.setjobsoptions()
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
@@ -34,6 +34,7 @@ import re
 from translate.filters import decoration, helpers, prefilters, spelling
 from translate.filters.decorators import cosmetic, critical, extraction, functional
 from translate.lang import data, factory
+from translate.misc import instrumentation
 
 
 logger = logging.getLogger(__name__)
@@ -396,6 +397,8 @@ class UnitChecker:
             prefilters.filtervariables(startmatch, endmatch, prefilters.varnone)
             for startmatch, endmatch in self.config.varmatches
         ]
+        #: Finds the accelerators and variables used by the filters and checks
+        self.tokenizer = decoration.gettokenizer(self.config)
 
     def setsuggestionstore(self, store):
         """Sets the filename that a checker should use for evaluating
@@ -406,24 +409,52 @@ class UnitChecker:
         if self.suggestion_store:
             self.suggestion_store.require_index()
 
+    def _multifiltervariables(self, str1, varfilters):
+        """Passes ``str1`` through the variable filters, skipping the ones
+        for which the tokenizer found no variables.
+        """
+        decorations = self.tokenizer.tokenize(str1)
+        if not decorations.markers:
+            return str1
+        for index, varfilter in enumerate(varfilters):
+            varlocs = decorations.variables(index)
+            if varlocs:
+                str1 = varfilter(str1, varlocs)
+                decorations = self.tokenizer.tokenize(str1)
+        return str1
+
+    def _multifilteraccelerators(self, str1, acceptlist):
+        """Passes ``str1`` through the accelerator filters, skipping the ones
+        for which the tokenizer found no accelerators.
+        """
+        decorations = self.tokenizer.tokenize(str1)
+        if not decorations.markers:
+            return str1
+        for index, accfilter in enumerate(self.accfilters):
+            acclocs, badlocs = decorations.accelerators(index, acceptlist)
+            if acclocs:
+                str1 = accfilter(str1, acceptlist, acclocs)
+                decorations = self.tokenizer.tokenize(str1)
+        return str1
+
     @cache_results
     def filtervariables(self, str1):
         """Filter out variables from ``str1``."""
-        return helpers.multifilter(str1, self.varfilters)
+        return self._multifiltervariables(str1, self.varfilters)
 
     @cache_results
     def removevariables(self, str1):
         """Remove variables from ``str1``."""
-        return helpers.multifilter(str1, self.removevarfilter)
+        return self._multifiltervariables(str1, self.removevarfilter)
 
     @cache_results
     def filteraccelerators(self, str1):
         """Filter out accelerators from ``str1``."""
-        return helpers.multifilter(str1, self.accfilters, None)
+        return self._multifilteraccelerators(str1, None)
 
     def filteraccelerators_by_list(self, str1, acceptlist=None):
         """Filter out accelerators from ``str1``."""
-        return helpers.multifilter(str1, self.accfilters, acceptlist)
+        return self._multifilteraccelerators(str1, acceptlist)
 
     @cache_results
     def filterwordswithpunctuation(self, str1):
@@ -475,6 +506,7 @@ class UnitChecker:
         otherfunctionnames = filter(
             lambda functionname: functionname not in self.preconditions, functionnames
         )
+        timing = instrumentation.enabled
 
         for functionname in list(priorityfunctionnames) + list(otherfunctionnames):
             if functionname in ignores:
@@ -490,7 +522,11 @@ class UnitChecker:
             filtermessage = ""
 
             try:
-                filterresult = self.run_test(filterfunction, unit)
+                if timing:
+                    with instrumentation.timer("check." + functionname):
+                        filterresult = self.run_test(filterfunction, unit)
+                else:
+                    filterresult = self.run_test(filterfunction, unit)
             except FilterFailure as e:
                 filterresult = False
                 filtermessage = str(e)
@@ -505,6 +541,8 @@ class UnitChecker:
                         functionname, unit.source, unit.target, e
                     )
             if not filterresult:
+                if timing:
+                    instrumentation.count("check_failures." + functionname)
                 if not filtermessage:
                     # Should be quite rare
                     import pydoc
@@ -1198,32 +1236,27 @@ class StandardChecker(TranslationChecker):
         <http://docs.translatehouse.org/projects/localization-guide/en/latest/guide/translation/accelerators.html>`_
         for a full description on accelerators.
         """
-        str1 = self.filtervariables(str1)
-        str2 = self.filtervariables(str2)
+        decorations1 = self.tokenizer.tokenize(self.filtervariables(str1))
+        decorations2 = self.tokenizer.tokenize(self.filtervariables(str2))
         messages = []
 
-        for accelmarker in self.config.accelmarkers:
-            counter1 = decoration.countaccelerators(
-                accelmarker, self.config.sourcelang.validaccel
+        for index, accelmarker in enumerate(self.tokenizer.accelmarkers):
+            count1 = len(
+                decorations1.accelerators(index, self.config.sourcelang.validaccel)[0]
             )
-            counter2 = decoration.countaccelerators(
-                accelmarker, self.config.lang.validaccel
+            acclocs2, badlocs2 = decorations2.accelerators(
+                index, self.config.lang.validaccel
             )
-            count1, countbad1 = counter1(str1)
-            count2, countbad2 = counter2(str2)
-            getaccel = decoration.getaccelerators(
-                accelmarker, self.config.lang.validaccel
-            )
-            accel2, bad2 = getaccel(str2)
+            count2 = len(acclocs2)
 
             if count1 == count2:
                 continue
 
             if count1 == 1 and count2 == 0:
-                if countbad2 == 1:
+                if len(badlocs2) == 1:
                     messages.append(
                         "Accelerator '%s' appears before an invalid "
-                        "accelerator character '%s'" % (accelmarker, bad2[0])
+                        "accelerator character '%s'" % (accelmarker, badlocs2[0][1])
                     )
                 else:
                     messages.append("Missing accelerator '%s'" % accelmarker)
@@ -1274,9 +1307,10 @@ class StandardChecker(TranslationChecker):
         mismatch1, mismatch2 = [], []
         varnames1, varnames2 = [], []
 
-        for startmarker, endmarker in self.config.varmatches:
-            varchecker = decoration.getvariables(startmarker, endmarker)
+        decorations1 = self.tokenizer.tokenize(str1)
+        decorations2 = self.tokenizer.tokenize(str2)
 
+        for index, (startmarker, endmarker) in enumerate(self.tokenizer.varmatches):
             if startmarker and endmarker:
                 if isinstance(endmarker, int):
                     redecorate = lambda var: startmarker + var
@@ -1287,8 +1321,8 @@ class StandardChecker(TranslationChecker):
             else:
                 redecorate = lambda var: var
 
-            vars1 = varchecker(str1)
-            vars2 = varchecker(str2)
+            vars1 = [variable for varstart, variable in decorations1.variables(index)]
+            vars2 = [variable for varstart, variable in decorations2.variables(index)]
 
             if vars1 != vars2:
                 # we use counts to compare so we can handle multiple variables
@@ -1327,8 +1361,8 @@ class StandardChecker(TranslationChecker):
         not translated.
         """
         # We can't just use helpers.funcmatch() since it doesn't ignore order
-        if not set(decoration.getfunctions(str1)).symmetric_difference(
-            set(decoration.getfunctions(str2))
+        if not set(self.tokenizer.tokenize(str1).functions).symmetric_difference(
+            self.tokenizer.tokenize(str2).functions
         ):
             return True
         raise FilterFailure("Different functions")
@@ -1342,7 +1376,8 @@ class StandardChecker(TranslationChecker):
         translated. In some cases of course you should translate the address
         but generally you shouldn't.
         """
-        if helpers.funcmatch(str1, str2, decoration.getemails):
+        tokenize = self.tokenizer.tokenize
+        if tokenize(str1).emails == tokenize(str2).emails:
             return True
         raise FilterFailure("Different e-mails")
 
@@ -1358,7 +1393,8 @@ class StandardChecker(TranslationChecker):
         shouldn't really be there, unless it is very clearly marked: such
         information should go into a configuration file.
         """
-        if helpers.funcmatch(str1, str2, decoration.geturls):
+        tokenize = self.tokenizer.tokenize
+        if tokenize(str1).urls == tokenize(str2).urls:
             return True
         raise FilterFailure("Different URLs")
 
@@ -1373,7 +1409,7 @@ class StandardChecker(TranslationChecker):
         """
         str1 = self.config.lang.numbertranslate(str1)
 
-        if helpers.countsmatch(str1, str2, decoration.getnumbers(str1)):
+        if helpers.countsmatch(str1, str2, self.tokenizer.tokenize(str1).numbers):
             return True
         raise FilterFailure("Different numbers")
 
@@ -1670,8 +1706,11 @@ class StandardChecker(TranslationChecker):
         acronyms = []
         allowed = []
 
-        for startmatch, endmatch in self.config.varmatches:
-            allowed += decoration.getvariables(startmatch, endmatch)(str1)
+        decorations1 = self.tokenizer.tokenize(str1)
+        for index in range(len(self.tokenizer.varmatches)):
+            allowed += [
+                variable for varstart, variable in decorations1.variables(index)
+            ]
 
         allowed += self.config.musttranslatewords.keys()
         str1 = self.filteraccelerators(self.filtervariables(str1))
@@ -2464,15 +2503,11 @@ class MozillaChecker(StandardChecker):
         """
         # Mozilla's specific no-accelerators behavior.
         if self.config.language_script in self.accelerators_skipped_scripts:
-            str2 = self.filtervariables(str2)
+            decorations2 = self.tokenizer.tokenize(self.filtervariables(str2))
             messages = []
 
-            for accelmarker in self.config.accelmarkers:
-                counter2 = decoration.countaccelerators(
-                    accelmarker,
-                    self.config.lang.validaccel,
-                )
-                if counter2(str2)[0] > 0:
+            for index, accelmarker in enumerate(self.tokenizer.accelmarkers):
+                if decorations2.accelerators(index, self.config.lang.validaccel)[0]:
                     messages.append(
                         "Accelerator '%s' should not appear in "
                         "translation" % accelmarker
@@ -20,10 +20,16 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 
 from translate.lang import data
 
 
+CACHE_SIZE = 4096
+"""The number of strings for which a :class:`DecorationTokenizer` remembers
+the decorations."""
+
+
 def spacestart(str1):
     """returns all the whitespace from the start of the string"""
     newstring = ""
@@ -224,10 +230,15 @@ def getvariables(startmarker, endmarker):
     return getmarkedvariables
 
 
+_ascii_digit_re = re.compile("[0-9]")
+
+
 def getnumbers(str1):
     """returns any numbers that are in the string"""
     # TODO: handle locale-based periods e.g. 2,5 for Afrikaans
     assert isinstance(str1, str)
+    if str1.isascii() and not _ascii_digit_re.search(str1):
+        return []
     numbers = []
     innumber = False
     degreesign = "\xb0"
@@ -283,20 +294,28 @@ def getfunctions(str1):
         return []
 
 
+_email_re = re.compile(r"[\w\.\-]+@[\w\.\-]+")
+
+
 def getemails(str1):
     """returns the email addresses that are in a string"""
-    return re.findall(r"[\w\.\-]+@[\w\.\-]+", str1)
+    if "@" not in str1:
+        return []
+    return _email_re.findall(str1)
+
+
+_url_re = re.compile(
+    r"https?:[\w/\.:;+\-~\%#\$?=&,()]+|"
+    + r"www\.[\w/\.:;+\-~\%#\$?=&,()]+|"
+    + r"ftp:[\w/\.:;+\-~\%#?=&,]+"
+)
 
 
 def geturls(str1):
     """returns the URIs in a string"""
-    # TODO turn this into a verbose and compiled regex
-    URLPAT = (
-        r"https?:[\w/\.:;+\-~\%#\$?=&,()]+|"
-        + r"www\.[\w/\.:;+\-~\%#\$?=&,()]+|"
-        + r"ftp:[\w/\.:;+\-~\%#?=&,]+"
-    )
-    return re.findall(URLPAT, str1)
+    if ":" not in str1 and "www." not in str1:
+        return []
+    return _url_re.findall(str1)
 
 
 def countaccelerators(accelmarker, acceptlist=None):
@@ -310,3 +329,136 @@ def countaccelerators(accelmarker, acceptlist=None):
         return len(acclocs), len(badlocs)
 
     return countmarkedaccelerators
+
+
+class Decorations:
+    """The decorations of a string, as found by a :class:`DecorationTokenizer`.
+
+    Every kind of decoration is only extracted once, when it is first asked
+    for, and the variables and accelerators only when the string contains
+    their marker.  The results are tuples, as they are shared by everything
+    asking for the decorations of the same string.
+    """
+
+    __slots__ = ("tokenizer", "string", "markers", "_found")
+
+    def __init__(self, tokenizer, string, markers):
+        self.tokenizer = tokenizer
+        self.string = string
+        #: The accelerator and variable start markers occurring in the string
+        self.markers = markers
+        self._found = {}
+
+    def variables(self, index):
+        """Returns the locations and variables marked with the variable
+        markers at ``index`` in the :attr:`DecorationTokenizer.varmatches`,
+        like :func:`findmarkedvariables`.
+        """
+        if not self.markers:
+            return ()
+        varlocs = self._found.get(index)
+        if varlocs is None:
+            startmarker, endmarker = self.tokenizer.varmatches[index]
+            varlocs = ()
+            if startmarker in self.markers:
+                varlocs = tuple(
+                    findmarkedvariables(self.string, startmarker, endmarker)
+                )
+            self._found[index] = varlocs
+        return varlocs
+
+    def accelerators(self, index, acceptlist=None):
+        """Returns the locations and characters of the valid and of the
+        invalid accelerators marked with the accelerator marker at ``index``
+        in the :attr:`DecorationTokenizer.accelmarkers`, like
+        :func:`findaccelerators`.
+        """
+        if not self.markers:
+            return ((), ())
+        key = (index, acceptlist)
+        accelerators = self._found.get(key)
+        if accelerators is None:
+            accelmarker = self.tokenizer.accelmarkers[index]
+            accelerators = ((), ())
+            if accelmarker in self.markers:
+                acclocs, badlocs = findaccelerators(
+                    self.string, accelmarker, acceptlist
+                )
+                accelerators = (tuple(acclocs), tuple(badlocs))
+            self._found[key] = accelerators
+        return accelerators
+
+    def _get(self, func):
+        found = self._found.get(func)
+        if found is None:
+            found = self._found[func] = tuple(func(self.string))
+        return found
+
+    @property
+    def numbers(self):
+        """The numbers in the string, see :func:`getnumbers`."""
+        return self._get(getnumbers)
+
+    @property
+    def functions(self):
+        """The functions in the string, see :func:`getfunctions`."""
+        return self._get(getfunctions)
+
+    @property
+    def emails(self):
+        """The email addresses in the string, see :func:`getemails`."""
+        return self._get(getemails)
+
+    @property
+    def urls(self):
+        """The URLs in the string, see :func:`geturls`."""
+        return self._get(geturls)
+
+
+class DecorationTokenizer:
+    """Finds the decorations of strings for the accelerator markers and the
+    variable markers of a :class:`~translate.filters.checks.CheckerConfig`.
+
+    Tokenizing a string first finds which of the markers occur in it, and
+    the variables and accelerators are only searched for those markers.  The
+    :class:`Decorations` of the last :data:`CACHE_SIZE` strings are
+    remembered, so that the checks and the filters of a checker share them.
+    """
+
+    def __init__(self, accelmarkers=(), varmatches=()):
+        self.accelmarkers = tuple(accelmarkers)
+        self.varmatches = tuple(varmatches)
+        markers = [marker for marker in self.accelmarkers if marker is not None]
+        markers.extend(
+            startmarker for startmarker, _ in self.varmatches if startmarker is not None
+        )
+        #: The distinct markers looked for in every string
+        self.markers = tuple(dict.fromkeys(markers))
+        self.tokenize = lru_cache(maxsize=CACHE_SIZE)(self._tokenize)
+
+    def _tokenize(self, str1):
+        # Substring tests are much faster than a regular expression combining
+        # the few markers of a checker
+        return Decorations(
+            self, str1, frozenset(filter(str1.__contains__, self.markers))
+        )
+
+    def cache_clear(self):
+        self.tokenize.cache_clear()
+
+
+_tokenizers = {}
+
+
+def gettokenizer(config):
+    """Returns a :class:`DecorationTokenizer` for the accelerator markers and
+    the variable markers of a :class:`~translate.filters.checks.CheckerConfig`.
+
+    Checkers with the same markers share the tokenizer.
+    """
+    key = (tuple(config.accelmarkers), tuple(config.varmatches))
+    try:
+        return _tokenizers[key]
+    except KeyError:
+        tokenizer = _tokenizers[key] = DecorationTokenizer(*key)
+        return tokenizer
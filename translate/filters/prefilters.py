@@ -60,18 +60,24 @@ def filteraccelerators(accelmarker):
 
     :param string accelmarker: Accelerator marker character
     :rtype: Function
-    :return: fn(str1, acceplist=None)
+    :return: fn(str1, acceplist=None, acclocs=None)
     """
     if accelmarker is None:
         accelmarkerlen = 0
     else:
         accelmarkerlen = len(accelmarker)
 
-    def filtermarkedaccelerators(str1, acceptlist=None):
+    def filtermarkedaccelerators(str1, acceptlist=None, acclocs=None):
         """Modifies the accelerators in *str1* marked with the given
         *accelmarker*, using a given *acceptlist* filter.
+
+        The accelerators are only searched for when their locations are not
+        given in *acclocs*.
         """
-        acclocs, badlocs = decoration.findaccelerators(str1, accelmarker, acceptlist)
+        if acclocs is None:
+            acclocs, badlocs = decoration.findaccelerators(
+                str1, accelmarker, acceptlist
+            )
         fstr1, pos = "", 0
         for accelstart, accelerator in acclocs:
             fstr1 += str1[pos:accelstart]
@@ -123,7 +129,7 @@ def filtervariables(startmarker, endmarker, varfilter):
     :param string endmarker: End of variable marker
     :param Function varfilter: fn(variable, startmarker, endmarker)
     :rtype: Function
-    :return: fn(str1)
+    :return: fn(str1, varlocs=None)
     """
     if startmarker is None:
         startmarkerlen = 0
@@ -136,11 +142,15 @@ def filtervariables(startmarker, endmarker, varfilter):
     else:
         endmarkerlen = len(endmarker)
 
-    def filtermarkedvariables(str1):
+    def filtermarkedvariables(str1, varlocs=None):
         r"""Modifies the variables in *str1* marked with a given *\*marker*,
         using a given filter.
+
+        The variables are only searched for when their locations are not
+        given in *varlocs*.
         """
-        varlocs = decoration.findmarkedvariables(str1, startmarker, endmarker)
+        if varlocs is None:
+            varlocs = decoration.findmarkedvariables(str1, startmarker, endmarker)
         fstr1, pos = "", 0
         for varstart, variable in varlocs:
             fstr1 += str1[pos:varstart]
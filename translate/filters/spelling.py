@@ -25,48 +25,62 @@ from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-available = False
-
-try:
-    # Enchant
-    from enchant import Error as EnchantError, checker
-
-    available = True
-    checkers = {}
-
-    def _get_checker(lang):
-        if lang not in checkers:
-            try:
-                checkers[lang] = checker.SpellChecker(lang)
-                # some versions only report an error when checking something
-                checkers[lang].check("bla")
-            except EnchantError as e:
-                # sometimes this is raised instead of DictNotFoundError
-                logger.error("Dictionary not found: %s", e)
-                checkers[lang] = None
-
-        return checkers[lang]
-
-    def check(text, lang):
-        spellchecker = _get_checker(lang)
-        if not spellchecker:
-            return
-        spellchecker.set_text(str(text))
-        for err in spellchecker:
-            yield err.word, err.wordpos, err.suggest()
-
-    @lru_cache(maxsize=1024)
-    def simple_check(text, lang):
-        spellchecker = _get_checker(lang)
-        if not spellchecker:
-            return []
-        spellchecker.set_text(str(text))
-        return [err.word for err in spellchecker]
-
-except ImportError:
-
-    def check(text, lang):
+checkers = {}
+
+
+@lru_cache(maxsize=None)
+def _get_enchant():
+    """Import Enchant on first use, it takes long to load."""
+    try:
+        import enchant
+        from enchant import checker  # noqa: F401
+    except ImportError:
+        return None
+    return enchant
+
+
+def __getattr__(name):
+    if name == "available":
+        return _get_enchant() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_checker(lang):
+    if lang not in checkers:
+        enchant = _get_enchant()
+        try:
+            checkers[lang] = enchant.checker.SpellChecker(lang)
+            # some versions only report an error when checking something
+            checkers[lang].check("bla")
+        except enchant.Error as e:
+            # sometimes this is raised instead of DictNotFoundError
+            logger.error("Dictionary not found: %s", e)
+            checkers[lang] = None
+
+    return checkers[lang]
+
+
+def _check(text, lang):
+    spellchecker = _get_checker(lang)
+    if not spellchecker:
+        return
+    spellchecker.set_text(str(text))
+    for err in spellchecker:
+        yield err.word, err.wordpos, err.suggest()
+
+
+def check(text, lang):
+    if _get_enchant() is None:
         return []
+    return _check(text, lang)
+
 
-    def simple_check(text, lang):
+@lru_cache(maxsize=1024)
+def simple_check(text, lang):
+    if _get_enchant() is None:
+        return []
+    spellchecker = _get_checker(lang)
+    if not spellchecker:
         return []
+    spellchecker.set_text(str(text))
+    return [err.word for err in spellchecker]
@@ -104,6 +104,9 @@ def test_accelerator_markers():
     assert gnomechecker.config.accelmarkers == ["_"]
     kdechecker = checks.KdeChecker()
     assert kdechecker.config.accelmarkers == ["&"]
+    # checkers with the same markers share the tokenizer finding them
+    assert kdechecker.tokenizer is checks.KdeChecker().tokenizer
+    assert kdechecker.tokenizer is not mozillachecker.tokenizer
 
 
 def test_messages():
@@ -97,3 +97,42 @@ def test_getfunctions():
         "function()",
         "other()",
     ]
+
+
+def test_tokenizer():
+    """test that the tokenizer finds the same decorations as the functions"""
+    accelmarkers = ["&", "~"]
+    varmatches = [("&", ";"), ("%", 1), ("$(", ")"), ("$", None)]
+    tokenizer = decoration.DecorationTokenizer(accelmarkers, varmatches)
+    for string in (
+        "",
+        "No decorations",
+        "&Open %s in $(HOME) at 1.5 or ~Save &amp; $user",
+        "Mail me@example.com or see http://example.com and www.example.org",
+        "Call getfunction() 2 times&",
+    ):
+        decorations = tokenizer.tokenize(string)
+        for index, (startmarker, endmarker) in enumerate(varmatches):
+            assert decorations.variables(index) == tuple(
+                decoration.findmarkedvariables(string, startmarker, endmarker)
+            )
+        for index, accelmarker in enumerate(accelmarkers):
+            for acceptlist in (None, "abc"):
+                acclocs, badlocs = decoration.findaccelerators(
+                    string, accelmarker, acceptlist
+                )
+                assert decorations.accelerators(index, acceptlist) == (
+                    tuple(acclocs),
+                    tuple(badlocs),
+                )
+        assert decorations.numbers == tuple(decoration.getnumbers(string))
+        assert decorations.functions == tuple(decoration.getfunctions(string))
+        assert decorations.emails == tuple(decoration.getemails(string))
+        assert decorations.urls == tuple(decoration.geturls(string))
+        assert tokenizer.tokenize(string) is decorations
+
+    decorations = tokenizer.tokenize("Only ~Save")
+    assert decorations.markers == {"~"}
+    assert decorations.variables(0) == ()
+    tokenizer.cache_clear()
+    assert tokenizer.tokenize("Only ~Save") is not decorations
@@ -25,3 +25,13 @@ def test_filterwordswithpunctuation():
     string = "Iṱ'š"
     filtered = prefilters.filterwordswithpunctuation(string)
     assert filtered == "Iṱš"
+
+
+def test_filtervariables():
+    removevariables = prefilters.filtervariables("$(", ")", prefilters.varnone)
+    assert removevariables("Open $(FILE) now") == "Open  now"
+    # the variable locations found by a tokenizer can be passed
+    assert removevariables("Open $(FILE) now", [(5, "FILE")]) == "Open  now"
+    filteraccelerators = prefilters.filteraccelerators("&")
+    assert filteraccelerators("&Open") == "Open"
+    assert filteraccelerators("&Open", None, [(0, "O")]) == "Open"
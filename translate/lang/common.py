@@ -61,12 +61,107 @@ TODOs and Ideas for possible features:
 
 import logging
 import re
+from functools import lru_cache
 
 from translate.lang import data
 
 
 logger = logging.getLogger(__name__)
 
+CACHE_SIZE = 4096
+"""The number of texts for which a :class:`Segmenter` remembers the
+sentences and the words."""
+
+
+class Segmenter:
+    """Splits text in sentences and words like :meth:`Common.sentence_iter`
+    and :meth:`Common.word_iter` do for a language.
+
+    The words are found with a single regular expression instead of
+    splitting the text and stripping every word. Sentences are found by
+    searching the end of every sentence, which is the ``sentencere`` of
+    the language without its leading ``.*?``, so that a text without a
+    sentence end is only scanned once. The results for the last
+    :data:`CACHE_SIZE` texts are remembered.
+    """
+
+    def __init__(self, punctuation, sentencere):
+        # Whitespace is never part of a word, stripping it has no effect
+        punctuation = "".join(
+            re.escape(c) for c in sorted(set(punctuation)) if not c.isspace()
+        )
+        if punctuation:
+            strip = f"[{punctuation}]*"
+            word = rf"[^\s{punctuation}](?:\S*[^\s{punctuation}])?"
+            self.wordre = re.compile(rf"(?<!\S){strip}({word}){strip}(?!\S)")
+        else:
+            self.wordre = re.compile(r"\S+")
+        self.sentencere = sentencere
+        self.sentenceendre = None
+        if sentencere.flags & re.DOTALL and ".*?" in sentencere.pattern:
+            self.sentenceendre = re.compile(
+                sentencere.pattern.replace(".*?", "", 1), sentencere.flags
+            )
+        self._cached_words = lru_cache(maxsize=CACHE_SIZE)(self._words)
+        self._cached_sentences = lru_cache(maxsize=CACHE_SIZE)(self._sentences)
+
+    def _words(self, text):
+        return tuple(self.wordre.findall(text))
+
+    def _sentences(self, text, strip=True):
+        text = text or ""
+        sentences = []
+        end = 0
+        if self.sentenceendre is None:
+            for item in self.sentencere.finditer(text):
+                sentences.append(item.group())
+                end = item.end()
+        else:
+            search = self.sentenceendre.search
+            item = search(text)
+            while item is not None:
+                sentences.append(text[end : item.end()])
+                end = item.end()
+                item = search(text, end)
+        sentences.append(text[end:])
+        if strip:
+            sentences = [sentence.strip() for sentence in sentences]
+        return tuple(sentence for sentence in sentences if sentence)
+
+    def words(self, text):
+        """Return a tuple of the words in ``text``."""
+        try:
+            return self._cached_words(text)
+        except TypeError:
+            # Not hashable
+            return self._words(text)
+
+    def sentences(self, text, strip=True):
+        """Return a tuple of the sentences in ``text``."""
+        try:
+            return self._cached_sentences(text, strip)
+        except TypeError:
+            return self._sentences(text, strip)
+
+    def cache_clear(self):
+        self._cached_words.cache_clear()
+        self._cached_sentences.cache_clear()
+
+
+_segmenters = {}
+
+
+def get_segmenter(punctuation, sentencere):
+    """Return the :class:`Segmenter` for the given punctuation and sentence
+    regular expression, which is shared by the languages using them.
+    """
+    key = (punctuation, sentencere)
+    try:
+        return _segmenters[key]
+    except KeyError:
+        segmenter = _segmenters[key] = Segmenter(punctuation, sentencere)
+        return segmenter
+
 
 class Common:
     """This class is the common parent class for all language classes."""
@@ -358,43 +453,41 @@ class Common:
         """Returns a list of characters in text."""
         return list(cls.character_iter(text))
 
+    @classmethod
+    def segmenter(cls):
+        """Returns the :class:`Segmenter` of this language."""
+        return get_segmenter(cls.punctuation, cls.sentencere)
+
     @classmethod
     def word_iter(cls, text):
         """Returns an iterator over the words in text."""
-        # TODO: Consider replacing puctuation with space before split()
-        for w in text.split():
-            word = w.strip(cls.punctuation)
-            if word:
-                yield word
+        return iter(cls.segmenter().words(text))
 
     @classmethod
     def words(cls, text):
         """Returns a list of words in text."""
         return list(cls.word_iter(text))
 
+    @classmethod
+    def words_many(cls, texts):
+        """Returns a list of the lists of words in each of the texts."""
+        return [cls.words(text) for text in texts]
+
     @classmethod
     def sentence_iter(cls, text, strip=True):
         """Returns an iterator over the sentences in text."""
-        lastmatch = 0
-        text = text or ""
-        for item in cls.sentencere.finditer(text):
-            lastmatch = item.end()
-            sentence = item.group()
-            if strip:
-                sentence = sentence.strip()
-            if sentence:
-                yield sentence
-        remainder = text[lastmatch:]
-        if strip:
-            remainder = remainder.strip()
-        if remainder:
-            yield remainder
+        return iter(cls.segmenter().sentences(text, strip))
 
     @classmethod
     def sentences(cls, text, strip=True):
         """Returns a list of sentences in text."""
         return list(cls.sentence_iter(text, strip=strip))
 
+    @classmethod
+    def sentences_many(cls, texts, strip=True):
+        """Returns a list of the lists of sentences in each of the texts."""
+        return [cls.sentences(text, strip=strip) for text in texts]
+
     @classmethod
     def capsstart(cls, text):
         """Determines whether the text starts with a capital letter."""
@@ -24,12 +24,23 @@ import locale
 import os
 import re
 import unicodedata
+from functools import lru_cache
 
 
-try:
-    import pycountry
-except ImportError:
-    pycountry = None
+@lru_cache(maxsize=None)
+def _get_pycountry():
+    """Import pycountry on first use, it takes long to load."""
+    try:
+        import pycountry
+    except ImportError:
+        return None
+    return pycountry
+
+
+def __getattr__(name):
+    if name == "pycountry":
+        return _get_pycountry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 languages = {
@@ -650,6 +661,7 @@ def languagematch(languagecode, otherlanguagecode):
 def get_country_iso_name(country_code):
     """Return country ISO name."""
     country_code = country_code.upper()
+    pycountry = _get_pycountry()
     try:
         if len(country_code) == 2:
             country = pycountry.countries.get(alpha_2=country_code)
@@ -664,6 +676,7 @@ def get_country_iso_name(country_code):
 
 def get_language_iso_name(language_code):
     """Return language ISO name."""
+    pycountry = _get_pycountry()
     try:
         if len(language_code) == 2:
             language = pycountry.languages.get(alpha_2=language_code)
@@ -760,6 +773,7 @@ def gettext_lang(langcode=None):
     """Returns a gettext function to translate language names into the given
     language, or the system language if no language is specified.
     """
+    pycountry = _get_pycountry()
     if pycountry is None:
         return gettext_domain(langcode, "iso_639")
     return gettext_domain(langcode, "iso639-3", pycountry.LOCALES_DIR)
@@ -769,6 +783,7 @@ def gettext_country(langcode=None):
     """Returns a gettext function to translate country names into the given
     language, or the system language if no language is specified.
     """
+    pycountry = _get_pycountry()
     if pycountry is None:
         return gettext_domain(langcode, "iso_3166")
     return gettext_domain(langcode, "iso3166", pycountry.LOCALES_DIR)
@@ -792,7 +807,9 @@ def normalize_code(code):
     return code.replace("_", "-").replace("@", "-").lower()
 
 
-__normalised_languages = {normalize_code(key) for key in languages}
+@lru_cache(maxsize=None)
+def _get_normalised_languages():
+    return frozenset(normalize_code(key) for key in languages)
 
 
 def simplify_to_common(language_code):
@@ -804,7 +821,7 @@ def simplify_to_common(language_code):
     if simpler == "":
         return language_code
 
-    if normalize_code(language_code) in __normalised_languages:
+    if normalize_code(language_code) in _get_normalised_languages():
         return language_code
 
     return simplify_to_common(simpler)
@@ -86,6 +86,23 @@ class LanguageIdentifier:
             result = self._lang_codes[result]
         return result
 
+    def identify_many(self, texts):
+        """Identify the language of each of the given strings.
+
+        :returns: A list of the identified language codes, with ``None`` for
+            the empty strings.
+        """
+        texts = list(texts)
+        results = iter(self.ngram.classify_many(text for text in texts if text))
+        identified = []
+        for text in texts:
+            if not text:
+                identified.append(None)
+                continue
+            result = next(results)
+            identified.append(self._lang_codes.get(result, result))
+        return identified
+
     def identify_source_lang(self, instore):
         """Identify the source language of the given translation store or
         units.
@@ -27,12 +27,25 @@
 import glob
 import re
 import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import repeat
 from os import path
 
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
 nb_ngrams = 400
 white_space_re = re.compile(r"\s+")
 
+BATCH_SIZE = 256
+"""The number of texts compared with the language models at once by
+:meth:`NGram.classify_many`."""
+
 
 class _NGram:
     def __init__(self, arg=None):
@@ -46,38 +59,23 @@ class _NGram:
             self.ngrams = {}
 
     def addText(self, text):
-        ngrams = {}
-
-        for word in white_space_re.split(text):
-            word = "_%s_" % word
-            size = len(word)
-            for i in range(size - 1):
-                for s in (1, 2, 3, 4):
-                    end = i + s
-                    if end >= size:
-                        break
-                    sub = word[i:end]
-
-                    if sub not in ngrams:
-                        ngrams[sub] = 0
-                    ngrams[sub] += 1
-
-        self.ngrams = ngrams
+        words = ["_%s_" % word for word in white_space_re.split(text)]
+        # The n-grams do not include the last character of the words
+        self.ngrams = Counter(
+            [
+                word[i : i + s]
+                for word in words
+                for s in (1, 2, 3, 4)
+                for i in range(len(word) - s)
+            ]
+        )
         return self
 
     def sorted_by_score(self):
-        sorted = [(self.ngrams[k], k) for k in self.ngrams]
-        sorted.sort()
-        sorted.reverse()
-        sorted = sorted[:nb_ngrams]
-        return sorted
+        return sorted(zip(self.ngrams.values(), self.ngrams), reverse=True)[:nb_ngrams]
 
     def normalise(self):
-        ngrams = {}
-        for count, (v, k) in enumerate(self.sorted_by_score()):
-            ngrams[k] = count
-
-        self.ngrams = ngrams
+        self.ngrams = {k: count for count, (v, k) in enumerate(self.sorted_by_score())}
         return self
 
     def addValues(self, key, value):
@@ -95,44 +93,165 @@ class _NGram:
         return d
 
 
+@lru_cache(maxsize=None)
+def load_models(folder, ext=".lm"):
+    """Load the language models in ``folder``.
+
+    The models are only read once, the returned dictionary should not be
+    modified.
+    """
+    models = {}
+    folder = path.join(folder, "*" + ext)
+    size = len(ext)
+
+    for fname in glob.glob(path.normcase(folder)):
+        lang = path.split(fname)[-1][:-size]
+        ngrams = {}
+        try:
+            with open(fname, encoding="utf-8") as fp:
+                for i, line in enumerate(fp):
+                    ngram, _t, _f = line.partition("\t")
+                    ngrams[ngram] = i
+        except UnicodeDecodeError:
+            continue
+
+        if ngrams:
+            models[lang] = _NGram(ngrams)
+    return models
+
+
+class _ModelTable:
+    """The language models of :class:`NGram` indexed by n-gram.
+
+    Every language model is compared with a text by summing the rank
+    differences of its n-grams, and :data:`nb_ngrams` for the n-grams missing
+    in the text. The distances start at the value for a text without any of
+    the n-grams and are corrected for the n-grams the text has, so that only
+    the n-grams present in both are visited.
+
+    With NumPy the index is also stored in arrays, in which the models of
+    each n-gram are found between ``offsets[i]`` and ``offsets[i + 1]``,
+    and several texts are compared with all the models at once.
+    """
+
+    def __init__(self, models):
+        self.models = list(models.items())
+        self.langs = list(models)
+        self.postings = {}
+        for row, lang in enumerate(self.langs):
+            for ngram, rank in models[lang].ngrams.items():
+                self.postings.setdefault(ngram, []).append((row, rank))
+        self.base = [len(models[lang].ngrams) * nb_ngrams for lang in self.langs]
+        if numpy is None:
+            return
+
+        self.vocabulary = {ngram: i for i, ngram in enumerate(self.postings)}
+        self.offsets = numpy.zeros(len(self.postings) + 1, dtype=numpy.intp)
+        numpy.cumsum(
+            [len(postings) for postings in self.postings.values()],
+            out=self.offsets[1:],
+        )
+        self.rows = numpy.array(
+            [row for postings in self.postings.values() for row, rank in postings],
+            dtype=numpy.intp,
+        )
+        self.ranks = numpy.array(
+            [rank for postings in self.postings.values() for row, rank in postings],
+            dtype=numpy.int64,
+        )
+
+    def distances(self, ngram):
+        """Return the distances of the models to one text, in model order."""
+        distances = list(self.base)
+        for k, rank in ngram.ngrams.items():
+            for row, model_rank in self.postings.get(k, ()):
+                distances[row] += abs(rank - model_rank) - nb_ngrams
+        return distances
+
+    def distance_matrix(self, ngrams):
+        """Return the distances of the models to several texts, with one row
+        per text.
+        """
+        texts = []
+        indexes = []
+        ranks = []
+        for text, ngram in enumerate(ngrams):
+            texts.append(numpy.full(len(ngram.ngrams), text, dtype=numpy.intp))
+            indexes.extend(map(self.vocabulary.get, ngram.ngrams, repeat(-1)))
+            ranks.extend(ngram.ngrams.values())
+        texts = numpy.concatenate(texts) if texts else numpy.zeros(0, numpy.intp)
+        indexes = numpy.array(indexes, dtype=numpy.intp)
+        ranks = numpy.array(ranks, dtype=numpy.int64)
+        # Skip the n-grams that are in none of the models
+        known = indexes >= 0
+        texts = texts[known]
+        indexes = indexes[known]
+        ranks = ranks[known]
+        starts = self.offsets[indexes]
+        counts = self.offsets[indexes + 1] - starts
+        # The positions of the models of every n-gram of the texts
+        firsts = numpy.cumsum(counts) - counts
+        positions = numpy.arange(counts.sum()) + numpy.repeat(starts - firsts, counts)
+        corrections = (
+            numpy.abs(numpy.repeat(ranks, counts) - self.ranks[positions]) - nb_ngrams
+        )
+        cells = numpy.repeat(texts, counts) * len(self.langs) + self.rows[positions]
+        sums = numpy.bincount(
+            cells, weights=corrections, minlength=len(ngrams) * len(self.langs)
+        )
+        return numpy.array(self.base) + sums.astype(numpy.int64).reshape(
+            len(ngrams), len(self.langs)
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_table(folder, ext):
+    return _ModelTable(load_models(folder, ext))
+
+
 class NGram:
     def __init__(self, folder, ext=".lm"):
-        self.ngrams = {}
-        folder = path.join(folder, "*" + ext)
-        size = len(ext)
-
-        for fname in glob.glob(path.normcase(folder)):
-            lang = path.split(fname)[-1][:-size]
-            ngrams = {}
-            try:
-                with open(fname, encoding="utf-8") as fp:
-                    for i, line in enumerate(fp):
-                        ngram, _t, _f = line.partition("\t")
-                        ngrams[ngram] = i
-            except UnicodeDecodeError:
-                continue
-
-            if ngrams:
-                self.ngrams[lang] = _NGram(ngrams)
+        folder = path.abspath(folder)
+        self.ngrams = dict(load_models(folder, ext))
 
         if not self.ngrams:
             raise ValueError("no language files found")
+        self._table = _load_table(folder, ext)
 
-    def classify(self, text):
-        ngram = _NGram(text)
-        r = "guess"
+    def _get_table(self):
+        # The models could have been changed
+        if self._table.models != list(self.ngrams.items()):
+            self._table = _ModelTable(self.ngrams)
+        return self._table
 
-        min = sys.maxsize
+    @staticmethod
+    def _result(lang, distance):
+        if distance > 0.8 * (nb_ngrams**2):
+            return ""
+        return lang
 
-        for lang in self.ngrams:
-            d = self.ngrams[lang].compare(ngram)
-            if d < min:
-                min = d
-                r = lang
-
-        if min > 0.8 * (nb_ngrams**2):
-            r = ""
-        return r
+    def classify(self, text):
+        table = self._get_table()
+        distances = table.distances(_NGram(text))
+        # The first language with the smallest distance
+        best = min(range(len(distances)), key=distances.__getitem__)
+        return self._result(table.langs[best], distances[best])
+
+    def classify_many(self, texts):
+        """Classify several texts, which is faster than calling
+        :meth:`classify` for each of them when NumPy is available.
+        """
+        if numpy is None:
+            return [self.classify(text) for text in texts]
+        table = self._get_table()
+        results = []
+        texts = list(texts)
+        for start in range(0, len(texts), BATCH_SIZE):
+            ngrams = [_NGram(text) for text in texts[start : start + BATCH_SIZE]]
+            distances = table.distance_matrix(ngrams)
+            for row, best in enumerate(distances.argmin(axis=1)):
+                results.append(self._result(table.langs[best], distances[row, best]))
+        return results
 
 
 class Generate:
@@ -87,6 +87,26 @@ def test_sentences():
     assert sentences == ["Doen dit d.m.v. koeie."]
 
 
+def test_segment_many():
+    """Tests the segmentation of several texts at once."""
+    language = common.Common
+    texts = ["", "test sentence.", "One. Two?  three. Four", "… ! ."]
+    assert language.words_many(texts) == [language.words(text) for text in texts]
+    assert language.sentences_many(texts) == [
+        language.sentences(text) for text in texts
+    ]
+    assert language.sentences_many(texts, strip=False) == [
+        [],
+        ["test sentence."],
+        ["One. ", "Two? ", " three. ", "Four"],
+        ["… ", "! ", "."],
+    ]
+
+    # A long text without any sentence end is scanned once
+    text = "word " * 100000
+    assert language.sentences(text) == [text.strip()]
+
+
 def test_capsstart():
     """Tests for basic sane behaviour in startcaps()."""
     language = common.Common
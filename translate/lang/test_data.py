@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 from translate.lang import data
 
 
@@ -97,3 +101,21 @@ def test_language_iso_name():
     # Use common name if available
     assert data.get_language_iso_name("bn") == "Bangla"
     assert data.get_language_iso_name("bn") != "Bengali"
+
+
+def test_lazy_imports():
+    """pycountry and Enchant are only imported when they are used"""
+    code = (
+        "import sys, translate.filters.checks; "
+        "print('pycountry' in sys.modules, 'enchant' in sys.modules)"
+    )
+    # The directory that contains the translate package
+    root = os.path.dirname(os.path.dirname(os.path.dirname(data.__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.split() == ["False", "False"]
@@ -174,6 +174,13 @@ class TestLanguageIdentifier:
             unit.target = TEXT_LIST[i]
         assert self.langident.identify_target_lang(langlist) == "de"
 
+    def test_identify_many(self):
+        texts = ["", TEXT] + TEXT_LIST + ["Hello world", " "]
+        assert self.langident.identify_many(texts) == [
+            self.langident.identify_lang(text) for text in texts
+        ]
+        assert self.langident.identify_many([]) == []
+
     @staticmethod
     def test_bad_init_data():
         """Test __init__ with bad conf files and data dirs"""
@@ -0,0 +1,242 @@
+#
+# Copyright 2023 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Lightweight timers and counters for the hot paths of the toolkit.
+
+Instrumentation is disabled by default, in which case :func:`timer` returns
+a shared no-op context manager and :func:`count` returns immediately.  It is
+enabled by the ``--profile-report`` option of the command line tools or by
+calling :func:`enable`::
+
+    from translate.misc import instrumentation
+
+    instrumentation.enable()
+    with instrumentation.timer("my.operation"):
+        ...
+    instrumentation.count("my.items", 10)
+    print(instrumentation.format_report())
+
+Nested timers with the same name (for example a store ``parse`` calling the
+``parse`` of its parent class) are only measured once.
+"""
+
+import atexit
+import functools
+import json
+import sys
+import time
+
+
+enabled = False
+"""Whether timers and counters are recorded."""
+
+_timers = {}
+_counters = {}
+_active = set()
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if self.name not in _active:
+            _active.add(self.name)
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start is not None:
+            record(self.name, time.perf_counter() - self.start)
+            _active.discard(self.name)
+        return False
+
+
+def enable():
+    """Start recording timers and counters."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop recording timers and counters."""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Forget all recorded timers and counters."""
+    _timers.clear()
+    _counters.clear()
+    _active.clear()
+
+
+def timer(name):
+    """Return a context manager measuring the time spent in its block."""
+    if not enabled:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def record(name, elapsed):
+    """Add a call taking ``elapsed`` seconds to the timer ``name``."""
+    stats = _timers.get(name)
+    if stats is None:
+        _timers[name] = [1, elapsed]
+    else:
+        stats[0] += 1
+        stats[1] += elapsed
+
+
+def count(name, value=1):
+    """Increment the counter ``name`` by ``value``."""
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def instrumented(name):
+    """Decorator measuring all calls of a function with the timer ``name``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrumented_method(func, prefix):
+    """Wrap the method ``func`` to be measured with a timer named after the
+    prefix and the class of the instance it is called on.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not enabled:
+            return func(self, *args, **kwargs)
+        with _Timer(f"{prefix}.{self.__class__.__name__}"):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def snapshot():
+    """Return the recorded timers and counters in a picklable form, to be
+    added to those of another process with :func:`merge`.
+    """
+    return (
+        {name: tuple(stats) for name, stats in _timers.items()},
+        dict(_counters),
+    )
+
+
+def merge(stats):
+    """Add the timers and counters returned by :func:`snapshot`."""
+    timers, counters = stats
+    for name, (calls, total) in timers.items():
+        current = _timers.setdefault(name, [0, 0.0])
+        current[0] += calls
+        current[1] += total
+    for name, value in counters.items():
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def get_report():
+    """Return the recorded timers and counters as a dictionary."""
+    return {
+        "timers": {
+            name: {"calls": calls, "total": total, "mean": total / calls}
+            for name, (calls, total) in sorted(
+                _timers.items(), key=lambda item: item[1][1], reverse=True
+            )
+        },
+        "counters": dict(sorted(_counters.items())),
+    }
+
+
+def format_report(report=None):
+    """Format the report as a human readable table."""
+    if report is None:
+        report = get_report()
+    lines = []
+    if report["timers"]:
+        width = max(len(name) for name in report["timers"])
+        lines.append(
+            "{:{width}}  {:>9}  {:>11}  {:>11}".format(
+                "timer", "calls", "total (s)", "mean (ms)", width=width
+            )
+        )
+        for name, stats in report["timers"].items():
+            lines.append(
+                "{:{width}}  {:9d}  {:11.4f}  {:11.4f}".format(
+                    name,
+                    stats["calls"],
+                    stats["total"],
+                    stats["mean"] * 1000,
+                    width=width,
+                )
+            )
+    if report["counters"]:
+        width = max(len(name) for name in report["counters"])
+        if lines:
+            lines.append("")
+        lines.append("{:{width}}  {:>9}".format("counter", "value", width=width))
+        for name, value in report["counters"].items():
+            lines.append("{:{width}}  {:9d}".format(name, value, width=width))
+    return "\n".join(lines)
+
+
+def write_report(output_format="text", out=None):
+    """Write the report in ``text`` or ``json`` format (to stderr by default)."""
+    if out is None:
+        out = sys.stderr
+    report = get_report()
+    if output_format == "json":
+        json.dump(report, out, indent=2)
+        out.write("\n")
+    else:
+        out.write(format_report(report) + "\n")
+
+
+def report_at_exit(output_format="text"):
+    """Enable instrumentation and write the report when the program exits."""
+    enable()
+    atexit.register(write_report, output_format)
+
+
+REPORT_FORMATS = ["text", "json"]
+"""Formats accepted by the ``--profile-report`` option."""
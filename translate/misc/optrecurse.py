@@ -17,6 +17,7 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 import fnmatch
+import functools
 import logging
 import optparse
 import os.path
@@ -26,7 +27,7 @@ import traceback
 from io import BytesIO
 
 from translate import __version__
-from translate.misc import progressbar
+from translate.misc import instrumentation, parallel, progressbar
 
 
 class ProgressBar:
@@ -132,6 +133,7 @@ class RecursiveOptionParser(optparse.OptionParser):
         self.setmanpageoption()
         self.setprogressoptions()
         self.seterrorleveloptions()
+        self.setprofileoptions()
         self.setformats(formats, usetemplates)
         self.passthrough = []
         self.allowmissingtemplate = allowmissingtemplate
@@ -390,6 +392,41 @@ class RecursiveOptionParser(optparse.OptionParser):
         )
         self.define_option(errorleveloption)
 
+    def setprofileoptions(self):
+        """Sets the option reporting timings of the processing."""
+        profileoption = optparse.Option(
+            None,
+            "--profile-report",
+            dest="profile_report",
+            default=None,
+            type="choice",
+            choices=instrumentation.REPORT_FORMATS,
+            action="callback",
+            callback=self._enable_profile_report,
+            metavar="FORMAT",
+            help="report timings and counters of the processing on stderr as: %s"
+            % (", ".join(instrumentation.REPORT_FORMATS)),
+        )
+        self.define_option(profileoption)
+
+    def setjobsoptions(self):
+        """Sets the option processing several files in parallel."""
+        jobsoption = optparse.Option(
+            None,
+            "--jobs",
+            dest="jobs",
+            default=1,
+            type="int",
+            metavar="JOBS",
+            help="process JOBS files in parallel, 0 for one per CPU (default: 1)",
+        )
+        self.define_option(jobsoption)
+
+    @staticmethod
+    def _enable_profile_report(option, opt_str, value, parser):
+        setattr(parser.values, option.dest, value)
+        instrumentation.report_at_exit(value)
+
     @staticmethod
     def getformathelp(formats):
         """Make a nice help string for describing formats..."""
@@ -575,6 +612,7 @@ class RecursiveOptionParser(optparse.OptionParser):
         # this makes for more merge-friendly content in single-output-file mode.
         inputfiles.sort()
         progress_bar = ProgressBar(options.progress, inputfiles)
+        jobs = []
         for inputpath in inputfiles:
             try:
                 templatepath = self.gettemplatename(options, inputpath)
@@ -603,23 +641,60 @@ class RecursiveOptionParser(optparse.OptionParser):
                     "Couldn't handle input file %s" % inputpath, options, sys.exc_info()
                 )
                 continue
-            try:
-                success = self.processfile(
+            jobs.append(
+                (
+                    inputpath,
                     fileprocessor,
-                    options,
                     fullinputpath,
                     fulloutputpath,
                     fulltemplatepath,
                 )
-            except Exception:
-                self.warning(
-                    "Error processing: input %s, output %s, template %s"
-                    % (fullinputpath, fulloutputpath, fulltemplatepath),
+            )
+        for inputpath, success in self.processjobs(options, jobs):
+            progress_bar.report_progress(inputpath, success)
+
+    @staticmethod
+    def getjobcount(options, count):
+        """Returns the number of processes to use for ``count`` files."""
+        return parallel.getjobcount(getattr(options, "jobs", 1), count)
+
+    def processjobs(self, options, jobs):
+        """Process the files prepared by :meth:`recursiveprocess`.
+
+        With ``--jobs`` the files are processed by a pool of worker
+        processes, see :func:`translate.misc.parallel.imap`.  Yields the
+        input path and success of every file, in the order of ``jobs``.
+        """
+        results = parallel.imap(
+            functools.partial(self.processjob, options),
+            jobs,
+            getattr(options, "jobs", 1),
+        )
+        yield from zip((job[0] for job in jobs), results)
+
+    def processjob(self, options, job):
+        """Process one file prepared by :meth:`recursiveprocess`.
+
+        :return: Whether the file was processed successfully.
+        """
+        _inputpath, fileprocessor, fullinputpath, fulloutputpath, fulltemplatepath = job
+        try:
+            with instrumentation.timer("optrecurse.processfile"):
+                return self.processfile(
+                    fileprocessor,
                     options,
-                    sys.exc_info(),
+                    fullinputpath,
+                    fulloutputpath,
+                    fulltemplatepath,
                 )
-                success = False
-            progress_bar.report_progress(inputpath, success)
+        except Exception:
+            self.warning(
+                "Error processing: input %s, output %s, template %s"
+                % (fullinputpath, fulloutputpath, fulltemplatepath),
+                options,
+                sys.exc_info(),
+            )
+            return False
 
     def ensurerecursiveoutputdirexists(self, options):
         if not self.isrecursive(options.output, "output"):
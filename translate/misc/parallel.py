@@ -0,0 +1,110 @@
+#
+# Copyright 2023 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Ordered maps over a pool of forked worker processes.
+
+The workers are forked, so they inherit the function and the items to
+process instead of receiving them pickled, and anything can be mapped: bound
+methods, closures, or parsed documents.  Only the results (and the items of
+iterables which are not sequences) are pickled.  Where processes can't be
+forked, or inside a worker process, the items are processed sequentially.
+
+The timers and counters recorded by the workers for ``--profile-report`` (see
+:mod:`translate.misc.instrumentation`) are added to those of this process.
+"""
+
+import collections.abc
+import multiprocessing
+import os
+
+from translate.misc import instrumentation
+
+
+# The function and items of a parallel map, inherited by the forked worker
+# processes
+_parallel_map = None
+
+
+def _run(item, indexed):
+    function, items = _parallel_map
+    if indexed:
+        item = items[item]
+    if not instrumentation.enabled:
+        return function(item), None
+    # Only report what was recorded for this item
+    instrumentation.reset()
+    result = function(item)
+    return result, instrumentation.snapshot()
+
+
+def _result(async_result):
+    result, stats = async_result.get()
+    if stats is not None:
+        instrumentation.merge(stats)
+    return result
+
+
+def getjobcount(jobs, count=None):
+    """Returns the number of worker processes to use.
+
+    :param jobs: The requested number of processes, 0 (or less) for one per
+        CPU.
+    :param count: The number of items to process, if known.
+    :return: 1 when the items should be processed in this process.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if count is not None:
+        jobs = min(jobs, count)
+    if (
+        jobs <= 1
+        or "fork" not in multiprocessing.get_all_start_methods()
+        or multiprocessing.current_process().daemon
+    ):
+        return 1
+    return jobs
+
+
+def imap(function, items, jobs=1):
+    """Yields the result of applying function to each of items, in order.
+
+    :param jobs: The number of worker processes, see :func:`getjobcount`.
+        Items are only read a few per process ahead of the results being
+        consumed, so they can come from a generator.
+    """
+    global _parallel_map
+    indexed = isinstance(items, collections.abc.Sequence)
+    processes = getjobcount(jobs, len(items) if indexed else None)
+    if processes == 1:
+        for item in items:
+            yield function(item)
+        return
+    _parallel_map = (function, items if indexed else None)
+    pending = collections.deque()
+    try:
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            for index, item in enumerate(items):
+                pending.append(
+                    pool.apply_async(_run, (index if indexed else item, indexed))
+                )
+                if len(pending) > 2 * processes:
+                    yield _result(pending.popleft())
+            while pending:
+                yield _result(pending.popleft())
+    finally:
+        _parallel_map = None
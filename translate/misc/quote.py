@@ -346,17 +346,12 @@ def javapropertiesencode(source):
     """Encodes source in the escaped-unicode encoding used by Java
     .properties files
     """
-    output = ""
+    output = javaproperties_escape_re.sub(
+        lambda match: controlchars.get(match.group()) or "\\u%04X" % ord(match.group()),
+        source,
+    )
     if source and source[0] == " ":
-        output = "\\"
-    for char in source:
-        charnum = ord(char)
-        if char in controlchars:
-            output += controlchars[char]
-        elif 0 <= charnum < 128:
-            output += str(char)
-        else:
-            output += "\\u%04X" % charnum
+        output = "\\" + output
     return output
 
 
@@ -426,6 +421,9 @@ controlchars = {
     "\r": "\\r",
     "\t": "\\t",
 }
+javaproperties_escape_re = re.compile(
+    "[%s\x80-\U0010ffff]" % re.escape("".join(controlchars))
+)
 
 
 def escapecontrols(source):
@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+
+from translate.filters import checks
+from translate.misc import instrumentation
+from translate.storage import po
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled():
+    instrumentation.reset()
+    assert instrumentation.timer("test") is instrumentation._NULL_TIMER
+    with instrumentation.timer("test"):
+        instrumentation.count("test")
+    assert instrumentation.get_report() == {"timers": {}, "counters": {}}
+
+
+def test_timer_and_counter(enabled):
+    for _ in range(3):
+        with instrumentation.timer("outer"):
+            with instrumentation.timer("outer"):
+                pass
+    instrumentation.count("items", 2)
+    instrumentation.count("items")
+    report = instrumentation.get_report()
+    assert report["timers"]["outer"]["calls"] == 3
+    assert report["counters"] == {"items": 3}
+
+
+def test_snapshot_merge(enabled):
+    with instrumentation.timer("merged"):
+        instrumentation.count("items", 2)
+    stats = instrumentation.snapshot()
+    instrumentation.merge(stats)
+    report = instrumentation.get_report()
+    assert report["timers"]["merged"]["calls"] == 2
+    assert report["counters"] == {"items": 4}
+
+
+def test_instrumented(enabled):
+    @instrumentation.instrumented("double")
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    assert instrumentation.get_report()["timers"]["double"]["calls"] == 1
+
+
+def test_store_hooks(enabled):
+    store = po.pofile.parsestring(b'msgid "a"\nmsgstr "b"\n')
+    bytes(store)
+    timers = instrumentation.get_report()["timers"]
+    assert timers["parse.pofile"]["calls"] == 1
+    assert timers["serialize.pofile"]["calls"] == 1
+
+
+def test_checker_hooks(enabled):
+    checker = checks.StandardChecker()
+    unit = po.pounit("Hello")
+    unit.target = "Hello"
+    checker.run_filters(unit)
+    report = instrumentation.get_report()
+    assert report["timers"]["check.unchanged"]["calls"] == 1
+    assert report["counters"]["check_failures.unchanged"] == 1
+
+
+def test_write_report(enabled):
+    with instrumentation.timer("test"):
+        pass
+    out = io.StringIO()
+    instrumentation.write_report("json", out)
+    assert json.loads(out.getvalue())["timers"]["test"]["calls"] == 1
+    out = io.StringIO()
+    instrumentation.write_report("text", out)
+    assert out.getvalue().startswith("timer")
@@ -32,3 +32,24 @@ class TestRecursiveOptionParser:
 
         out = parser.openoutputfile(None, None)  # To sys.stdout
         out.write(b"binary suff")
+
+    @staticmethod
+    def test_jobs(tmp_path):
+        def upper(inputfile, outputfile, templatefile):
+            outputfile.write(inputfile.read().upper())
+            return True
+
+        parser = optrecurse.RecursiveOptionParser({"txt": ("txt", upper)})
+        parser.setjobsoptions()
+        inputdir = tmp_path / "input"
+        inputdir.mkdir()
+        for i in range(5):
+            (inputdir / f"file{i}.txt").write_bytes(b"text %d" % i)
+        for jobs in ("1", "3", "0"):
+            outputdir = tmp_path / f"output{jobs}"
+            options, args = parser.parse_args(
+                ["--progress=none", f"--jobs={jobs}", str(inputdir), str(outputdir)]
+            )
+            parser.recursiveprocess(options)
+            for i in range(5):
+                assert (outputdir / f"file{i}.txt").read_bytes() == b"TEXT %d" % i
@@ -0,0 +1,46 @@
+import os
+
+from translate.misc import instrumentation, parallel
+
+
+def test_getjobcount():
+    assert parallel.getjobcount(1) == 1
+    assert parallel.getjobcount(3, 2) == 2
+    assert parallel.getjobcount(3, 0) == 1
+    assert parallel.getjobcount(0) == max(1, os.cpu_count() or 1)
+
+
+def test_imap():
+    items = list(range(20))
+    expected = [item * item for item in items]
+    assert list(parallel.imap(lambda item: item * item, items)) == expected
+    assert list(parallel.imap(lambda item: item * item, items, jobs=3)) == expected
+    # Items which are not a sequence are pickled to the workers
+    assert (
+        list(parallel.imap(lambda item: item * item, iter(items), jobs=3)) == expected
+    )
+    assert list(parallel.imap(str, [], jobs=0)) == []
+
+
+def test_imap_workers():
+    """The items are processed in other processes"""
+    pids = set(parallel.imap(lambda item: os.getpid(), range(10), jobs=2))
+    assert os.getpid() not in pids
+
+
+def test_imap_instrumentation():
+    """The counters of the workers are added to those of this process"""
+
+    def work(item):
+        instrumentation.count("test.items", item)
+        return item
+
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        instrumentation.count("test.items", 100)
+        assert list(parallel.imap(work, range(10), jobs=2)) == list(range(10))
+        assert instrumentation.get_report()["counters"] == {"test.items": 145}
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
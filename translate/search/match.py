@@ -24,6 +24,7 @@ import heapq
 import re
 from operator import itemgetter
 
+from translate.misc import instrumentation
 from translate.misc.multistring import multistring
 from translate.search import lshtein, terminology
 from translate.storage import base, po
@@ -158,6 +159,7 @@ class matcher:
         """
         return max(len(text) * (min_similarity / 100.0), 1)
 
+    @instrumentation.instrumented("match.matches")
     def matches(self, text):
         """Returns a list of possible matches for given source text.
 
@@ -296,6 +298,24 @@ class terminologymatcher(matcher):
             # We don't sort, so that the altered forms are at the back and
             # considered last.
             self.extendtm(extras, sort=False)
+        self._build_automaton()
+
+    def extendtm(self, units, store=None, sort=True):
+        super().extendtm(units, store=store, sort=sort)
+        self._automaton = None
+
+    def _build_automaton(self):
+        """Index the source strings of the candidates in a
+        :class:`~translate.search.terminology.TermAutomaton`.
+        """
+        self._automaton = terminology.TermAutomaton()
+        self._term_indices = {}
+        for index, unit in enumerate(self.candidates.units):
+            indices = self._term_indices.get(unit.source)
+            if indices is None:
+                self._automaton.add(unit.source)
+                indices = self._term_indices[unit.source] = []
+            indices.append(index)
 
     def getstartlength(self, min_similarity, text):
         # Let's number false matches by not working with terms of two
@@ -314,6 +334,7 @@ class terminologymatcher(matcher):
         l = len(context_re.sub("", unit.source))
         return l <= self.MAX_LENGTH and l >= self.getstartlength(None, None)
 
+    @instrumentation.instrumented("match.terminology")
     def matches(self, text):
         """Normal matching after converting text to lower case. Then replace
         with the original unit to retain comments, etc.
@@ -344,11 +365,35 @@ class terminologymatcher(matcher):
             else:
                 endindex = mid
 
-        for cand in self.candidates.units[startindex:]:
+        scanned = (
+            type(comparer).similarity is terminology.TerminologyComparer.similarity
+        )
+        if scanned:
+            # Find all the terms in one scan instead of comparing every
+            # candidate with the text
+            if self._automaton is None:
+                self._build_automaton()
+            positions = self._automaton.positions(text[: comparer.MAX_LEN])
+            comparer.match_info = {
+                source: {"pos": pos} for source, pos in positions.items()
+            }
+            candidates = [
+                self.candidates.units[index]
+                for index in sorted(
+                    index
+                    for source in positions
+                    for index in self._term_indices[source]
+                    if index >= startindex
+                )
+            ]
+        else:
+            candidates = self.candidates.units[startindex:]
+
+        for cand in candidates:
             source = cand.source
             if (source, cand.target) in known:
                 continue
-            if comparer.similarity(text, source, self.MIN_SIMILARITY):
+            if scanned or comparer.similarity(text, source, self.MIN_SIMILARITY):
                 match_info[source] = {"pos": comparer.match_info[source]["pos"]}
                 matches.append(cand)
                 known.add((source, cand.target))
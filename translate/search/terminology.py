@@ -19,6 +19,84 @@
 """A class that does terminology matching"""
 
 
+class TermAutomaton:
+    """An Aho-Corasick automaton to find many terms in a text in one scan.
+
+    This gives the same positions as :meth:`str.find` would for every term,
+    but the text is only scanned once, whatever the number of terms.
+    """
+
+    def __init__(self, terms=()):
+        # Every state of the trie has its transitions, its failure link, the
+        # term ending in it (if any) and a link to the longest proper suffix
+        # state where a term ends.
+        self.goto = [{}]
+        self.fail = [0]
+        self.term = [None]
+        self.output = [0]
+        for term in terms:
+            self.add(term)
+        self._linked = False
+
+    def add(self, term):
+        """Add a term to the automaton."""
+        goto = self.goto
+        state = 0
+        for char in term:
+            following = goto[state].get(char)
+            if following is None:
+                following = goto[state][char] = len(goto)
+                goto.append({})
+                self.fail.append(0)
+                self.term.append(None)
+                self.output.append(0)
+            state = following
+        self.term[state] = term
+        self._linked = False
+
+    def _link(self):
+        """Compute the failure and output links in breadth first order."""
+        goto, fail, term, output = self.goto, self.fail, self.term, self.output
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, following in goto[state].items():
+                queue.append(following)
+                suffix = fail[state]
+                while suffix and char not in goto[suffix]:
+                    suffix = fail[suffix]
+                suffix = goto[suffix].get(char, 0)
+                fail[following] = suffix
+                output[following] = (
+                    suffix if term[suffix] is not None else output[suffix]
+                )
+        self._linked = True
+
+    def positions(self, text):
+        """Return a dictionary with the position of the first occurrence of
+        every term found in ``text``.
+        """
+        if not self._linked:
+            self._link()
+        goto, fail, term, output = self.goto, self.fail, self.term, self.output
+        found = {}
+        if term[0] is not None:
+            # The empty string
+            found[term[0]] = 0
+        state = 0
+        for index, char in enumerate(text, 1):
+            following = goto[state].get(char)
+            while following is None and state:
+                state = fail[state]
+                following = goto[state].get(char)
+            state = following or 0
+            node = state if term[state] is not None else output[state]
+            # If a term was already found, so were all its suffixes
+            while node and term[node] not in found:
+                found[term[node]] = index - len(term[node])
+                node = output[node]
+        return found
+
+
 class TerminologyComparer:
     def __init__(self, max_len=500):
         self.match_info = {}
@@ -89,6 +89,19 @@ class TestMatch:
         candidates.sort()
         assert candidates == ["computer", "file"]
 
+    def test_terminology_extendtm(self):
+        """Test that terms added after creation are found as well."""
+        csvfile = self.buildcsv(["file", "computer"])
+        matcher = match.terminologymatcher(csvfile)
+        text = "Copy the files from your computer disk"
+        candidates = self.candidatestrings(matcher.matches(text))
+        assert candidates == ["file", "computer"]
+        csvfile2 = self.buildcsv(["computer disk", "copy"])
+        matcher.extendtm(csvfile2.units, store=csvfile2)
+        candidates = self.candidatestrings(matcher.matches(text))
+        assert candidates == ["copy", "file", "computer disk"]
+        assert matcher.match_info["computer disk"] == {"pos": 25}
+
     def test_brackets(self):
         """Tests that brackets at the end of a term are ignored"""
         csvfile = self.buildcsv(["file (noun)", "ISP (Internet Service Provider)"])
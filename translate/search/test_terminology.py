@@ -9,3 +9,15 @@ class TestTerminology:
         """Tests basic functionality"""
         termmatcher = terminology.TerminologyComparer()
         assert termmatcher.similarity("Open the file", "file") > 75
+
+    @staticmethod
+    def test_automaton():
+        """Tests that all the terms are found in one scan"""
+        terms = ["he", "she", "his", "hers", "shell", "s"]
+        automaton = terminology.TermAutomaton(terms)
+        text = "ushers and shells"
+        positions = automaton.positions(text)
+        assert positions == {term: text.find(term) for term in terms if term in text}
+        assert automaton.positions("") == {}
+        automaton.add("and")
+        assert automaton.positions(text)["and"] == 7
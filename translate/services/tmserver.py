@@ -77,9 +77,9 @@ class TMServer:
 
         if isinstance(tmfiles, list):
             for tmfile in tmfiles:
-                self.tmdb.add_store(factory.getobject(tmfile), source_lang, target_lang)
+                self.tmdb.add_units(factory.iterunits(tmfile), source_lang, target_lang)
         elif tmfiles:
-            self.tmdb.add_store(factory.getobject(tmfiles), source_lang, target_lang)
+            self.tmdb.add_units(factory.iterunits(tmfiles), source_lang, target_lang)
 
     @selector.opliant
     def translate_unit(self, environ, start_response, uid, slang, tlang):
@@ -24,6 +24,7 @@ import pickle
 from io import BytesIO
 from typing import List, Optional, Tuple
 
+from translate.misc import instrumentation
 from translate.misc.multistring import multistring
 from translate.storage.placeables import StringElem, parse as rich_parse
 from translate.storage.workflow import StateEnum as states
@@ -528,6 +529,19 @@ class TranslationStore:
     sourcelanguage = None
     targetlanguage = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Instrument the ``parse`` and ``serialize`` methods of subclasses.
+
+        The methods are timed as ``parse.<class name>`` and
+        ``serialize.<class name>`` when :mod:`translate.misc.instrumentation`
+        is enabled.
+        """
+        super().__init_subclass__(**kwargs)
+        for method in ("parse", "serialize"):
+            func = cls.__dict__.get(method)
+            if func is not None and callable(func):
+                setattr(cls, method, instrumentation.instrumented_method(func, method))
+
     def __init__(self, unitclass=None, encoding=None):
         """Construct a blank TranslationStore."""
         self.units = []
@@ -907,27 +921,73 @@ class TranslationStore:
 
 
 class UnitId:
+    """Path of a unit in a tree structured store.
+
+    The path is a list of ``(element, key)`` parts where the element is
+    either ``"key"`` or ``"index"``.  Extending an id with ``+`` does not
+    copy the parts but returns a child referring to its parent.  The full
+    parts and string of a child are built from the ones of its parent when
+    they are first needed, so siblings share the work done for their common
+    prefix while a file is flattened.
+    """
+
     KEY_SEPARATOR = "."
     INDEX_SEPARATOR = ""
 
-    def __init__(self, parts):
-        self.parts = parts
+    __slots__ = ("_parent", "_parts", "_string")
 
-    def __str__(self):
-        def fmt(element, key):
-            if element == "key":
-                return f"{self.KEY_SEPARATOR}{key}"
-            elif element == "index":
-                return f"{self.INDEX_SEPARATOR}[{key}]"
-            else:
-                raise ValueError(f"Unsupported element: {element}")
+    def __init__(self, parts, parent=None):
+        self._parent = parent
+        # Parts below the parent, if any
+        self._parts = parts
+        self._string = None
+
+    def _materialize(self):
+        """Includes the parts of the parent and releases it."""
+        parent = self._parent
+        self._string = parent._format() + self._format_parts(self._parts)
+        self._parts = parent.parts + self._parts
+        self._parent = None
 
-        return "".join(fmt(*part) for part in self.parts)
+    @property
+    def parts(self):
+        if self._parent is not None:
+            self._materialize()
+        return self._parts
+
+    @parts.setter
+    def parts(self, parts):
+        self._parent = None
+        self._parts = parts
+        self._string = None
+
+    def _format_part(self, element, key):
+        if element == "key":
+            return f"{self.KEY_SEPARATOR}{key}"
+        elif element == "index":
+            return f"{self.INDEX_SEPARATOR}[{key}]"
+        else:
+            raise ValueError(f"Unsupported element: {element}")
+
+    def _format_parts(self, parts):
+        if len(parts) == 1:
+            return self._format_part(*parts[0])
+        return "".join([self._format_part(element, key) for element, key in parts])
+
+    def _format(self):
+        if self._parent is not None:
+            self._materialize()
+        elif self._string is None:
+            self._string = self._format_parts(self._parts)
+        return self._string
+
+    def __str__(self):
+        return self._format()
 
     def __add__(self, other):
         if not isinstance(other, list):
             raise ValueError(f"Not supported type for add: {type(other)}")
-        return self.__class__(self.parts + other)
+        return self.__class__(list(other), self)
 
     @classmethod
     def from_string(cls, text):
@@ -964,33 +1024,23 @@ class DictUnit(TranslationUnit):
         return self._unitid
 
     def storevalue(self, output, value, override_key=None, unset=False):
-        parent = target = output
         parts = self.get_unitid().parts
-        key = None
-        for pos, part in enumerate(parts[:-1]):
-            element, key = part
-            use_list = parts[pos + 1][0] == "index"
-            default = [] if use_list else {}
-            if element == "index":
-                while len(target) <= key and not unset:
-                    target.append(default.copy())
-            elif element == "key":
-                if key not in target or isinstance(target[key], str):
-                    target[key] = default
-            else:
-                raise ValueError(f"Unsupported element: {element}")
-            if not use_list and isinstance(target[key], list):
-                # Convert list to dict if needed
-                target[key] = dict(enumerate(target[key]))
-            # Handle placeholders
-            if target[key] is None:
-                target[key] = default.copy()
-            parent = target
-            target = target[key]
         if override_key:
             child_element, child_key = "key", override_key
         else:
             child_element, child_key = parts[-1]
+        containers = None
+        if not unset and isinstance(self._store, DictStore):
+            containers = self._store.get_containers(output)
+        if containers is not None:
+            # Units sharing a prefix are stored into the same container
+            prefix = (tuple(parts[:-1]), parts[-1][0])
+            target = containers.get(prefix)
+            if target is None:
+                target = self._walk(output, parts, unset, containers)[1]
+                containers[prefix] = target
+        else:
+            parent, target, key = self._walk(output, parts, unset, containers)
         if child_element == "key":
             if unset:
                 del target[child_key]
@@ -998,6 +1048,9 @@ class DictUnit(TranslationUnit):
                 if not target and key:
                     del parent[key]
             else:
+                if containers and self._is_container(target, child_key):
+                    # A container is replaced, forget where the others are
+                    containers.clear()
                 target[child_key] = value
         elif child_element == "index":
             if len(target) <= child_key:
@@ -1010,10 +1063,52 @@ class DictUnit(TranslationUnit):
                 if unset:
                     del target[child_key]
                 else:
+                    if containers and self._is_container(target, child_key):
+                        containers.clear()
                     target[child_key] = value
         else:
             raise ValueError(f"Unsupported element: {child_element}")
 
+    @staticmethod
+    def _is_container(target, key):
+        try:
+            return isinstance(target[key], (dict, list))
+        except (KeyError, IndexError, TypeError):
+            return False
+
+    @staticmethod
+    def _walk(output, parts, unset, containers):
+        """Walks down to the container of the last part, creating it when
+        needed.
+
+        :return: The parent of the container, the container and its key
+        """
+        parent = target = output
+        key = None
+        for pos, part in enumerate(parts[:-1]):
+            element, key = part
+            use_list = parts[pos + 1][0] == "index"
+            default = [] if use_list else {}
+            if element == "index":
+                while len(target) <= key and not unset:
+                    target.append(default.copy())
+            elif element == "key":
+                if key not in target or isinstance(target[key], str):
+                    target[key] = default
+            else:
+                raise ValueError(f"Unsupported element: {element}")
+            if not use_list and isinstance(target[key], list):
+                # Convert list to dict if needed
+                target[key] = dict(enumerate(target[key]))
+                if containers:
+                    containers.clear()
+            # Handle placeholders
+            if target[key] is None:
+                target[key] = default.copy()
+            parent = target
+            target = target[key]
+        return parent, target, key
+
     def storevalues(self, output):
         self.storevalue(output, self.value)
 
@@ -1033,6 +1128,9 @@ class DictUnit(TranslationUnit):
 
 
 class DictStore(TranslationStore):
+    # Containers of the output being serialized, see serialize_units()
+    _containers = None
+
     def get_root_node(self):
         if self.units and all(
             unit.get_unitid().parts[0][0] == "index" for unit in self.units
@@ -1040,6 +1138,20 @@ class DictStore(TranslationStore):
             return []
         return {}
 
+    def get_containers(self, output):
+        """Returns the containers of ``output`` by path prefix while it is
+        being built by :meth:`serialize_units`, or None.
+        """
+        if self._containers is not None and self._containers[0] is output:
+            return self._containers[1]
+        return None
+
     def serialize_units(self, output):
-        for unit in self.unit_iter():
-            unit.storevalues(output)
+        # The container of every path prefix is only looked up once, all
+        # following units below the same prefix are stored into it directly
+        self._containers = (output, {})
+        try:
+            for unit in self.unit_iter():
+                unit.storevalues(output)
+        finally:
+            self._containers = None
@@ -16,25 +16,63 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+"""Benchmarks for the Translate Toolkit.
+
+The module provides two modes:
+
+* a suite of pluggable scenarios (see :class:`BenchmarkScenario`) covering
+  the hot paths of the toolkit, run on reproducible seeded data with warmup
+  and repeated timing, reporting timing statistics and peak memory and
+  optionally writing JSON to track regressions across releases::
+
+    python -m translate.storage.benchmark --scenario all --size 100 1000 \\
+        --json results.json
+
+  The ``--imports`` option measures the startup time of the console
+  scripts in the same way.
+
+* the profiling of parsing and placeables on sample or existing store files
+  selected with the ``--check-*`` options.
+"""
+
 import argparse
 import cProfile
+import io
+import json
 import os
+import platform
 import pstats
 import random
+import shutil
+import statistics
 import sys
+import tempfile
+import time
+import tracemalloc
 from importlib import import_module
 
-from translate.storage import factory, placeables
+from translate.__version__ import sver
+from translate.storage import cache, factory, placeables, poparser, pypo
+
+
+# Store types that are not (only) reachable through the factory, with the
+# module, class and file extension to use for them
+STORE_TYPES = {
+    "po": ("po", "pofile", "po"),
+    "xliff": ("xliff", "xlifffile", "xlf"),
+    "properties": ("properties", "javafile", "properties"),
+    "json": ("jsonl10n", "JsonFile", "json"),
+}
 
 
 class TranslateBenchmarker:
     """class to aid in benchmarking Translate Toolkit stores"""
 
-    def __init__(self, test_dir, storeclass):
+    def __init__(self, test_dir, storeclass, extension=None):
         """sets up benchmarking on the test directory"""
         self.test_dir = os.path.abspath(test_dir)
         self.StoreClass = storeclass
-        self.extension = self.StoreClass.Extensions[0]
+        self.extension = extension or self.StoreClass.Extensions[0]
         self.project_dir = os.path.join(self.test_dir, "benchmark")
         self.file_dir = os.path.join(self.project_dir, "zxx")
         self.parsedfiles = []
@@ -81,6 +119,7 @@ class TranslateBenchmarker:
                         for i in range(source_words_per_string)
                     )
                     sample_unit = sample_file.addsourceunit(source_string)
+                    sample_unit.setid("key%d" % stringnum)
                     sample_unit.target = " ".join(
                         "drow%d" % (random.randint(0, strings_per_file) * i)
                         for i in range(target_words_per_string)
@@ -93,29 +132,1019 @@ class TranslateBenchmarker:
         """parses all the files in the test directory into memory"""
         count = 0
         self.parsedfiles = []
+        if file_dir is None:
+            file_dir = self.file_dir
+        for pofilename in self.iter_files(file_dir):
+            parsedfile = self.StoreClass.parsefile(pofilename)
+            count += len(parsedfile.units)
+            self.parsedfiles.append(parsedfile)
+        print("counted %d units" % count)
+
+    def iter_files(self, file_dir=None):
+        """iterates over the names of the store files in the test directory"""
         if file_dir is None:
             file_dir = self.file_dir
         for dirpath, subdirs, filenames in os.walk(file_dir, topdown=False):
             for name in filenames:
-                pofilename = os.path.join(dirpath, name)
-                parsedfile = self.StoreClass(open(pofilename))
-                count += len(parsedfile.units)
-                self.parsedfiles.append(parsedfile)
+                if not name.endswith(cache.CACHE_SUFFIX):
+                    yield os.path.join(dirpath, name)
+
+    def getobject_files(self, file_dir=None, use_cache=False):
+        """loads all the files in the test directory with factory.getobject,
+        writing or using binary caches next to them if use_cache is set
+        """
+        count = 0
+        classes = {self.extension: self.StoreClass}
+        for pofilename in self.iter_files(file_dir):
+            store = factory.getobject(pofilename, classes=classes, use_cache=use_cache)
+            count += len(store.units)
+        print("counted %d units" % count)
+
+    def compare_po_parsers(self, file_dir=None):
+        """times the fast and the regular PO parser on all the files"""
+        timings = {True: 0.0, False: 0.0}
+        count = 0
+        for pofilename in self.iter_files(file_dir):
+            with open(pofilename, "rb") as fh:
+                lines, newline = pypo.splitlines(fh.read())
+            for fast in timings:
+                store = pypo.pofile()
+                store.units = []
+                start = time.perf_counter()
+                poparser.parse_units(
+                    poparser.ParseState(iter(lines), store.create_unit),
+                    store,
+                    fast=fast,
+                )
+                timings[fast] += time.perf_counter() - start
+            count += len(store.units)
         print("counted %d units" % count)
+        print(
+            "regular parser: %.3fs, fast parser: %.3fs, speedup: %.2fx"
+            % (timings[False], timings[True], timings[False] / timings[True])
+        )
 
     def parse_placeables(self):
-        """parses placeables"""
+        """parses placeables with the scanner and the recursive parser"""
+        timings = {True: 0.0, False: 0.0}
         count = 0
         for parsedfile in self.parsedfiles:
-            for unit in parsedfile.units:
-                placeables.parse(unit.source, placeables.general.parsers)
-                placeables.parse(unit.target, placeables.general.parsers)
+            for fast in timings:
+                start = time.perf_counter()
+                for unit in parsedfile.units:
+                    placeables.parse(unit.source, placeables.general.parsers, fast)
+                    placeables.parse(unit.target, placeables.general.parsers, fast)
+                timings[fast] += time.perf_counter() - start
             count += len(parsedfile.units)
         print("counted %d units" % count)
+        print(
+            "recursive parser: %.3fs, scanner: %.3fs, speedup: %.2fx"
+            % (timings[False], timings[True], timings[False] / timings[True])
+        )
 
+    def compare_decorations(self, lookups=3):
+        """extracts the decorations checked by pofilter from all the strings
+        with the tokenizer and with a search for every marker
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Process some integers.")
+        The variables and accelerators of a string are looked up ``lookups``
+        times, like the filters and the checks of a checker do.
+        """
+        from translate.filters import checks, decoration
+
+        strings = [
+            string
+            for parsedfile in self.parsedfiles
+            for unit in parsedfile.units
+            for string in (unit.source, unit.target)
+        ]
+        print("counted %d strings" % len(strings))
+        for name in ("kde", "libreoffice", "mozilla", "gnome"):
+            config = checks.projectcheckers[name]().config
+            start = time.perf_counter()
+            for string in strings:
+                for _ in range(lookups):
+                    for startmarker, endmarker in config.varmatches:
+                        decoration.findmarkedvariables(string, startmarker, endmarker)
+                    for accelmarker in config.accelmarkers:
+                        decoration.findaccelerators(string, accelmarker)
+                decoration.getnumbers(string)
+                decoration.getfunctions(string)
+                decoration.getemails(string)
+                decoration.geturls(string)
+            searches = time.perf_counter() - start
+            tokenizer = decoration.DecorationTokenizer(
+                config.accelmarkers, config.varmatches
+            )
+            start = time.perf_counter()
+            for string in strings:
+                for _ in range(lookups):
+                    decorations = tokenizer.tokenize(string)
+                    for index in range(len(config.varmatches)):
+                        decorations.variables(index)
+                    for index in range(len(config.accelmarkers)):
+                        decorations.accelerators(index)
+                decorations.numbers  # noqa: B018
+                decorations.functions  # noqa: B018
+                decorations.emails  # noqa: B018
+                decorations.urls  # noqa: B018
+            tokenized = time.perf_counter() - start
+            print(
+                "%s: searches: %.3fs, tokenizer: %.3fs, speedup: %.2fx"
+                % (name, searches, tokenized, searches / tokenized)
+            )
+
+
+class ScenarioSkipped(Exception):
+    """Raised by a scenario that can not run in this environment."""
+
+
+class SampleData:
+    """Reproducible sample strings generated from a seed."""
+
+    WORDS = (
+        "file open save close print edit view window help about tools "
+        "options settings account password user name new delete copy paste "
+        "search replace folder document message error warning select all "
+        "cancel apply update download upload share language translation"
+    ).split()
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def sentence(self, min_words=2, max_words=10):
+        words = self.random.choices(
+            self.WORDS, k=self.random.randint(min_words, max_words)
+        )
+        sentence = " ".join(words)
+        if self.random.random() < 0.2:
+            sentence += " %s"
+        return sentence[0].upper() + sentence[1:]
+
+    def translation(self, source):
+        return " ".join(word[::-1] for word in source.split(" "))
+
+    def units(self, count):
+        """Returns a list of (key, source, target) tuples."""
+        result = []
+        for number in range(count):
+            source = self.sentence()
+            result.append(("key%d" % number, source, self.translation(source)))
+        return result
+
+    def store(self, storeclass, count, translated=True):
+        """Builds a store of the given class with ``count`` sample units."""
+        store = storeclass()
+        for key, source, target in self.units(count):
+            unit = store.addsourceunit(source)
+            unit.setid(key)
+            if translated:
+                unit.target = target
+        return store
+
+
+class BenchmarkScenario:
+    """Base class of the benchmark scenarios.
+
+    Subclasses set :attr:`name` and implement :meth:`run`, doing all the
+    preparation that should not be timed in :meth:`setup`.
+    """
+
+    name = None
+    """The name used to select the scenario."""
+    description = ""
+    """A short description of what is measured."""
+    volume = None
+    """The number of characters processed by :meth:`run`, if the throughput
+    should be reported."""
+
+    def __init__(self, size, seed):
+        self.size = size
+        self.data = SampleData(f"{seed}:{self.name}:{size}")
+
+    def setup(self):
+        """Prepares the data for :meth:`run`."""
+
+    def run(self):
+        """Runs the measured operation once.
+
+        The memory still used by a returned object is reported as retained
+        memory.
+        """
+        raise NotImplementedError
+
+    def teardown(self):
+        """Releases resources acquired by :meth:`setup`."""
+
+
+SCENARIOS = {}
+"""Registered scenario classes by name."""
+
+
+def register_scenario(cls):
+    """Class decorator adding a scenario to :data:`SCENARIOS`."""
+    SCENARIOS[cls.name] = cls
+    return cls
+
+
+class StoreScenario(BenchmarkScenario):
+    """Base class of the parse and serialize scenarios of a store class."""
+
+    module_name = None
+    class_name = None
+
+    def setup(self):
+        try:
+            self.storeclass = factory.import_class(
+                self.module_name, self.class_name, "translate.storage"
+            )
+            self.store = self.data.store(self.storeclass, self.size)
+            self.serialized = bytes(self.store)
+            self.storeclass.parsestring(self.serialized)
+        except Exception as e:
+            raise ScenarioSkipped(f"{type(e).__name__}: {e}")
+
+
+class StoreParseScenario(StoreScenario):
+    def run(self):
+        return self.storeclass.parsestring(self.serialized)
+
+
+class StoreSerializeScenario(StoreScenario):
+    def run(self):
+        bytes(self.store)
+
+
+def _register_store_scenarios():
+    seen = set()
+    for extension, (module_name, class_name) in factory._classes_str.items():
+        if (module_name, class_name) in seen:
+            continue
+        seen.add((module_name, class_name))
+        for action, base in (
+            ("parse", StoreParseScenario),
+            ("serialize", StoreSerializeScenario),
+        ):
+            register_scenario(
+                type(
+                    f"{base.__name__}_{extension}",
+                    (base,),
+                    {
+                        "name": f"{action}:{extension.lstrip('_')}",
+                        "description": f"{action} {class_name} ({module_name})",
+                        "module_name": module_name,
+                        "class_name": class_name,
+                    },
+                )
+            )
+
+
+_register_store_scenarios()
+
+
+class GetobjectScenario(BenchmarkScenario):
+    """Base class of the factory.getobject scenarios of a store file."""
+
+    extension = None
+    module_name = None
+    class_name = None
+    use_cache = False
+
+    def setup(self):
+        self.classes_str = {self.extension: (self.module_name, self.class_name)}
+        storeclass = factory.import_class(
+            self.module_name, self.class_name, "translate.storage"
+        )
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "sample." + self.extension)
+        self.data.store(storeclass, self.size).savefile(self.filename)
+        if self.use_cache:
+            self.run()
+            if not cache.load_cache(self.filename).complete:
+                raise ScenarioSkipped("The cache of the sample file is incomplete")
+
+    def run(self):
+        return factory.getobject(
+            self.filename, classes_str=self.classes_str, use_cache=self.use_cache
+        )
+
+    def teardown(self):
+        shutil.rmtree(self.tempdir)
+
+
+def _register_getobject_scenarios():
+    for extension, module_name, class_name in (
+        ("po", "po", "pofile"),
+        ("xlf", "xliff", "xlifffile"),
+        ("properties", "properties", "javafile"),
+        ("json", "jsonl10n", "JsonFile"),
+    ):
+        for use_cache in (False, True):
+            name = "getobject-cached" if use_cache else "getobject"
+            register_scenario(
+                type(
+                    f"GetobjectScenario_{extension}_{use_cache}",
+                    (GetobjectScenario,),
+                    {
+                        "name": f"{name}:{extension}",
+                        "description": "factory.getobject of a %s file%s"
+                        % (class_name, " from its cache" if use_cache else ""),
+                        "extension": extension,
+                        "module_name": module_name,
+                        "class_name": class_name,
+                        "use_cache": use_cache,
+                    },
+                )
+            )
+
+
+_register_getobject_scenarios()
+
+
+@register_scenario
+class MatcherScenario(BenchmarkScenario):
+    name = "matcher"
+    description = "matcher.matches for 20 queries against a TM of size units"
+
+    def setup(self):
+        from translate.search import match
+        from translate.storage import po
+
+        self.matcher = match.matcher(
+            self.data.store(po.pofile, self.size), max_candidates=5, max_length=200
+        )
+        self.queries = [self.data.sentence() for i in range(20)]
+
+    def run(self):
+        for query in self.queries:
+            self.matcher.matches(query)
+
+
+@register_scenario
+class TerminologyScenario(BenchmarkScenario):
+    name = "terminology"
+    description = "terminologymatcher.matches for size strings, 10 * size terms"
+
+    def setup(self):
+        from translate.search import match
+        from translate.storage import po
+
+        glossary = po.pofile()
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        for number in range(10 * self.size):
+            if number % 10:
+                term = "".join(
+                    self.data.random.choices(letters, k=self.data.random.randint(4, 12))
+                )
+            else:
+                term = " ".join(self.data.random.sample(SampleData.WORDS, 2))
+            unit = glossary.addsourceunit(term)
+            unit.target = term.upper()
+        self.matcher = match.terminologymatcher(glossary)
+        self.strings = [source for key, source, target in self.data.units(self.size)]
+        self.volume = sum(len(string) for string in self.strings)
+
+    def run(self):
+        for string in self.strings:
+            self.matcher.matches(string)
+
+
+@register_scenario
+class PlaceablesScenario(BenchmarkScenario):
+    name = "placeables"
+    description = "placeables.parse with the general parsers on size strings"
+
+    def setup(self):
+        markup = ("<b>", "</b>", "&amp;", "{0}", "http://example.com/", "--help")
+        self.strings = []
+        for key, source, target in self.data.units(self.size):
+            words = source.split(" ")
+            words.insert(self.data.random.randrange(len(words)), key.upper())
+            words.insert(
+                self.data.random.randrange(len(words)),
+                self.data.random.choice(markup),
+            )
+            self.strings.append(" ".join(words))
+
+    def run(self):
+        for string in self.strings:
+            placeables.parse(string, placeables.general.parsers)
+
+
+@register_scenario
+class StringElemEditScenario(BenchmarkScenario):
+    name = "strelem-edit"
+    description = "typical edit sequences on size parsed segments of about 2 KB"
+
+    def setup(self):
+        markup = ("<b>", "</b>", "&amp;", "{0}", "%s", "http://example.com/")
+        self.strings = []
+        for number in range(self.size):
+            words = []
+            while sum(len(word) + 1 for word in words) < 2048:
+                words.append(self.data.sentence())
+                words.append(self.data.random.choice(markup))
+            self.strings.append(" ".join(words))
+        self.edits = []
+        for number in range(50):
+            self.edits.append(
+                (self.data.random.random(), self.data.random.random(), number % 5)
+            )
+
+    def run(self):
+        for string in self.strings:
+            tree = placeables.parse(string, placeables.general.parsers)
+            for start, end, operation in self.edits:
+                length = len(tree)
+                start = int(start * length)
+                if operation == 0:
+                    tree.insert(start, "text")
+                elif operation == 1:
+                    tree.delete_range(start, min(start + 3, length))
+                elif operation == 2:
+                    tree.get_index_data(start)
+                elif operation == 3:
+                    leaves = tree.flatten()
+                    tree.insert_between(leaves[int(end * len(leaves))], None, "x")
+                else:
+                    tree.elem_offset(tree.elem_at_offset(start))
+                str(tree)
+
+
+@register_scenario
+class IdentifyScenario(BenchmarkScenario):
+    name = "identify"
+    description = "LanguageIdentifier.identify_many on size strings"
+
+    def setup(self):
+        from translate.lang.identify import LanguageIdentifier
+
+        self.identifier = LanguageIdentifier()
+        self.texts = []
+        for key, source, target in self.data.units(self.size):
+            self.texts.append(source)
+            self.texts.append(target)
+
+    def run(self):
+        self.identifier.identify_many(self.texts)
+
+
+class SegmentScenario(BenchmarkScenario):
+    """Base class of the segmentation scenarios of a language."""
+
+    code = None
+
+    def setup(self):
+        from translate.lang import factory
+
+        self.language = factory.getlanguage(self.code)
+        end = self.language.sentenceend[0]
+        self.texts = []
+        for key, source, target in self.data.units(self.size):
+            sentences = [source, target]
+            sentences.extend(
+                self.data.sentence() for i in range(self.data.random.randrange(3))
+            )
+            self.texts.append(" ".join(sentence + end for sentence in sentences))
+        self.volume = sum(len(text) for text in self.texts)
+
+    def run(self):
+        self.language.segmenter().cache_clear()
+        for text in self.texts:
+            self.language.sentences(text)
+            self.language.words(text)
+
+
+def _register_segment_scenarios():
+    for code in ("af", "ar", "el", "en", "hy", "ja", "km", "th", "zh"):
+        register_scenario(
+            type(
+                f"SegmentScenario_{code}",
+                (SegmentScenario,),
+                {
+                    "name": f"segment:{code}",
+                    "description": f"sentences and words of size texts in {code}",
+                    "code": code,
+                },
+            )
+        )
+
+
+_register_segment_scenarios()
+
+
+@register_scenario
+class CheckerScenario(BenchmarkScenario):
+    name = "pofilter"
+    description = "StandardChecker.run_filters on every unit"
+
+    def setup(self):
+        from translate.filters import checks
+        from translate.storage import po
+
+        self.checker = checks.StandardChecker()
+        self.store = self.data.store(po.pofile, self.size)
+
+    def run(self):
+        for unit in self.store.units:
+            self.checker.run_filters(unit)
+
+
+@register_scenario
+class PocountScenario(BenchmarkScenario):
+    name = "pocount"
+    description = "pocount.calcstats on a PO file"
+
+    def setup(self):
+        from translate.storage import po
+
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "sample.po")
+        self.data.store(po.pofile, self.size).savefile(self.filename)
+
+    def run(self):
+        from translate.tools import pocount
+
+        pocount.calcstats(self.filename)
+
+    def teardown(self):
+        shutil.rmtree(self.tempdir)
+
+
+@register_scenario
+class PoterminologyFilterScenario(BenchmarkScenario):
+    name = "poterminology-filter"
+    description = "poterminology filter_terms on 100 * size terms"
+
+    def setup(self):
+        from translate.storage import po
+        from translate.tools import poterminology
+
+        self.extractor = poterminology.TerminologyExtractor()
+        stopwords = ("the", "of", "to", "a", "and", "in", "for", "with")
+        vocabulary = [
+            "%s%d" % (word, number)
+            for word in SampleData.WORDS
+            for number in range(self.size // 10 + 1)
+        ]
+        random = self.data.random
+        self.terms = {}
+        while len(self.terms) < 100 * self.size:
+            words = [
+                random.choice(stopwords if random.random() < 0.2 else vocabulary)
+                for i in range(3)
+            ]
+            count = random.randint(11, 30)
+            # The subphrases of a term often have the same count
+            for term in (words, words[:2], words[1:], words[:1]):
+                term = " ".join(term)
+                if term not in self.terms:
+                    self.terms[term] = (
+                        count if random.random() < 0.5 else random.randint(11, 30),
+                        po.pounit(term),
+                    )
+
+    def run(self):
+        self.extractor.filter_terms(
+            dict(self.terms), sortorders=["frequency", "dictionary", "length"]
+        )
+
+
+@register_scenario
+class Pot2poScenario(BenchmarkScenario):
+    name = "pot2po"
+    description = "pot2po update of a translated PO file from a changed template"
+
+    def setup(self):
+        from translate.storage import po
+
+        units = self.data.units(self.size)
+        template = po.pofile()
+        translated = po.pofile()
+        for number, (key, source, target) in enumerate(units):
+            if number % 10 == 0:
+                # Change every tenth message to exercise fuzzy matching
+                source = source + " " + self.data.sentence(1, 2)
+            template.addsourceunit(source)
+            translated.addsourceunit(units[number][1]).target = target
+        self.template = bytes(template)
+        self.translated = bytes(translated)
+
+    def run(self):
+        from translate.convert import pot2po
+
+        pot2po.convertpot(
+            io.BytesIO(self.template), io.BytesIO(), io.BytesIO(self.translated)
+        )
+
+
+@register_scenario
+class PropRoundtripScenario(BenchmarkScenario):
+    name = "po2prop"
+    description = "prop2po followed by po2prop of a Java properties file"
+
+    def setup(self):
+        from translate.storage import properties
+
+        self.properties = bytes(self.data.store(properties.javafile, self.size))
+
+    def run(self):
+        from translate.convert import po2prop, prop2po
+
+        pofile = io.BytesIO()
+        prop2po.convertprop(io.BytesIO(self.properties), pofile, None)
+        po2prop.convertprop(
+            io.BytesIO(pofile.getvalue()), io.BytesIO(), io.BytesIO(self.properties)
+        )
+
+
+@register_scenario
+class PropDialectsScenario(BenchmarkScenario):
+    name = "properties"
+    description = "parse of a properties file of size units in every dialect"
+
+    def setup(self):
+        from translate.storage import properties
+
+        self.files = []
+        for name in sorted(properties.dialects):
+            store = self.data.store(
+                lambda: properties.propfile(personality=name), self.size
+            )
+            for number, unit in enumerate(store.units):
+                if number % 5 == 0:
+                    unit.addnote("# Comment for %s" % unit.name)
+            self.files.append((name, bytes(store)))
+
+    def run(self):
+        from translate.storage import properties
+
+        for name, propsrc in self.files:
+            properties.propfile(personality=name).parse(propsrc)
+
+
+@register_scenario
+class NestedJsonScenario(BenchmarkScenario):
+    name = "json-nested"
+    description = "parse and serialize of a nested JSON file of size keys"
+
+    def setup(self):
+        tree = {}
+        for number, (key, source, target) in enumerate(self.data.units(self.size)):
+            node = tree
+            # Ten levels of sections with up to 100 keys in each of them
+            section = number // 100
+            for level in range(9):
+                node = node.setdefault("section%d" % (section % 3), {})
+                section //= 3
+            node[key] = target
+        self.json = json.dumps(tree, indent=4).encode("utf-8")
+
+    def run(self):
+        from translate.storage import jsonl10n
+
+        store = jsonl10n.JsonNestedFile()
+        store.parse(self.json)
+        bytes(store)
+
+
+@register_scenario
+class MozRoundtripScenario(BenchmarkScenario):
+    name = "po2moz"
+    description = "dtd2po followed by po2dtd, the conversions of moz2po/po2moz"
+
+    def setup(self):
+        # A percent sign starts a parameter entity reference in DTD
+        self.dtd = "".join(
+            '<!ENTITY {}.label "{}">\n'.format(key, source.replace(" %s", ""))
+            for key, source, target in self.data.units(self.size)
+        ).encode("utf-8")
+
+    def run(self):
+        from translate.convert import dtd2po, po2dtd
+
+        pofile = io.BytesIO()
+        dtd2po.convertdtd(io.BytesIO(self.dtd), pofile, None)
+        po2dtd.convertdtd(
+            io.BytesIO(pofile.getvalue()), io.BytesIO(), io.BytesIO(self.dtd)
+        )
+
+
+@register_scenario
+class PHPFilesScenario(BenchmarkScenario):
+    name = "php-files"
+    description = "parse of size PHP and Laravel localisation files of 10 units"
+
+    def setup(self):
+        self.files = []
+        for number in range(self.size):
+            units = self.data.units(10)
+            if number % 2:
+                lines = ["<?php\n", "\n", "return [\n"]
+                lines.extend(
+                    "    '%s' => '%s',\n" % (key, target.replace("'", "\\'"))
+                    for key, source, target in units
+                )
+                lines.append("];\n")
+            else:
+                lines = ["<?php\n", "// Language file\n"]
+                lines.extend(
+                    "$lang['%s'] = '%s';\n" % (key, target.replace("'", "\\'"))
+                    for key, source, target in units
+                )
+            self.files.append("".join(lines).encode("utf-8"))
+
+    def run(self):
+        from translate.storage import php
+
+        for phpsrc in self.files:
+            php.phpfile().parse(phpsrc)
+
+
+@register_scenario
+class PocompileScenario(BenchmarkScenario):
+    name = "pocompile"
+    description = "pocompile of a directory with 8 PO files of size units"
+    jobs = 1
+
+    def setup(self):
+        from translate.storage import po
+
+        self.tempdir = tempfile.mkdtemp()
+        self.inputdir = os.path.join(self.tempdir, "po")
+        os.mkdir(self.inputdir)
+        for number in range(8):
+            self.data.store(po.pofile, self.size).savefile(
+                os.path.join(self.inputdir, "file%d.po" % number)
+            )
+        self.runs = 0
+
+    def run(self):
+        from translate.tools import pocompile
+
+        self.runs += 1
+        outputdir = os.path.join(self.tempdir, "mo%d" % self.runs)
+        os.mkdir(outputdir)
+        argv = sys.argv
+        sys.argv = [
+            "pocompile",
+            "--progress=none",
+            "--jobs=%d" % self.jobs,
+            self.inputdir,
+            outputdir,
+        ]
+        try:
+            pocompile.main()
+        finally:
+            sys.argv = argv
+
+    def teardown(self):
+        shutil.rmtree(self.tempdir)
+
+
+@register_scenario
+class PocompileJobsScenario(PocompileScenario):
+    name = "pocompile:jobs"
+    description = "pocompile of a directory with 8 PO files of size units, --jobs=0"
+    jobs = 0
+
+
+class TMDBScenario(BenchmarkScenario):
+    def setup(self):
+        from translate.storage import po
+
+        self.tempdir = tempfile.mkdtemp()
+        self.store = self.data.store(po.pofile, self.size)
+        self.runs = 0
+
+    def create_tmdb(self):
+        from translate.storage import tmdb
+
+        self.runs += 1
+        return tmdb.TMDB(os.path.join(self.tempdir, "tm%d.db" % self.runs))
+
+    def teardown(self):
+        shutil.rmtree(self.tempdir)
+
+
+@register_scenario
+class TMDBImportScenario(TMDBScenario):
+    name = "tmdb-import"
+    description = "import of a PO store into a new TMDB"
+
+    def run(self):
+        self.create_tmdb().add_store(self.store, "en", "af")
+
+
+@register_scenario
+class TMDBQueryScenario(TMDBScenario):
+    name = "tmdb-query"
+    description = "TMDB.translate_unit for 20 queries against a TM of size units"
+
+    def setup(self):
+        super().setup()
+        self.tmdb = self.create_tmdb()
+        self.tmdb.add_store(self.store, "en", "af")
+        self.queries = [self.data.sentence() for i in range(20)]
+
+    def run(self):
+        for query in self.queries:
+            self.tmdb.translate_unit(query, "en", "af")
+
+
+def run_scenario(scenario, warmup=1, repeat=5, measure_memory=True):
+    """Runs a scenario and returns a dictionary with its measurements.
+
+    Timings are in seconds, the peak memory (in bytes) is measured with
+    :mod:`tracemalloc` on a separate run, together with the memory retained
+    by the object returned by the scenario (if any).
+    """
+    result = {
+        "scenario": scenario.name,
+        "size": scenario.size,
+    }
+    try:
+        scenario.setup()
+    except ScenarioSkipped as e:
+        result["skipped"] = str(e)
+        return result
+    try:
+        for _i in range(warmup):
+            scenario.run()
+        timings = []
+        for _i in range(repeat):
+            start = time.perf_counter()
+            scenario.run()
+            timings.append(time.perf_counter() - start)
+        if measure_memory:
+            tracemalloc.start()
+            try:
+                retained = scenario.run()
+                current, result["peak_memory"] = tracemalloc.get_traced_memory()
+                if retained is not None:
+                    result["retained_memory"] = current
+                del retained
+            finally:
+                tracemalloc.stop()
+    finally:
+        scenario.teardown()
+    result.update(
+        {
+            "repeat": repeat,
+            "min": min(timings),
+            "mean": statistics.mean(timings),
+            "median": statistics.median(timings),
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        }
+    )
+    if scenario.volume:
+        result["throughput"] = scenario.volume / min(timings)
+    return result
+
+
+def select_scenarios(patterns):
+    """Returns the names of the scenarios matching any of the patterns.
+
+    A pattern is a scenario name, a prefix ending with ``:`` (like
+    ``parse:``) or ``all``.
+    """
+    names = []
+    for pattern in patterns:
+        if pattern == "all":
+            matched = list(SCENARIOS)
+        elif pattern.endswith(":"):
+            matched = [name for name in SCENARIOS if name.startswith(pattern)]
+        elif pattern in SCENARIOS:
+            matched = [pattern]
+        else:
+            raise ValueError("Unknown scenario: %s" % pattern)
+        names.extend(name for name in matched if name not in names)
+    return names
+
+
+def run_suite(names, sizes, seed=0, warmup=1, repeat=5, measure_memory=True):
+    """Runs the named scenarios for all sizes and returns the report."""
+    results = []
+    for name in names:
+        for size in sizes:
+            result = run_scenario(
+                SCENARIOS[name](size, seed), warmup, repeat, measure_memory
+            )
+            print_result(result)
+            results.append(result)
+    return {
+        "version": sver,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "warmup": warmup,
+        "results": results,
+    }
+
+
+def console_scripts():
+    """Returns the console scripts of the toolkit as (name, module) pairs."""
+    from importlib import metadata
+
+    try:
+        entry_points = metadata.distribution("translate-toolkit").entry_points
+        scripts = [
+            (entry_point.name, entry_point.value.partition(":")[0])
+            for entry_point in entry_points
+            if entry_point.group == "console_scripts"
+        ]
+    except metadata.PackageNotFoundError:
+        scripts = []
+    if scripts:
+        return sorted(scripts)
+
+    # Running from a source checkout
+    import configparser
+
+    import translate
+
+    config = configparser.ConfigParser()
+    config.read(
+        os.path.join(os.path.dirname(os.path.dirname(translate.__file__)), "setup.cfg")
+    )
+    if not config.has_option("options.entry_points", "console_scripts"):
+        return []
+    for line in config.get("options.entry_points", "console_scripts").splitlines():
+        name, _sep, value = line.partition("=")
+        if value:
+            scripts.append((name.strip(), value.strip().partition(":")[0]))
+    return sorted(scripts)
+
+
+def time_import(module, repeat=5):
+    """Returns the shortest time taken to start Python and import ``module``
+    in a new process.
+    """
+    import subprocess
+
+    import translate
+
+    env = dict(os.environ)
+    path = os.path.dirname(os.path.dirname(translate.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [path, os.environ.get("PYTHONPATH")])
+    )
+    code = "import %s" % module if module else "pass"
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_import_times(repeat=5):
+    """Measures the import time of the module of every console script.
+
+    The startup time of the interpreter is subtracted from the timings.
+    """
+    # This also compiles the modules the first time
+    for name, module in console_scripts():
+        time_import(module, repeat=1)
+    startup = time_import(None, repeat)
+    print(f"{'python startup':32} {startup * 1000:9.1f} ms", flush=True)
+    results = []
+    for name, module in console_scripts():
+        timing = time_import(module, repeat) - startup
+        print(f"{name:32} {timing * 1000:9.1f} ms", flush=True)
+        results.append({"script": name, "module": module, "import_time": timing})
+    total = sum(result["import_time"] for result in results)
+    print(f"{'total':32} {total * 1000:9.1f} ms")
+    return {
+        "version": sver,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "startup": startup,
+        "imports": results,
+    }
+
+
+def print_result(result):
+    """Prints one scenario result on a single line."""
+    label = "{scenario} [{size}]".format(**result)
+    if "skipped" in result:
+        print(f"{label:32} skipped: {result['skipped']}")
+        return
+    line = "{:32} min {:9.4f}s  median {:9.4f}s  stdev {:8.4f}s".format(
+        label, result["min"], result["median"], result["stdev"]
+    )
+    if "peak_memory" in result:
+        line += "  peak {:9.1f} KiB".format(result["peak_memory"] / 1024)
+    if "throughput" in result:
+        line += "  {:7.2f} Mchar/s".format(result["throughput"] / 1e6)
+    if "retained_memory" in result:
+        line += "  retained {:7.0f} B/unit".format(
+            result["retained_memory"] / result["size"]
+        )
+    print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Translate Toolkit.")
     parser.add_argument(
         "podir",
         metavar="DIR",
@@ -126,8 +1155,6 @@ if __name__ == "__main__":
     parser.add_argument(
         "--store-type",
         dest="storetype",
-        action="store_const",
-        const="po",
         default="po",
         help="type of the store to benchmark (default: %(default)s)",
     )
@@ -143,12 +1170,127 @@ if __name__ == "__main__":
         action="store_true",
         help="benchmark placeables",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--check-cache",
+        dest="check_cache",
+        action="store_true",
+        help="benchmark factory.getobject with and without the binary cache (writes cache files next to the store files)",
+    )
+    parser.add_argument(
+        "--compare-po-parsers",
+        dest="compare_po_parsers",
+        action="store_true",
+        help="compare the fast and the regular PO parser (PO files only)",
+    )
+    parser.add_argument(
+        "--compare-decorations",
+        dest="compare_decorations",
+        action="store_true",
+        help="compare extracting the accelerators, variables and other "
+        "decorations checked by pofilter with the tokenizer and with a "
+        "search for every marker",
+    )
+    suite = parser.add_argument_group("benchmark suite")
+    suite.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        metavar="NAME",
+        help="run the named scenario, scenarios starting with a prefix like "
+        "'parse:', or 'all' (can be repeated)",
+    )
+    suite.add_argument(
+        "--list-scenarios",
+        dest="list_scenarios",
+        action="store_true",
+        help="list the available scenarios",
+    )
+    suite.add_argument(
+        "--size",
+        dest="sizes",
+        type=int,
+        nargs="+",
+        default=[1000],
+        help="number of units of the generated data (default: %(default)s)",
+    )
+    suite.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed of the generated data (default: %(default)s)",
+    )
+    suite.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="number of untimed runs (default: %(default)s)",
+    )
+    suite.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed runs (default: %(default)s)",
+    )
+    suite.add_argument(
+        "--no-memory",
+        dest="measure_memory",
+        action="store_false",
+        help="do not measure the peak memory",
+    )
+    suite.add_argument(
+        "--imports",
+        dest="imports",
+        action="store_true",
+        help="measure the import time of every console script, repeated "
+        "--repeat times",
+    )
+    suite.add_argument(
+        "--json",
+        dest="json_file",
+        metavar="FILE",
+        help="write the results as JSON to FILE",
+    )
+    args = parser.parse_args(argv)
+
+    if args.list_scenarios:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:24} {scenario.description}")
+        return
+
+    if args.imports:
+        report = run_import_times(args.repeat)
+        if args.json_file:
+            with open(args.json_file, "w") as fh:
+                json.dump(report, fh, indent=2)
+        return
+
+    if args.scenarios:
+        try:
+            names = select_scenarios(args.scenarios)
+        except ValueError as e:
+            parser.error(str(e))
+        report = run_suite(
+            names,
+            args.sizes,
+            seed=args.seed,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            measure_memory=args.measure_memory,
+        )
+        if args.json_file:
+            with open(args.json_file, "w") as fh:
+                json.dump(report, fh, indent=2)
+        return
 
     storetype = args.storetype
+    extension = None
 
-    if storetype in factory.classes_str:
-        _module, _class = factory.classes_str[storetype]
+    if storetype in STORE_TYPES:
+        _module, _class, extension = STORE_TYPES[storetype]
+        module = import_module("translate.storage.%s" % _module)
+        storeclass = getattr(module, _class)
+    elif storetype in factory._classes_str:
+        _module, _class = factory._classes_str[storetype]
         module = import_module("translate.storage.%s" % _module)
         storeclass = getattr(module, _class)
     else:
@@ -179,7 +1321,7 @@ if __name__ == "__main__":
     ]
 
     for sample_file_sizes in sample_files:
-        benchmarker = TranslateBenchmarker("BenchmarkDir", storeclass)
+        benchmarker = TranslateBenchmarker("BenchmarkDir", storeclass, extension)
         benchmarker.clear_test_dir()
         if args.podir is None:
             benchmarker.create_sample_files(*sample_file_sizes)
@@ -192,14 +1334,35 @@ if __name__ == "__main__":
         if args.check_placeables:
             methods.append(("parse_placeables", ""))
 
+        if args.compare_po_parsers:
+            benchmarker.compare_po_parsers(file_dir=args.podir)
+
+        if args.compare_decorations:
+            benchmarker.compare_decorations()
+
+        if args.check_cache:
+            # Writes the caches, which are then used by the second run
+            benchmarker.getobject_files(file_dir=args.podir, use_cache=True)
+            methods.append(("getobject_files", "file_dir=args.podir"))
+            methods.append(("getobject_files", "file_dir=args.podir, use_cache=True"))
+
         for methodname, methodparam in methods:
             print("_______________________________________________________")
             statsfile = (
                 f"{methodname}_{storetype}"
                 + "_%d_%d_%d_%d_%d.stats" % sample_file_sizes
             )
-            cProfile.run(f"benchmarker.{methodname}({methodparam})", statsfile)
+            cProfile.runctx(
+                f"benchmarker.{methodname}({methodparam})",
+                globals(),
+                locals(),
+                statsfile,
+            )
             stats = pstats.Stats(statsfile)
             stats.sort_stats("time").print_stats(20)
             print("_______________________________________________________")
         benchmarker.clear_test_dir()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+#
+# Copyright 2023 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Compact binary cache for parsed translation stores.
+
+The cache keeps the format independent parts of every unit (source and
+target including plurals, context, id, locations, notes and state) in a
+versioned binary file written next to the original file.  It does not use
+:mod:`pickle`, so loading a cache never executes code.
+
+:meth:`cachestore.tostore` rebuilds a store of the original class from the
+unit records through the common unit API.  The formatting of the original
+file and anything the unit API does not return (like the inline markup of
+XLIFF) is not kept, so a rebuilt store is meant for reading its units.  When
+the cache is written, the rebuilt store is compared with the original one and
+the cache is only marked as complete if both have the same units; only
+complete caches are used by :func:`translate.storage.factory.getobject`.
+
+The layout of a cache file (all integers are little endian) is:
+
+============  ==============================================================
+Field         Description
+============  ==============================================================
+header        ``<4sHHqqI``: magic ``TTKC``, version, flags (``CACHE_COMPLETE``),
+              mtime (ns) and size of the original file, number of units
+metadata      source language, target language, encoding and class of the
+              store (strings)
+offsets       one ``<Q`` per unit with the file offset of its record
+records       per unit: ``<BiHHH`` flags, state and the number of source,
+              target and location strings, followed by the ``<I`` lengths
+              of all strings and their concatenated UTF-8 data
+============  ==============================================================
+
+Metadata strings are stored as a ``<I`` byte length followed by UTF-8 data.
+The strings of a unit record are source strings, target strings, context,
+id, locations, notes, translator notes and developer notes; their lengths are counted in characters so that the
+whole record is decoded with a single call.  ``0xFFFFFFFF`` as a length and
+``0xFFFF`` as a number of strings represent ``None``.
+
+The cache file is memory mapped when loaded and units are only decoded when
+they are accessed.
+"""
+
+import mmap
+import os
+import struct
+from io import BytesIO
+
+from translate.misc.multistring import multistring
+from translate.storage import base
+
+
+CACHE_MAGIC = b"TTKC"
+CACHE_VERSION = 3
+CACHE_SUFFIX = ".ttkcache"
+
+_HEADER = struct.Struct("<4sHHqqI")
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_UNIT = struct.Struct("<BiHHH")
+_NONE = 0xFFFFFFFF
+_NONE_LIST = 0xFFFF
+
+CACHE_COMPLETE = 1
+"""Header flag of caches which rebuild a store with the same units."""
+
+FLAG_FUZZY = 1
+FLAG_OBSOLETE = 2
+FLAG_HEADER = 4
+FLAG_SOURCE_PLURAL = 8
+FLAG_TARGET_PLURAL = 16
+
+
+class CacheError(ValueError):
+    """Raised when a cache file is invalid or of an unsupported version."""
+
+
+def cache_path(filename):
+    """Return the name of the cache file belonging to ``filename``."""
+    return filename + CACHE_SUFFIX
+
+
+def _pack_string(value):
+    if value is None:
+        return _LENGTH.pack(_NONE)
+    data = str(value).encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def _classname(storeclass):
+    return f"{storeclass.__module__}.{storeclass.__qualname__}"
+
+
+def _multistring_strings(value):
+    """Return the list of strings and plural flag for a source or target."""
+    if value is None:
+        return None, False
+    if isinstance(value, multistring):
+        return list(value.strings), len(value.strings) > 1
+    return [value], False
+
+
+def _unit_notes(unit):
+    """Return all notes, translator notes and developer notes of ``unit``."""
+    notes = [unit.getnotes()]
+    for origin in ("translator", "developer"):
+        try:
+            notes.append(unit.getnotes(origin))
+        except ValueError:
+            notes.append(None)
+    return notes
+
+
+def _pack_unit(unit):
+    source, source_plural = _multistring_strings(unit.source)
+    target, target_plural = _multistring_strings(unit.target)
+    locations = unit.getlocations()
+    flags = 0
+    if unit.isfuzzy():
+        flags |= FLAG_FUZZY
+    if unit.isobsolete():
+        flags |= FLAG_OBSOLETE
+    if unit.isheader():
+        flags |= FLAG_HEADER
+    if source_plural:
+        flags |= FLAG_SOURCE_PLURAL
+    if target_plural:
+        flags |= FLAG_TARGET_PLURAL
+    strings = (
+        (source or [])
+        + (target or [])
+        + [unit.getcontext(), unit.getid()]
+        + list(locations)
+        + _unit_notes(unit)
+    )
+    strings = [None if string is None else str(string) for string in strings]
+    lengths = [_NONE if string is None else len(string) for string in strings]
+    return b"".join(
+        (
+            _UNIT.pack(
+                flags,
+                int(unit.get_state_n()),
+                _NONE_LIST if source is None else len(source),
+                _NONE_LIST if target is None else len(target),
+                len(locations),
+            ),
+            struct.pack("<%dI" % len(lengths), *lengths),
+            "".join(string for string in strings if string).encode("utf-8"),
+        )
+    )
+
+
+def _write_store(out, store, mtime, size, flags=0):
+    """Write the cache of ``store`` for an original file of the given
+    modification time and size to ``out``.
+    """
+    if isinstance(store, cachestore):
+        storeclass = store._storeclass
+    else:
+        storeclass = _classname(type(store))
+    records = [_pack_unit(unit) for unit in store.units]
+    head = b"".join(
+        (
+            _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, flags, mtime, size, len(records)),
+            _pack_string(store.getsourcelanguage()),
+            _pack_string(store.gettargetlanguage()),
+            _pack_string(store.encoding),
+            _pack_string(storeclass),
+        )
+    )
+    offset = len(head) + _OFFSET.size * len(records)
+    offsets = []
+    for record in records:
+        offsets.append(_OFFSET.pack(offset))
+        offset += len(record)
+    out.write(head)
+    out.write(b"".join(offsets))
+    out.write(b"".join(records))
+
+
+def _is_complete(store, data, mtime, size):
+    """Check whether the cache ``data`` of ``store`` rebuilds the same units."""
+    cached = cachestore()
+    cached._load(data)
+    out = BytesIO()
+    try:
+        _write_store(out, cached.tostore(type(store)), mtime, size)
+    except Exception:
+        # Stores which can not be built through the unit API are not
+        # rebuilt from their cache
+        return False
+    return out.getvalue() == data
+
+
+def write_cache(store, filename, cachefile=None):
+    """Write the cache for ``store`` which was parsed from ``filename``.
+
+    The cache is first written to a temporary file which then atomically
+    replaces the previous cache.
+
+    :return: The name of the cache file.
+    """
+    if cachefile is None:
+        cachefile = cache_path(filename)
+    stat = os.stat(filename)
+    out = BytesIO()
+    _write_store(out, store, stat.st_mtime_ns, stat.st_size)
+    if _is_complete(store, out.getvalue(), stat.st_mtime_ns, stat.st_size):
+        out.seek(0)
+        out.write(
+            _HEADER.pack(
+                CACHE_MAGIC,
+                CACHE_VERSION,
+                CACHE_COMPLETE,
+                stat.st_mtime_ns,
+                stat.st_size,
+                len(store.units),
+            )
+        )
+    tmpname = f"{cachefile}.{os.getpid()}.tmp"
+    try:
+        with open(tmpname, "wb") as fh:
+            fh.write(out.getvalue())
+        os.replace(tmpname, cachefile)
+    finally:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+    return cachefile
+
+
+def is_fresh(filename, cachefile=None):
+    """Check whether the cache of ``filename`` exists and is up to date."""
+    if cachefile is None:
+        cachefile = cache_path(filename)
+    try:
+        stat = os.stat(filename)
+        with open(cachefile, "rb") as fh:
+            header = fh.read(_HEADER.size)
+    except OSError:
+        return False
+    if len(header) != _HEADER.size:
+        return False
+    magic, version, _flags, mtime, size, _count = _HEADER.unpack(header)
+    return (
+        magic == CACHE_MAGIC
+        and version == CACHE_VERSION
+        and mtime == stat.st_mtime_ns
+        and size == stat.st_size
+    )
+
+
+def load_cache(filename, cachefile=None):
+    """Load the cache of ``filename`` if it is fresh.
+
+    :return: A :class:`cachestore` or None if there is no usable cache.
+    """
+    if cachefile is None:
+        cachefile = cache_path(filename)
+    if not is_fresh(filename, cachefile):
+        return None
+    try:
+        store = cachestore(cachefile)
+    except (OSError, CacheError):
+        return None
+    store.filename = filename
+    return store
+
+
+class cacheunit(base.TranslationUnit):
+    """A read mostly unit loaded from a store cache."""
+
+    def __init__(self, source=None):
+        super().__init__(source)
+        self._flags = 0
+        self._context = None
+        self._id = None
+        self._locations = []
+        self._translator_notes = None
+        self._developer_notes = None
+
+    def getcontext(self):
+        return self._context
+
+    def setcontext(self, context):
+        self._context = context
+
+    def getid(self):
+        if self._id is None:
+            return self.source
+        return self._id
+
+    def setid(self, value):
+        self._id = value
+
+    def getlocations(self):
+        return self._locations
+
+    def addlocation(self, location):
+        self._locations.append(location)
+
+    def getnotes(self, origin=None):
+        if origin == "translator":
+            notes = self._translator_notes
+        elif origin in ("programmer", "developer", "source code"):
+            notes = self._developer_notes
+        else:
+            notes = None
+        if notes is None:
+            return self.notes
+        return notes
+
+    def isfuzzy(self):
+        return bool(self._flags & FLAG_FUZZY)
+
+    def markfuzzy(self, value=True):
+        if value:
+            self._flags |= FLAG_FUZZY
+        else:
+            self._flags &= ~FLAG_FUZZY
+
+    def isobsolete(self):
+        return bool(self._flags & FLAG_OBSOLETE)
+
+    def makeobsolete(self):
+        self._flags |= FLAG_OBSOLETE
+
+    def isheader(self):
+        return bool(self._flags & FLAG_HEADER)
+
+    def hasplural(self):
+        return bool(self._flags & FLAG_SOURCE_PLURAL)
+
+    def get_state_n(self):
+        return self._state_n
+
+    def copyto(self, unit):
+        """Copy the cached values to ``unit`` which has the same source."""
+        if self.target:
+            unit.target = self.target
+        if self._context:
+            unit.setcontext(self._context)
+        for location in self._locations:
+            unit.addlocation(location)
+        # After the locations, which are the ids of some formats
+        if self._id is not None and unit.getid() != self._id:
+            unit.setid(self._id)
+        if self._translator_notes == self._developer_notes:
+            # The notes do not depend on their origin
+            if self.notes:
+                unit.addnote(self.notes)
+        else:
+            if self._developer_notes:
+                unit.addnote(self._developer_notes, origin="developer")
+            if self._translator_notes:
+                unit.addnote(self._translator_notes, origin="translator")
+        if unit.get_state_n() != self._state_n:
+            unit.set_state_n(self._state_n)
+        if unit.isfuzzy() != self.isfuzzy():
+            unit.markfuzzy(self.isfuzzy())
+        if self.isobsolete():
+            unit.makeobsolete()
+
+
+class cachestore(base.TranslationStore):
+    """A store backed by a memory mapped cache file."""
+
+    UnitClass = cacheunit
+    Name = "Translate Toolkit store cache"
+    Extensions = [CACHE_SUFFIX[1:]]
+    _binary = True
+
+    def __init__(self, cachefile=None, **kwargs):
+        super().__init__(**kwargs)
+        self.filename = ""
+        self._map = None
+        self._offsets = ()
+        self._units = []
+        self.complete = False
+        self._flags = 0
+        self._mtime = 0
+        self._size = 0
+        self._storeclass = None
+        if cachefile is not None:
+            self.open(cachefile)
+
+    def open(self, cachefile):
+        """Memory map ``cachefile`` and read its header and offset table."""
+        with open(cachefile, "rb") as fh:
+            self._load(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _load(self, data):
+        """Read the header and offset table of the cache ``data``."""
+        self._map = data
+        if len(data) < _HEADER.size:
+            raise CacheError("Truncated cache file")
+        magic, version, flags, mtime, size, count = _HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC:
+            raise CacheError("This is not a store cache file")
+        if version != CACHE_VERSION:
+            raise CacheError("Unsupported cache version %d" % version)
+        self.complete = bool(flags & CACHE_COMPLETE)
+        self._flags = flags
+        self._mtime = mtime
+        self._size = size
+        pos = _HEADER.size
+        self.sourcelanguage, pos = self._read_string(pos)
+        self.targetlanguage, pos = self._read_string(pos)
+        self.encoding, pos = self._read_string(pos)
+        self._storeclass, pos = self._read_string(pos)
+        try:
+            self._offsets = struct.unpack_from("<%dQ" % count, data, pos)
+        except struct.error:
+            raise CacheError("Truncated cache file")
+        self._units = None
+
+    def close(self):
+        """Materialize all units and release the memory map."""
+        if self._map is not None:
+            self._units = self.units
+            if isinstance(self._map, mmap.mmap):
+                self._map.close()
+            self._map = None
+
+    def tostore(self, storeclass):
+        """Rebuild the cached store as an instance of ``storeclass``.
+
+        The units are built from their records through the common unit API,
+        :attr:`complete` tells whether they are the same as the units of the
+        original store.
+
+        :return: The rebuilt store or None if the cache was written from a
+            store of another class.
+        """
+        if self._storeclass != _classname(storeclass):
+            return None
+        store = storeclass()
+        # Drop the units created with a new store, like the default PO header
+        if store.units:
+            store.units = []
+        if store.encoding != self.encoding:
+            store.encoding = self.encoding
+        for cached in self.unit_iter():
+            unit = store.UnitClass(cached.source)
+            cached.copyto(unit)
+            store.addunit(unit)
+        if self.sourcelanguage and store.getsourcelanguage() != self.sourcelanguage:
+            store.setsourcelanguage(self.sourcelanguage)
+        if self.targetlanguage and store.gettargetlanguage() != self.targetlanguage:
+            store.settargetlanguage(self.targetlanguage)
+        store.filename = self.filename
+        return store
+
+    @property
+    def units(self):
+        if self._units is None:
+            self._units = [self._read_unit(i) for i in range(len(self._offsets))]
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        self._units = value
+
+    def unit_iter(self):
+        if self._units is not None:
+            yield from self._units
+        else:
+            for i in range(len(self._offsets)):
+                yield self._read_unit(i)
+
+    def _read_string(self, pos):
+        (length,) = _LENGTH.unpack_from(self._map, pos)
+        pos += _LENGTH.size
+        if length == _NONE:
+            return None, pos
+        return str(self._map[pos : pos + length], "utf-8"), pos + length
+
+    def _read_unit(self, index):
+        pos = self._offsets[index]
+        flags, state_n, nsource, ntarget, nlocations = _UNIT.unpack_from(self._map, pos)
+        pos += _UNIT.size
+        nstrings = (
+            (0 if nsource == _NONE_LIST else nsource)
+            + (0 if ntarget == _NONE_LIST else ntarget)
+            + nlocations
+            + 5
+        )
+        lengths = struct.unpack_from("<%dI" % nstrings, self._map, pos)
+        pos += _LENGTH.size * nstrings
+        if index + 1 < len(self._offsets):
+            end = self._offsets[index + 1]
+        else:
+            end = len(self._map)
+        text = str(self._map[pos:end], "utf-8")
+        strings = []
+        start = 0
+        for length in lengths:
+            if length == _NONE:
+                strings.append(None)
+            else:
+                strings.append(text[start : start + length])
+                start += length
+
+        unit = self.UnitClass()
+        unit._flags = flags
+        unit._state_n = state_n
+        pos = 0
+        if nsource != _NONE_LIST:
+            source = strings[:nsource]
+            pos = nsource
+            unit.source = (
+                multistring(source) if flags & FLAG_SOURCE_PLURAL else source[0]
+            )
+        if ntarget != _NONE_LIST:
+            target = strings[pos : pos + ntarget]
+            pos += ntarget
+            unit.target = (
+                multistring(target) if flags & FLAG_TARGET_PLURAL else target[0]
+            )
+        unit._context, unit._id = strings[pos : pos + 2]
+        pos += 2
+        unit._locations = strings[pos : pos + nlocations]
+        (
+            unit.notes,
+            unit._translator_notes,
+            unit._developer_notes,
+        ) = strings[pos + nlocations :]
+        unit._store = self
+        return unit
+
+    def parse(self, input):
+        """Load the cache from a file (memory mapped if possible) or bytes."""
+        if hasattr(input, "name"):
+            self.filename = input.name
+        if not isinstance(input, bytes):
+            try:
+                data = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                data = input.read()
+            input = data
+        self._load(input)
+
+    def serialize(self, out):
+        _write_store(out, self, self._mtime, self._size, self._flags)
@@ -300,6 +300,12 @@ class dtdunit(base.TranslationUnit):
 
     def parse(self, dtdsrc):
         """read the first dtd element from the source code into this object, return linesprocessed"""
+        return self.parselines(dtdsrc.split("\n"))
+
+    def parselines(self, lines, start=0, end=None):
+        """read the first dtd element from ``lines[start:end]`` (without their
+        line endings) into this object, return linesprocessed
+        """
         self.comments = []
         # make all the lists the same
         self._locfilenotes = self.comments
@@ -313,13 +319,15 @@ class dtdunit(base.TranslationUnit):
         # self.comments = []
         self.entity = None
         self.definition = ""
-        if not dtdsrc:
+        if end is None:
+            end = len(lines)
+        if start >= end or (end - start == 1 and not lines[start]):
+            # Nothing but an empty line
             return 0
-        lines = dtdsrc.split("\n")
         linesprocessed = 0
         comment = ""
-        for line in lines:
-            line += "\n"
+        for index in range(start, end):
+            line = lines[index] + "\n"
             linesprocessed += 1
             if not self.incomment:
                 if line.find("<!--") != -1:
@@ -542,11 +550,16 @@ class dtdfile(base.TranslationStore):
 
     UnitClass = dtdunit
 
-    def __init__(self, inputfile=None, android=False):
-        """construct a dtdfile, optionally reading in from inputfile"""
+    def __init__(self, inputfile=None, android=False, validate=False):
+        """construct a dtdfile, optionally reading in from inputfile
+
+        :param validate: Check the whole output with lxml when serializing
+            and write nothing if it does not validate.
+        """
         super().__init__()
         self.filename = getattr(inputfile, "name", "")
         self.android = android
+        self.validate = validate
         if inputfile is not None:
             dtdsrc = inputfile.read()
             self.parse(dtdsrc)
@@ -556,6 +569,16 @@ class dtdfile(base.TranslationStore):
         start = 0
         end = 0
         lines = dtdsrc.split(b"\n")
+        # Decode every line once; lines that can't be decoded are None and
+        # make the units containing them fail like a decoding of their lines
+        decoded = []
+        undecodable = [0]
+        for line in lines:
+            try:
+                decoded.append(line.decode(self.encoding))
+            except UnicodeDecodeError:
+                decoded.append(None)
+            undecodable.append(undecodable[-1] + (decoded[-1] is None))
         while end < len(lines):
             if start == end:
                 end += 1
@@ -574,9 +597,12 @@ class dtdfile(base.TranslationStore):
             while linesprocessed >= 1:
                 newdtd = dtdunit(android=self.android)
                 try:
-                    linesprocessed = newdtd.parse(
-                        (b"\n".join(lines[start:end])).decode(self.encoding)
-                    )
+                    if undecodable[end] == undecodable[start]:
+                        linesprocessed = newdtd.parselines(decoded, start, end)
+                    else:
+                        linesprocessed = newdtd.parse(
+                            (b"\n".join(lines[start:end])).decode(self.encoding)
+                        )
                     if linesprocessed >= 1 and (
                         not newdtd.isblank() or newdtd.unparsedlines
                     ):
@@ -590,14 +616,15 @@ class dtdfile(base.TranslationStore):
 
     def serialize(self, out):
         """Write content to file"""
-        content = b""
-        for dtd in self.units:
-            unit_str = str(dtd).encode(self.encoding)
-            out.write(unit_str)
-            content += unit_str
+        if not self.validate:
+            for dtd in self.units:
+                out.write(str(dtd).encode(self.encoding))
+            return
+        content = b"".join(str(dtd).encode(self.encoding) for dtd in self.units)
         if not self._valid_store(content):
             warnings.warn("DTD file '%s' does not validate" % self.filename)
-            out.truncate(0)
+            return
+        out.write(content)
 
     def _valid_store(self, content):
         """Validate the store to determine if it is valid
@@ -22,6 +22,7 @@ import os
 from functools import lru_cache
 from importlib import import_module
 
+from translate.misc import instrumentation
 from translate.storage.base import TranslationStore
 from translate.storage.directory import Directory
 
@@ -56,6 +57,7 @@ _classes_str = {
     "xlf": ("xliff", "xlifffile"),
     "sdlxliff": ("xliff", "xlifffile"),
     "ftl": ("fluent", "FluentFile"),
+    "json": ("jsonl10n", "JsonFile"),
 }
 ###  XXX:  if you add anything here, you must also add it to translate.storage.
 
@@ -195,6 +197,7 @@ def getclass(
     return storeclass
 
 
+@instrumentation.instrumented("factory.getobject")
 def getobject(
     storefile,
     localfiletype=None,
@@ -202,11 +205,17 @@ def getobject(
     classes=None,
     classes_str=None,
     hiddenclasses=None,
+    use_cache=False,
 ):
     """Factory that returns a usable object for the type of file presented.
 
     :type storefile: file or str or TranslationStore
     :param storefile: File object or file name.
+    :param use_cache: Rebuild the store from the units in a fresh binary
+        cache next to the file (see :mod:`translate.storage.cache`) and write
+        one after parsing otherwise.  Only applies to uncompressed file
+        names.  The rebuilt store is meant for reading, it does not keep the
+        formatting of the file.
 
     Specify ignore to ignore some part at the back of the name (like .gz).
     """
@@ -234,6 +243,24 @@ def getobject(
         if ext in decompressclass:
             _file = import_class(*decompressclass[ext])
             storefile = _file(storefilename)
+            use_cache = False
+        if use_cache and isinstance(storefile, str):
+            from translate.storage import cache
+
+            cached = cache.load_cache(storefile)
+            if cached is not None and cached.complete:
+                store = cached.tostore(storeclass)
+                if store is not None:
+                    instrumentation.count("factory.cache_hits")
+                    return store
+            instrumentation.count("factory.cache_misses")
+            store = storeclass.parsefile(storefile)
+            if cached is None:
+                try:
+                    cache.write_cache(store, storefile)
+                except OSError:
+                    pass
+            return store
         store = storeclass.parsefile(storefile)
     else:
         store = storeclass()
@@ -241,6 +268,36 @@ def getobject(
     return store
 
 
+def iterunits(storefile, localfiletype=None, ignore=None, classes_str=None):
+    """Iterates over the units of the given file.
+
+    Stores which support it (like TMX and XLIFF, see
+    :meth:`translate.storage.lisa.LISAfile.iterparse`, or JSON, see
+    :meth:`translate.storage.jsonl10n.JsonFile.iterparse`) are parsed
+    incrementally, so that the memory needed does not depend on the size of
+    the file.  Other stores (and compressed files) are parsed completely.
+
+    :type storefile: file or str
+    :param storefile: File object or file name.
+    """
+    if isinstance(storefile, str) and os.path.isdir(storefile):
+        yield from Directory(storefile).unit_iter()
+        return
+    storeclass = getclass(storefile, localfiletype, ignore, classes_str=classes_str)
+    storefilename = _getname(storefile)
+    ext = os.path.splitext(storefilename)[1][len(os.path.extsep) :].lower()
+    iterparse = getattr(storeclass, "iterparse", None)
+    if iterparse is None or ext in decompressclass:
+        yield from getobject(
+            storefile, localfiletype, ignore, classes_str=classes_str
+        ).unit_iter()
+    elif isinstance(storefile, str):
+        with open(storefile, "rb") as fileobj:
+            yield from storeclass().iterparse(fileobj)
+    else:
+        yield from storeclass().iterparse(storefile)
+
+
 supported = [
     (
         "Gettext PO file",
@@ -271,6 +328,7 @@ supported = [
     ("UTX Dictionary", ["utx"], ["text/x-utx"]),
     ("Haiku catkeys file", ["catkeys"], ["application/x-catkeys"]),
     ("Fluent file", ["ftl"], []),
+    ("JSON file", ["json"], ["application/json"]),
 ]
 
 
@@ -19,6 +19,7 @@
 
 """module for parsing html files for translation"""
 
+import codecs
 import html.parser
 import re
 from html.entities import html5
@@ -134,7 +135,21 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         re.VERBOSE | re.IGNORECASE,
     )
 
-    def __init__(self, inputfile=None, callback=None):
+    HEAD_END_RE = re.compile(rb"</head\s*>|<body[\s>]", re.IGNORECASE)
+
+    CHUNK_SIZE = 65536
+    """Number of bytes read at once when parsing a file."""
+
+    SNIFF_SIZE = 65536
+    """Number of bytes at the start of a document searched for its encoding."""
+
+    def __init__(self, inputfile=None, callback=None, output=None):
+        """
+        :param callback: Function returning the translation of a string, used
+            to build the translated document.
+        :param output: Text stream the translated document is written to
+            while parsing, instead of keeping it in :attr:`filesrc`.
+        """
         super().__init__(convert_charrefs=False)
         base.TranslationStore.__init__(self)
 
@@ -146,16 +161,22 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.callback = callback
 
         # initialize state
-        self.filesrc = ""
+        self._filesrc = []
+        self._write_output = self._filesrc.append if output is None else output.write
         self.tag_path = []
         self.tu_content = []
         self.tu_location = None
+        self._translatable_elements = frozenset(self.TRANSLATABLE_ELEMENTS)
+        self._empty_elements = frozenset(self.EMPTY_HTML_ELEMENTS)
 
         # parse
         if inputfile is not None:
-            htmlsrc = inputfile.read()
-            inputfile.close()
-            self.parse(htmlsrc)
+            self.parse_file(inputfile)
+
+    @property
+    def filesrc(self):
+        """The translated document, unless it was written to an output."""
+        return "".join(self._filesrc)
 
     @staticmethod
     def _simple_callback(string):
@@ -164,11 +185,16 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
     def guess_encoding(self, htmlsrc):
         """Returns the encoding of the html text.
 
-        We look for 'charset=' within a meta tag to do this.
+        We look for 'charset=' within a meta tag of the document head to do
+        this, only the first :attr:`SNIFF_SIZE` bytes are searched.
         """
-        result = self.ENCODING_RE.findall(htmlsrc)
+        end = min(len(htmlsrc), self.SNIFF_SIZE)
+        head_end = self.HEAD_END_RE.search(htmlsrc, 0, end)
+        if head_end:
+            end = head_end.start()
+        result = self.ENCODING_RE.search(htmlsrc, 0, end)
         if result:
-            self.encoding = result[0].decode("ascii")
+            self.encoding = result.group(1).decode("ascii")
         return self.encoding
 
     def do_encoding(self, htmlsrc):
@@ -178,7 +204,56 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
 
     def parse(self, htmlsrc):
         htmlsrc = self.do_encoding(htmlsrc)
-        self.feed(htmlsrc)
+        self.feed_text(htmlsrc)
+
+    def parse_file(self, inputfile):
+        """Parse inputfile in chunks, without reading it into memory first.
+
+        The encoding is guessed once the document head, or the first
+        :attr:`SNIFF_SIZE` bytes of a document without head, have been read.
+        The text is fed to the parser up to the last ``<`` of every chunk, so
+        the parser sees the same text and markup pieces as when parsing the
+        whole document at once.
+        """
+        head = bytearray()
+        while len(head) < self.SNIFF_SIZE:
+            chunk = inputfile.read(min(self.CHUNK_SIZE, self.SNIFF_SIZE - len(head)))
+            if not chunk:
+                break
+            start = max(0, len(head) - 16)
+            head += chunk
+            if self.HEAD_END_RE.search(head, start):
+                break
+        head = bytes(head)
+        self.guess_encoding(head)
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        pending = decoder.decode(head)
+        while chunk:
+            chunk = inputfile.read(self.CHUNK_SIZE)
+            pending += decoder.decode(chunk, final=not chunk)
+            split = pending.rfind("<")
+            if split > 0:
+                self.feed_text(pending[:split])
+                pending = pending[split:]
+        inputfile.close()
+        if pending:
+            self.feed_text(pending)
+
+    def feed_text(self, text):
+        """Feed text to the parser.
+
+        HTMLParser stops at a ``&#`` which is not a character reference and
+        waits for more data, so parsing is resumed as long as it progresses.
+        Otherwise the rest of a document would only be parsed if it happens
+        to be fed separately.
+        """
+        self.feed(text)
+        remaining = len(self.rawdata)
+        while remaining:
+            self.goahead(0)
+            if len(self.rawdata) == remaining:
+                break
+            remaining = len(self.rawdata)
 
     def begin_translation_unit(self):
         # at the start of a translation unit:
@@ -186,12 +261,14 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         # and prepare for the new.
         self.emit_translation_unit()
         self.tu_content = []
-        self.tu_location = "%s+%s:%d-%d" % (
-            self.filename,
-            ".".join(self.tag_path),
-            self.getpos()[0],
-            self.getpos()[1] + 1,
-        )
+        # The location is only formatted if a unit is created
+        self.tu_location = (tuple(self.tag_path), self.getpos())
+
+    def format_location(self, tag_path, pos, attrname=None):
+        path = ".".join(tag_path)
+        if attrname is not None:
+            path += "[" + attrname + "]"
+        return "%s+%s:%d-%d" % (self.filename, path, pos[0], pos[1] + 1)
 
     def end_translation_unit(self):
         # at the end of a translation unit:
@@ -207,7 +284,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.tu_content.append(markup)
         else:
             self.emit_attribute_translation_units(markup)
-            self.filesrc += markup["html_content"]
+            self._write_output(markup["html_content"])
 
     def emit_translation_unit(self):
         # scan through the queue:
@@ -221,7 +298,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         tag = None
         do_normalize = True
         for pos, content in enumerate(self.tu_content):
-            if content["type"] != "endtag" and tag in self.EMPTY_HTML_ELEMENTS:
+            if content["type"] != "endtag" and tag in self._empty_elements:
                 match = tagstack.pop()
                 tag = None
 
@@ -246,7 +323,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         if end == 0:
             for markup in self.tu_content:
                 self.emit_attribute_translation_units(markup)
-                self.filesrc += markup["html_content"]
+                self._write_output(markup["html_content"])
             return
 
         # scan the start and end tags captured between translatable content;
@@ -261,7 +338,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         for markup in self.tu_content[0:start]:
             if markup["type"] != "comment":
                 self.emit_attribute_translation_units(markup)
-                self.filesrc += markup["html_content"]
+                self._write_output(markup["html_content"])
 
         # emit captured markup elements
         if start < end:
@@ -280,7 +357,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             assert normalized_content  # shouldn't be here otherwise
 
             unit = self.addsourceunit(normalized_content)
-            unit.addlocation(self.tu_location)
+            unit.addlocation(self.format_location(*self.tu_location))
             comments = [
                 markup["note"]
                 for markup in self.tu_content
@@ -294,13 +371,13 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
                 + self.callback(normalized_content)
                 + self.get_trailing_whitespace(html_content)
             )
-            self.filesrc += html_content
+            self._write_output(html_content)
 
         # emit trailing uncaptured markup elements
         for markup in self.tu_content[end : len(self.tu_content)]:
             if markup["type"] != "comment":
                 self.emit_attribute_translation_units(markup)
-                self.filesrc += markup["html_content"]
+                self._write_output(markup["html_content"])
 
     @staticmethod
     def has_translatable_content(markup):
@@ -341,12 +418,8 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         if normalized_value:
             return {
                 "html_content": normalized_value,
-                "location": "%s+%s:%d-%d"
-                % (
-                    self.filename,
-                    ".".join(self.tag_path) + "[" + attrname + "]",
-                    self.getpos()[0],
-                    self.getpos()[1] + 1,
+                "location": self.format_location(
+                    self.tag_path, self.getpos(), attrname
                 ),
             }
 
@@ -379,7 +452,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         return "<{}{}{}>".format(tag, "".join(attr_strings), " /" if startend else "")
 
     def auto_close_empty_element(self):
-        if self.tag_path and self.tag_path[-1] in self.EMPTY_HTML_ELEMENTS:
+        if self.tag_path and self.tag_path[-1] in self._empty_elements:
             self.tag_path.pop()
 
     def get_leading_whitespace(self, str):
@@ -396,7 +469,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         self.auto_close_empty_element()
         self.tag_path.append(tag)
 
-        if tag in self.TRANSLATABLE_ELEMENTS:
+        if tag in self._translatable_elements:
             self.begin_translation_unit()
 
         translated_attrs = self.translate_attributes(attrs)
@@ -416,7 +489,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             raise ParseError(
                 "Mismatched tags: no more tags: line %s" % self.getpos()[0]
             )
-        if popped != tag and popped in self.EMPTY_HTML_ELEMENTS:
+        if popped != tag and popped in self._empty_elements:
             popped = self.tag_path.pop()
         if popped != tag:
             raise ParseError(
@@ -426,16 +499,16 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
 
         self.append_markup({"type": "endtag", "html_content": "</%s>" % tag})
 
-        if tag in self.TRANSLATABLE_ELEMENTS:
+        if tag in self._translatable_elements:
             self.end_translation_unit()
-            if any(t in self.TRANSLATABLE_ELEMENTS for t in self.tag_path):
+            if not self._translatable_elements.isdisjoint(self.tag_path):
                 self.begin_translation_unit()
 
     def handle_startendtag(self, tag, attrs):
         self.auto_close_empty_element()
         self.tag_path.append(tag)
 
-        if tag in self.TRANSLATABLE_ELEMENTS:
+        if tag in self._translatable_elements:
             self.begin_translation_unit()
 
         translated_attrs = self.translate_attributes(attrs)
@@ -447,9 +520,9 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         }
         self.append_markup(markup)
 
-        if tag in self.TRANSLATABLE_ELEMENTS:
+        if tag in self._translatable_elements:
             self.end_translation_unit()
-            if any(t in self.TRANSLATABLE_ELEMENTS for t in self.tag_path):
+            if not self._translatable_elements.isdisjoint(self.tag_path):
                 self.begin_translation_unit()
 
         self.tag_path.pop()
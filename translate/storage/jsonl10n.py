@@ -66,14 +66,109 @@ TODO:
 
 """
 
+import codecs
 import json
+import re
 import uuid
+from json.decoder import WHITESPACE, scanstring
 
 from translate.lang.data import cldr_plural_categories, plural_tags
 from translate.misc.multistring import multistring
 from translate.storage import base
 
 
+# Strings and brackets, to skip over objects and arrays
+SKIP_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[][{}]')
+WHITESPACE_CHARS = (" ", "\t", "\n", "\r")
+
+
+class JsonReader:
+    """Reads a JSON text value by value, without building the document.
+
+    Objects and arrays are walked with :meth:`items`, other values are
+    decoded with :meth:`json.JSONDecoder.raw_decode`.  Errors are raised as
+    :class:`json.JSONDecodeError`.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def error(self, msg):
+        raise json.JSONDecodeError(msg, self.text, self.pos)
+
+    def peek(self):
+        """Returns the first character of the next value, or '' at the end."""
+        char = self.text[self.pos : self.pos + 1]
+        if char in WHITESPACE_CHARS:
+            self.pos = WHITESPACE.match(self.text, self.pos).end()
+            char = self.text[self.pos : self.pos + 1]
+        return char
+
+    def value(self, pos=None):
+        """Decodes the next value, or the one at ``pos`` without moving."""
+        if pos is not None:
+            return self.decoder.raw_decode(self.text, pos)[0]
+        self.peek()
+        value, self.pos = self.decoder.raw_decode(self.text, self.pos)
+        return value
+
+    def skip(self):
+        """Skips the next object or array, returning where it starts.
+
+        It is not validated, this is left to the :meth:`items` walking it.
+        """
+        start = self.pos
+        depth = 0
+        for match in SKIP_RE.finditer(self.text, start):
+            token = match.group()
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    self.pos = match.end()
+                    return start
+        self.error("Unterminated value")
+
+    def items(self):
+        """Walks the next object or array.
+
+        Yields the keys of the object or the indexes of the array, each time
+        leaving its value to be read (or skipped) before the next one.
+        """
+        close = {"{": "}", "[": "]"}[self.peek()]
+        self.pos += 1
+        if self.peek() == close:
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            if close == "]":
+                yield index
+            elif self.peek() != '"':
+                self.error("Expecting property name enclosed in double quotes")
+            else:
+                key, self.pos = scanstring(self.text, self.pos + 1)
+                if self.peek() != ":":
+                    self.error("Expecting ':' delimiter")
+                self.pos += 1
+                yield key
+            index += 1
+            delimiter = self.peek()
+            if delimiter == close:
+                self.pos += 1
+                return
+            if delimiter != ",":
+                self.error("Expecting ',' delimiter")
+            self.pos += 1
+
+    def end(self):
+        if self.peek():
+            self.error("Extra data")
+
+
 class BaseJsonUnit(base.DictUnit):
     """A JSON entry"""
 
@@ -159,7 +254,6 @@ class JsonFile(base.DictStore):
         super().__init__(**kwargs)
         self._filter = filter
         self.filename = ""
-        self._file = ""
         self.dump_args = {
             "separators": (",", ": "),
             "indent": 4,
@@ -180,8 +274,20 @@ class JsonFile(base.DictStore):
     def serialize(self, out):
         units = self.get_root_node()
         self.serialize_units(units)
-        out.write(json.dumps(units, **self.dump_args).encode(self.encoding))
-        out.write(b"\n")
+        self._write_json(out, units)
+
+    def _write_json(self, out, data):
+        """Writes data to out in chunks instead of building the whole string."""
+        # The incremental encoder writes a byte order mark only once
+        encode = codecs.getincrementalencoder(self.encoding)().encode
+        chunks = []
+        for chunk in json.JSONEncoder(**self.dump_args).iterencode(data):
+            chunks.append(chunk)
+            if len(chunks) == 4096:
+                out.write(encode("".join(chunks)))
+                chunks = []
+        chunks.append("\n")
+        out.write(encode("".join(chunks), final=True))
 
     def _extract_units(
         self,
@@ -203,28 +309,68 @@ class JsonFile(base.DictStore):
         """
         if prev is None:
             prev = self.UnitClass.IdClass([])
+        # Leaves are handled directly instead of recursing for each of them
         if isinstance(data, dict):
             for k, v in data.items():
-                yield from self._extract_units(
-                    v, stop, prev + [("key", k)], k, None, data
-                )
+                if isinstance(v, (dict, list)):
+                    yield from self._extract_units(
+                        v, stop, prev + [("key", k)], k, None, data
+                    )
+                elif stop is None or k in stop:
+                    yield self._create_unit(v, prev + [("key", k)], k)
         elif isinstance(data, list):
             for i, item in enumerate(data):
-                yield from self._extract_units(
-                    item, stop, prev + [("index", i)], i, name_node, data
-                )
+                if isinstance(item, (dict, list)):
+                    yield from self._extract_units(
+                        item, stop, prev + [("index", i)], i, name_node, data
+                    )
+                elif stop is None or name_node in stop:
+                    yield self._create_unit(item, prev + [("index", i)], i)
         # apply filter
         elif prev.parts and (
             stop is None
             or (isinstance(last_node, dict) and name_node in stop)
             or (isinstance(last_node, list) and name_last_node in stop)
         ):
-            unit = self.UnitClass(data, name_node)
-            unit.set_unitid(prev)
-            yield unit
+            yield self._create_unit(data, prev, name_node)
 
-    def parse(self, input):
-        """parse the given file or file source string"""
+    def _create_unit(self, data, unitid, name_node):
+        unit = self.UnitClass(data, name_node)
+        unit.set_unitid(unitid)
+        return unit
+
+    def _stream_units(self, reader, stop=None, prev=None, name_node=None):
+        """Extracts the units like :meth:`_extract_units`, while reading them
+
+        :param reader: the :class:`JsonReader` positioned at the current branch
+        """
+        if prev is None:
+            prev = self.UnitClass.IdClass([])
+        char = reader.peek()
+        if char == "{":
+            for k in reader.items():
+                if reader.peek() in "{[":
+                    yield from self._stream_units(reader, stop, prev + [("key", k)], k)
+                    continue
+                v = reader.value()
+                if stop is None or k in stop:
+                    yield self._create_unit(v, prev + [("key", k)], k)
+        elif char == "[":
+            for i in reader.items():
+                if reader.peek() in "{[":
+                    yield from self._stream_units(
+                        reader, stop, prev + [("index", i)], i
+                    )
+                    continue
+                item = reader.value()
+                if stop is None or name_node in stop:
+                    yield self._create_unit(item, prev + [("index", i)], i)
+        else:
+            # A document which is a single value has no units
+            reader.value()
+
+    def _read_text(self, input):
+        """Returns the decoded JSON text of the given file or file source string"""
         if hasattr(input, "name"):
             self.filename = input.name
         elif not getattr(self, "filename", ""):
@@ -240,14 +386,49 @@ class JsonFile(base.DictStore):
             input, self.encoding = self.detect_encoding(input)
             if input is None:
                 raise base.ParseError(ValueError("Failed to decode JSON string."))
+        return input
+
+    def parse(self, input):
+        """parse the given file or file source string"""
+        input = self._read_text(input)
         try:
-            self._file = json.loads(input)
+            data = json.loads(input)
         except ValueError as e:
             raise base.ParseError(e)
+        # Release the decoded text before extracting the units, the parsed
+        # tree is not kept either once they are created
+        del input
 
-        for unit in self._extract_units(self._file, stop=self._filter):
+        for unit in self._extract_units(data, stop=self._filter):
             self.addunit(unit)
 
+    def iterparse(self, input):
+        """Parses the given file or file source string incrementally, yielding
+        its units.
+
+        Unlike :meth:`parse`, the parsed document is never built: each unit is
+        created as soon as its key is read and it is not added to
+        :attr:`units`.  A key repeated in an object yields a unit each time,
+        where :meth:`parse` only keeps the last value.
+
+        Stores with their own extraction of units are parsed completely.
+        """
+        extractor = next(
+            cls for cls in type(self).__mro__ if "_extract_units" in vars(cls)
+        )
+        if "_stream_units" not in vars(extractor):
+            self.parse(input)
+            yield from self.units
+            return
+        reader = JsonReader(self._read_text(input))
+        try:
+            for unit in self._stream_units(reader, stop=self._filter):
+                unit._store = self
+                yield unit
+            reader.end()
+        except json.JSONDecodeError as e:
+            raise base.ParseError(e)
+
 
 class JsonNestedUnit(BaseJsonUnit):
     def storevalues(self, output):
@@ -300,6 +481,10 @@ class WebExtensionJsonFile(JsonFile):
             unit.setid(item)
             yield unit
 
+    def _stream_units(self, reader, stop=None, prev=None, name_node=None):
+        for item in reader.items():
+            yield from self._extract_units({item: reader.value()})
+
 
 class I18NextUnit(JsonNestedUnit):
     """A i18next v3 format, JSON with plurals.
@@ -381,55 +566,95 @@ class I18NextFile(JsonNestedFile):
         if prev is None:
             prev = self.UnitClass.IdClass([])
         if isinstance(data, dict):
-            plurals_multiple = [
-                key.rsplit("_", 1)[0] for key in data if key.endswith("_0")
-            ]
-            plurals_simple = [
-                key.rsplit("_", 1)[0] for key in data if key.endswith("_plural")
-            ]
-            processed = set()
-
-            for k, v in data.items():
-                # Check already processed items
-                if k in processed:
-                    continue
-                plurals = []
-                plural_base = ""
-                if k in plurals_simple or k + "_plural" in plurals_simple:
-                    if k.endswith("_plural"):
-                        plural_base = k[:-7]
-                    else:
-                        plural_base = k
-                    plurals_simple.remove(plural_base)
-                    plurals = [k, k + "_plural"]
-                elif "_" in k:
-                    plural_base, digit = k.rsplit("_", 1)
-                    if plural_base in plurals_multiple and digit.isdigit():
-                        plurals_multiple.remove(plural_base)
-                        plurals = [f"{plural_base}_{order}" for order in range(10)]
-                if plurals:
-                    sources = []
-                    items = []
-                    for key in plurals:
-                        if key not in data:
-                            break
-                        processed.add(key)
-                        sources.append(data[key])
-                        items.append(key)
-                    unit = self.UnitClass(multistring(sources), items)
-                    newid = prev + [("key", plural_base)]
-                    unit.set_unitid(newid)
-                    yield unit
+            for k, plural_base, items in self._group_plurals(data):
+                if items:
+                    yield self._create_plural_unit(
+                        [data[key] for key in items], items, prev, plural_base
+                    )
                     continue
 
                 yield from self._extract_units(
-                    v, stop, prev + [("key", k)], k, None, data
+                    data[k], stop, prev + [("key", k)], k, None, data
                 )
         else:
             yield from super()._extract_units(
                 data, stop, prev, name_node, name_last_node, last_node
             )
 
+    def _stream_units(self, reader, stop=None, prev=None, name_node=None):
+        if reader.peek() != "{":
+            yield from super()._stream_units(reader, stop, prev, name_node)
+            return
+        if prev is None:
+            prev = self.UnitClass.IdClass([])
+        # The plurals depend on the other keys of the object, so its values are
+        # read first, skipping the nested objects and arrays until their turn
+        data = {}
+        nested = {}
+        for k in reader.items():
+            if reader.peek() in "{[":
+                nested[k] = reader.skip()
+                data[k] = None
+            else:
+                data[k] = reader.value()
+                nested.pop(k, None)
+        end = reader.pos
+        for k, plural_base, items in self._group_plurals(data):
+            if items:
+                sources = [
+                    reader.value(nested[key]) if key in nested else data[key]
+                    for key in items
+                ]
+                yield self._create_plural_unit(sources, items, prev, plural_base)
+            elif k in nested:
+                reader.pos = nested[k]
+                yield from self._stream_units(reader, stop, prev + [("key", k)], k)
+            elif stop is None or k in stop:
+                yield self._create_unit(data[k], prev + [("key", k)], k)
+        reader.pos = end
+
+    def _create_plural_unit(self, sources, items, prev, plural_base):
+        unit = self.UnitClass(multistring(sources), items)
+        unit.set_unitid(prev + [("key", plural_base)])
+        return unit
+
+    @staticmethod
+    def _group_plurals(data):
+        """Yields the keys of the dict with the base name and keys of the
+        plural they start, the other keys of the plurals are skipped.
+        """
+        plurals_multiple = [key.rsplit("_", 1)[0] for key in data if key.endswith("_0")]
+        plurals_simple = [
+            key.rsplit("_", 1)[0] for key in data if key.endswith("_plural")
+        ]
+        processed = set()
+
+        for k in data:
+            # Check already processed items
+            if k in processed:
+                continue
+            plurals = []
+            plural_base = ""
+            if k in plurals_simple or k + "_plural" in plurals_simple:
+                if k.endswith("_plural"):
+                    plural_base = k[:-7]
+                else:
+                    plural_base = k
+                plurals_simple.remove(plural_base)
+                plurals = [k, k + "_plural"]
+            elif "_" in k:
+                plural_base, digit = k.rsplit("_", 1)
+                if plural_base in plurals_multiple and digit.isdigit():
+                    plurals_multiple.remove(plural_base)
+                    plurals = [f"{plural_base}_{order}" for order in range(10)]
+            items = []
+            for key in plurals:
+                if key not in data:
+                    break
+                processed.add(key)
+                items.append(key)
+            yield k, plural_base, items
+
 
 class I18NextV4Unit(I18NextUnit):
     """A i18next v4 format, JSON with plurals.
@@ -624,8 +849,7 @@ class GoTextJsonFile(JsonFile):
             "language": self.gettargetlanguage(),
             "messages": units,
         }
-        out.write(json.dumps(file, **self.dump_args).encode(self.encoding))
-        out.write(b"\n")
+        self._write_json(out, file)
 
 
 class GoI18NJsonUnit(BaseJsonUnit):
@@ -689,8 +913,7 @@ class GoI18NJsonFile(JsonFile):
 
     def serialize(self, out):
         units = [unit.getvalue() for unit in self.units]
-        out.write(json.dumps(units, **self.dump_args).encode(self.encoding))
-        out.write(b"\n")
+        self._write_json(out, units)
 
 
 class ARBJsonUnit(BaseJsonUnit):
@@ -18,6 +18,9 @@
 
 """Parent class for LISA standards (TMX, TBX, XLIFF)"""
 
+import copy
+from io import BytesIO
+
 from lxml import etree
 
 from translate.misc.xml_helpers import (
@@ -84,6 +87,19 @@ class LISAunit(base.TranslationUnit):
                 return False
         return True
 
+    def copy(self):
+        """Make a copy of the translation unit.
+
+        Only the XML element of the unit is copied, without the rest of the
+        document.
+        """
+        new_unit = self.__class__(None, empty=True)
+        new_unit.xmlelement = copy.deepcopy(self.xmlelement)
+        new_unit.xmlelement.tail = None
+        if "namespace" in self.__dict__:
+            new_unit.namespace = self.namespace
+        return new_unit
+
     def namespaced(self, name):
         """Returns name in Clark notation.
 
@@ -379,3 +395,155 @@ class LISAfile(base.TranslationStore):
         ):
             term = self.UnitClass.createfromxmlElement(entry)
             self.addunit(term, new=False)
+
+    def iterparse(self, xml):
+        """Parses the given XML incrementally, yielding its units.
+
+        Unlike :meth:`parse`, the complete document is never held in memory:
+        units are not added to :attr:`units` and each unit is removed from the
+        document once the next one is requested.  Information depending on
+        the ancestors of a unit (like the file name included in the id of
+        XLIFF units) is only available until then.
+
+        Stores with their own :meth:`parse` are parsed completely.
+
+        :param xml: A file name, a file object or the XML as bytes.
+        """
+        if type(self).parse is not LISAfile.parse:
+            self.parse(xml)
+            yield from self.units
+            return
+        if isinstance(xml, bytes):
+            xml = BytesIO(xml)
+        elif hasattr(xml, "read"):
+            xml.seek(0)
+        self.filename = getattr(xml, "name", xml if isinstance(xml, str) else "")
+        self.units = []
+        unittag = None
+        events = etree.iterparse(
+            xml,
+            events=("start", "end"),
+            tag=("{*}" + self.rootNode, "{*}" + self.UnitClass.rootNode),
+            strip_cdata=False,
+            resolve_entities=False,
+        )
+        for event, element in events:
+            if event == "start":
+                if unittag is None and element.getparent() is None:
+                    self.document = element.getroottree()
+                    self.encoding = self.document.docinfo.encoding
+                continue
+            if unittag is None:
+                if element.getparent() is None:
+                    # A document without units
+                    break
+                self.initbody()
+                assert self.document.getroot().tag == self.namespaced(self.rootNode)
+                unittag = self.namespaced(self.UnitClass.rootNode)
+            if element.tag != unittag:
+                continue
+            unit = self.UnitClass.createfromxmlElement(element)
+            unit.namespace = self.namespace
+            unit._store = self
+            yield unit
+            element.getparent().remove(element)
+        if unittag is None:
+            self.initbody()
+            assert self.document.getroot().tag == self.namespaced(self.rootNode)
+
+
+class LISAwriter:
+    """Writes the units of a LISA store incrementally.
+
+    Opening the writer writes the document of the store up to the end of its
+    body (including any units the store already has).  Units passed to
+    :meth:`write` are serialized immediately and :meth:`close` completes the
+    document, so that only the unit being written has to be kept in memory::
+
+        store = tmx.tmxfile()
+        with lisa.LISAwriter(store, out) as writer:
+            for unit in units:
+                writer.write(unit)
+
+    The units are formatted like :meth:`LISAfile.serialize` does.
+    """
+
+    _marker = "translate-toolkit-lisa-writer"
+
+    def __init__(self, store, out):
+        self.store = store
+        self.out = out
+        self._indent = b""
+        self._level = 0
+        self._tail = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """Writes the start of the document."""
+        store = self.store
+        body = store.body
+        marker = etree.Comment(self._marker)
+        body.append(marker)
+        output = BytesIO()
+        try:
+            store.serialize(output)
+        finally:
+            body.remove(marker)
+        head, self._tail = output.getvalue().split(
+            f"<!--{self._marker}-->".encode(store.encoding), 1
+        )
+        newline = head.rfind(b"\n")
+        if newline != -1 and not head[newline:].strip():
+            head, self._indent = head[: newline + 1], head[newline + 1 :]
+            if self._tail.startswith(b"\n"):
+                self._tail = self._tail[1:]
+        skip = store.XMLindent.get("skip") or ()
+        self._level = sum(
+            1 for element in (body, *body.iterancestors()) if element.tag not in skip
+        )
+        self.out.write(head)
+
+    def write(self, unit):
+        """Writes a unit to the body of the document."""
+        element = unit.xmlelement
+        indent = dict(self.store.XMLindent or {"indent": "  "})
+        indent["toplevel"] = False
+        reindent(element, level=self._level, **indent)
+        if not self.store.XMLSelfClosingTags:
+            expand_closing_tags(element)
+        detached = element.getparent() is None
+        if detached:
+            # Serialize in the namespace context of the document
+            self.store.body.append(element)
+        try:
+            data = etree.tostring(
+                element,
+                encoding=self.store.encoding,
+                xml_declaration=False,
+                with_tail=False,
+            )
+        finally:
+            if detached:
+                self.store.body.remove(element)
+        namespace = self.store.body.nsmap.get(None)
+        if namespace:
+            # The default namespace is already declared by the document
+            end = data.find(b">")
+            declaration = f' xmlns="{namespace}"'.encode(self.store.encoding)
+            data = data[:end].replace(declaration, b"", 1) + data[end:]
+        self.out.write(self._indent)
+        self.out.write(data)
+        if self._indent:
+            self.out.write(b"\n")
+
+    def close(self):
+        """Writes the end of the document."""
+        if self._tail is not None:
+            self.out.write(self._tail)
+            self._tail = None
@@ -39,6 +39,8 @@ in very small files.
 """
 
 import array
+import codecs
+import mmap
 import re
 import struct
 
@@ -48,6 +50,17 @@ from translate.storage import base, poheader
 
 MO_MAGIC_NUMBER = 0x950412DE
 POT_HEADER = re.compile(r"^POT-Creation-Date:.*(\n|$)", re.IGNORECASE | re.MULTILINE)
+CHARSET = re.compile(r"charset=([^\s]+)")
+
+
+def get_encoding(charset):
+    """Return the Python codec name for the header ``charset``, or UTF-8 if
+    the charset is not known.
+    """
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return "utf-8"
 
 
 def mounpack(filename="messages.mo"):
@@ -67,17 +80,15 @@ def my_swap4(result):
 
 
 def hashpjw(str_param):
-    HASHWORDBITS = 32
     hval = 0
     for s in str_param:
         if not s:
             break
-        hval = hval << 4
-        hval += s
-        g = hval & 0xF << (HASHWORDBITS - 4)
-        if g != 0:
-            hval = hval ^ (g >> (HASHWORDBITS - 8))
-            hval = hval ^ g
+        hval = (hval << 4) + s
+        # HASHWORDBITS is 32, fold the top four bits back into the hash
+        g = hval & 0xF0000000
+        if g:
+            hval ^= (g >> 24) ^ g
     return hval
 
 
@@ -133,6 +144,147 @@ class mounit(base.TranslationUnit):
         return bool(self.source)
 
 
+class motable:
+    """Read only view of the string tables of MO data.
+
+    The data can be any object supporting the buffer protocol, for example
+    a :class:`mmap.mmap`.  Only the offset tables are read up front, strings
+    are decoded when they are looked up or when a unit is requested.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        (little,) = struct.unpack_from("<L", data)
+        (big,) = struct.unpack_from(">L", data)
+        if little == MO_MAGIC_NUMBER:
+            endian = "<"
+        elif big == MO_MAGIC_NUMBER:
+            endian = ">"
+        else:
+            raise ValueError("This is not an MO file")
+        (
+            _magic,
+            version_maj,
+            version_min,
+            lenkeys,
+            startkey,
+            startvalue,
+            sizehash,
+            offsethash,
+        ) = struct.unpack_from("%sLHHiiiii" % endian, data)
+        if version_maj >= 1:
+            raise base.ParseError(
+                """Unable to process version %d.%d MO files"""
+                % (version_maj, version_min)
+            )
+        self._keys = struct.unpack_from("%s%di" % (endian, 2 * lenkeys), data, startkey)
+        self._values = struct.unpack_from(
+            "%s%di" % (endian, 2 * lenkeys), data, startvalue
+        )
+        # Lookups need at least three slots for the double hashing
+        if sizehash > 2:
+            self._hash = struct.unpack_from(
+                "%s%dI" % (endian, sizehash), data, offsethash
+            )
+        else:
+            self._hash = ()
+        self.encoding = "utf-8"
+        header = self.lookup(b"")
+        if header is not None:
+            charset = CHARSET.search(header.decode("latin-1"))
+            if charset:
+                self.encoding = get_encoding(charset.group(1))
+
+    def decode(self, string):
+        """Decode a raw string of the file.
+
+        Older versions of the toolkit wrote UTF-8 whatever the charset of the
+        header was, so non ASCII strings in other charsets are decoded as
+        UTF-8 if they are valid UTF-8.
+        """
+        if self.encoding != "utf-8" and not string.isascii():
+            try:
+                return string.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        return string.decode(self.encoding)
+
+    def __len__(self):
+        return len(self._keys) // 2
+
+    def getkey(self, index):
+        """Return the raw original string of the entry at ``index``."""
+        length, offset = self._keys[2 * index : 2 * index + 2]
+        return bytes(self.data[offset : offset + length])
+
+    def getvalue(self, index):
+        """Return the raw translated string of the entry at ``index``."""
+        length, offset = self._values[2 * index : 2 * index + 2]
+        return bytes(self.data[offset : offset + length])
+
+    def _matches(self, index, key):
+        """Check whether the singular original string at ``index`` is ``key``."""
+        length, offset = self._keys[2 * index : 2 * index + 2]
+        size = len(key)
+        if size > length or self.data[offset : offset + size] != key:
+            return False
+        return size == length or self.data[offset + size] == 0
+
+    def find(self, key):
+        """Return the index of the entry whose singular original string is
+        ``key`` (context included), or None.
+
+        The hash table of the file is used when there is one, otherwise the
+        sorted original strings are bisected.
+        """
+        hashsize = len(self._hash)
+        if hashsize:
+            hash_value = hashpjw(key)
+            hash_cursor = hash_value % hashsize
+            increment = 1 + (hash_value % (hashsize - 2))
+            for _ in range(hashsize):
+                entry = self._hash[hash_cursor]
+                if entry == 0:
+                    return None
+                if self._matches(entry - 1, key):
+                    return entry - 1
+                hash_cursor = (hash_cursor + increment) % hashsize
+            return None
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.getkey(middle).split(b"\0", 1)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self._matches(low, key):
+            return low
+        return None
+
+    def lookup(self, key):
+        """Return the raw translated string for the raw original ``key``."""
+        index = self.find(key)
+        if index is None:
+            return None
+        return self.getvalue(index)
+
+    def getunit(self, index):
+        """Decode the entry at ``index`` into a :class:`mounit`."""
+        source = self.getkey(index)
+        context = None
+        if b"\x04" in source:
+            context, source = source.split(b"\x04")
+        source = multistring([self.decode(s) for s in source.split(b"\0")])
+        target = multistring(
+            [self.decode(s) for s in self.getvalue(index).split(b"\0")]
+        )
+        newunit = mounit(source)
+        newunit.target = target
+        if context is not None:
+            newunit.msgctxt.append(self.decode(context))
+        return newunit
+
+
 class mofile(poheader.poheader, base.TranslationStore):
     """A class representing a .mo file."""
 
@@ -161,65 +313,44 @@ class mofile(poheader.poheader, base.TranslationStore):
                 hash_cursor = hash_cursor % hash_size
             hash_table[hash_cursor] = i + 1
 
-        def lst_encode(lst, join_char=b""):
-            return join_char.join([i.encode("utf-8") for i in lst])
-
         # hash_size should be the smallest prime number that is greater
         # or equal (4 / 3 * N) - where N is the number of keys/units.
         # see gettext-0.17:gettext-tools/src/write-mo.c:406
         hash_size = get_next_prime_number((len(self.units) * 4) // 3)
         if hash_size <= 2:
             hash_size = 3
-        MESSAGES = {}
-        for unit in self.units:
-            # If the unit is not translated, we should rather omit it entirely
-            if not unit.istranslated():
-                continue
-            if isinstance(unit.source, multistring):
-                source = lst_encode(unit.msgidcomments) + lst_encode(
-                    unit.source.strings, b"\0"
-                )
-            else:
-                source = lst_encode(unit.msgidcomments) + unit.source.encode("utf-8")
-            if unit.msgctxt:
-                source = lst_encode(unit.msgctxt) + b"\x04" + source
-            if isinstance(unit.target, multistring):
-                target = lst_encode(unit.target.strings, b"\0")
-            elif unit.isheader():
-                # Support for "reproducible builds": Delete information that
-                # may vary between builds in the same conditions.
-                target = POT_HEADER.sub("", unit.target).encode("utf-8")
-            else:
-                target = unit.target.encode("utf-8")
-            if unit.target:
-                MESSAGES[source] = target
+        # Like msgfmt, write the strings in the charset of the header, unless
+        # they can not be represented in it
+        header = self.header()
+        charset = CHARSET.search(header.target) if header else None
+        encoding = get_encoding(charset.group(1)) if charset else "utf-8"
+        try:
+            MESSAGES = self._encode_messages(encoding)
+        except UnicodeEncodeError:
+            MESSAGES = self._encode_messages("utf-8", rewrite_charset=True)
         # using "I" works for 32- and 64-bit systems, but not for 16-bit!
-        hash_table = array.array("I", [0] * hash_size)
+        hash_table = array.array("I", bytes(4 * hash_size))
         # the keys are sorted in the .mo file
-        keys = sorted(MESSAGES.keys())
-        offsets = []
-        ids = strs = b""
+        keys = sorted(MESSAGES)
+        values = [MESSAGES[id] for id in keys]
         for i, id in enumerate(keys):
-            # For each string, we need size and file offset.  Each string is
-            # NUL terminated; the NUL does not count into the size.
-            # TODO: We don't do any encoding detection from the PO Header
             add_to_hash_table(id, i)
-            string = MESSAGES[id]  # id already encoded for use as dictionary key
-            offsets.append((len(ids), len(id), len(strs), len(string)))
-            ids = ids + id + b"\0"
-            strs = strs + string + b"\0"
         # The header is 7 32-bit unsigned integers
         keystart = 7 * 4 + 16 * len(keys) + hash_size * 4
-        # and the values start after the keys
-        valuestart = keystart + len(ids)
-        koffsets = []
-        voffsets = []
         # The string table first has the list of keys, then the list of values.
         # Each entry has first the size of the string, then the file offset.
-        for o1, l1, o2, l2 in offsets:
-            koffsets = koffsets + [l1, o1 + keystart]
-            voffsets = voffsets + [l2, o2 + valuestart]
-        offsets = koffsets + voffsets
+        # Each string is NUL terminated; the NUL does not count into the size.
+        offsets = array.array("i", bytes(16 * len(keys)))
+        offset = keystart
+        for i, id in enumerate(keys):
+            offsets[2 * i] = len(id)
+            offsets[2 * i + 1] = offset
+            offset += len(id) + 1
+        # and the values start after the keys
+        for i, string in enumerate(values, len(keys)):
+            offsets[2 * i] = len(string)
+            offsets[2 * i + 1] = offset
+            offset += len(string) + 1
         out.write(
             struct.pack(
                 "Iiiiiii",
@@ -234,10 +365,49 @@ class mofile(poheader.poheader, base.TranslationStore):
         )
         # additional data is not necessary for empty mo files
         if len(keys) > 0:
-            out.write(array.array("i", offsets).tobytes())
+            out.write(offsets.tobytes())
             out.write(hash_table.tobytes())
-            out.write(ids)
-            out.write(strs)
+            out.write(b"\0".join(keys) + b"\0")
+            out.write(b"\0".join(values) + b"\0")
+
+    def _encode_messages(self, encoding, rewrite_charset=False):
+        """Return the encoded translations of the translated units by their
+        encoded original strings.
+        """
+
+        def lst_encode(lst, join_char=b""):
+            return join_char.join([i.encode(encoding) for i in lst])
+
+        MESSAGES = {}
+        for unit in self.units:
+            # If the unit is not translated, we should rather omit it entirely
+            if not unit.istranslated():
+                continue
+            if isinstance(unit.source, multistring):
+                source = lst_encode(unit.msgidcomments) + lst_encode(
+                    unit.source.strings, b"\0"
+                )
+            else:
+                source = lst_encode(unit.msgidcomments) + unit.source.encode(encoding)
+            if unit.msgctxt:
+                source = lst_encode(unit.msgctxt) + b"\x04" + source
+            if isinstance(unit.target, multistring):
+                strings = unit.target.strings
+                if rewrite_charset and unit.isheader():
+                    strings = [CHARSET.sub("charset=UTF-8", s) for s in strings]
+                target = lst_encode(strings, b"\0")
+            elif unit.isheader():
+                # Support for "reproducible builds": Delete information that
+                # may vary between builds in the same conditions.
+                target = POT_HEADER.sub("", unit.target)
+                if rewrite_charset:
+                    target = CHARSET.sub("charset=UTF-8", target)
+                target = target.encode(encoding)
+            else:
+                target = unit.target.encode(encoding)
+            if unit.target:
+                MESSAGES[source] = target
+        return MESSAGES
 
     def parse(self, input):
         """parses the given file or file source string"""
@@ -249,58 +419,124 @@ class mofile(poheader.poheader, base.TranslationStore):
             mosrc = input.read()
             input.close()
             input = mosrc
-        (little,) = struct.unpack("<L", input[:4])
-        (big,) = struct.unpack(">L", input[:4])
-        if little == MO_MAGIC_NUMBER:
-            endian = "<"
-        elif big == MO_MAGIC_NUMBER:
-            endian = ">"
+        table = motable(input)
+        self.encoding = table.encoding
+        for i in range(len(table)):
+            self.addunit(table.getunit(i))
+
+
+class mmapmofile(mofile):
+    """A read mostly .mo file backed by a memory map.
+
+    :meth:`translate` answers lookups through the hash table of the file
+    without decoding it, units are only decoded when they are accessed.
+    """
+
+    def __init__(self, mofile=None, **kwargs):
+        self._map = None
+        self._table = None
+        self._units = []
+        super().__init__(**kwargs)
+        if mofile is not None:
+            self.open(mofile)
+
+    def open(self, mofile):
+        """Memory map the file called ``mofile``."""
+        with open(mofile, "rb") as fh:
+            self.parse(fh)
+
+    def close(self):
+        """Materialize all units and release the memory map."""
+        if self._map is not None:
+            self._units = self.units
+            self._table = None
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def units(self):
+        if self._units is None:
+            self._units = [self._readunit(i) for i in range(len(self._table))]
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        self._units = value
+
+    def unit_iter(self):
+        if self._units is not None:
+            yield from self._units
         else:
-            raise ValueError("This is not an MO file")
-        (
-            _magic,
-            version_maj,
-            version_min,
-            lenkeys,
-            startkey,
-            startvalue,
-            _sizehash,
-            _offsethash,
-        ) = struct.unpack("%sLHHiiiii" % endian, input[: (7 * 4)])
-        if version_maj >= 1:
-            raise base.ParseError(
-                """Unable to process version %d.%d MO files"""
-                % (version_maj, version_min)
-            )
-        for i in range(lenkeys):
-            nextkey = startkey + (i * 2 * 4)
-            nextvalue = startvalue + (i * 2 * 4)
-            klength, koffset = struct.unpack(
-                "%sii" % endian, input[nextkey : nextkey + (2 * 4)]
-            )
-            vlength, voffset = struct.unpack(
-                "%sii" % endian, input[nextvalue : nextvalue + (2 * 4)]
-            )
-            source = input[koffset : koffset + klength]
-            context = None
-            if b"\x04" in source:
-                context, source = source.split(b"\x04")
-            # Still need to handle KDE comments
-            if source == "":
-                charset = re.search(
-                    b"charset=([^\\s]+)", input[voffset : voffset + vlength]
-                )
-                if charset:
-                    self.encoding = charset.group(1)
-            source = multistring([s.decode(self.encoding) for s in source.split(b"\0")])
-            target = multistring(
-                [
-                    s.decode(self.encoding)
-                    for s in input[voffset : voffset + vlength].split(b"\0")
-                ]
-            )
-            newunit = mounit(source)
-            newunit.target = target
-            if context is not None:
-                newunit.msgctxt.append(context.decode(self.encoding))
-            self.addunit(newunit)
+            for i in range(len(self._table)):
+                yield self._readunit(i)
+
+    def _readunit(self, index):
+        unit = self._table.getunit(index)
+        unit._store = self
+        return unit
+
+    @classmethod
+    def parsefile(cls, storefile):
+        if isinstance(storefile, str):
+            return cls(storefile)
+        return super().parsefile(storefile)
+
+    def header(self):
+        if self._units is None:
+            index = self._table.find(b"")
+            if index is None:
+                return None
+            return self._readunit(index)
+        return super().header()
+
+    def translate(self, msgid, msgctxt=None):
+        """Return the translation of ``msgid`` in the context ``msgctxt``.
+
+        :return: The translation, a :class:`multistring` for plural
+                 messages, or None if ``msgid`` is not in the file.
+        """
+        if self._table is None:
+            # The memory map was closed, search the materialized units
+            for unit in self.units:
+                context = unit.getcontext() if unit.msgctxt else None
+                if unit.source.strings[0] == msgid and context == msgctxt:
+                    target = unit.target
+                    return target if len(target.strings) > 1 else str(target)
+            return None
+        key = msgid if msgctxt is None else msgctxt + "\x04" + msgid
+        try:
+            value = self._table.lookup(key.encode(self.encoding))
+        except UnicodeEncodeError:
+            value = None
+        if value is None and self.encoding != "utf-8" and not key.isascii():
+            # Written by an older version of the toolkit, see motable.decode
+            value = self._table.lookup(key.encode("utf-8"))
+        if value is None:
+            return None
+        if b"\0" in value:
+            return multistring([self._table.decode(s) for s in value.split(b"\0")])
+        return self._table.decode(value)
+
+    def parse(self, input):
+        """Memory map an open file or wrap the given MO data."""
+        if hasattr(input, "name"):
+            self.filename = input.name
+        if hasattr(input, "fileno"):
+            try:
+                self._map = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not a regular file (or empty)
+                input = input.read()
+            else:
+                input = self._map
+        elif hasattr(input, "read"):
+            input = input.read()
+        self._table = motable(input)
+        self.encoding = self._table.encoding
+        self._units = None
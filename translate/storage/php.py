@@ -54,6 +54,7 @@ implemented as outlined in the PHP documentation for the
 """
 
 import re
+import threading
 
 from phply.phpast import (
     Array,
@@ -74,6 +75,10 @@ from translate.misc.multistring import multistring
 from translate.storage import base
 
 
+_parser = None
+_parser_lock = threading.Lock()
+
+
 def wrap_production(func):
     """Decorator for production functions to store lexer positions."""
 
@@ -170,6 +175,199 @@ class PHPLexer(FilteredLexer):
         return "[]"
 
 
+def parse_with_grammar(text, lexer):
+    """Parse PHP source with the full phply grammar.
+
+    The parser and its wrapped productions are built once per process as
+    building them costs more than parsing a typical localisation file.  ply
+    parsers keep their state on the parser object, so parsing is serialized.
+    """
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            parser = make_parser()
+            for item in parser.productions:
+                item.callable = wrap_production(item.callable)
+            _parser = parser
+        return _parser.parse(text, lexer=lexer, tracking=True)
+
+
+class PHPToken:
+    __slots__ = ("type", "value", "lexpos")
+
+    def __init__(self, type, value, lexpos):
+        self.type = type
+        self.value = value
+        self.lexpos = lexpos
+
+
+class PHPFastParser:
+    """Parser for the common statements of PHP localisation files.
+
+    Handles files made only of ``$var['key'] = 'value';`` assignments and
+    ``return [...];`` or ``$var = array(...);`` arrays with single quoted
+    strings, which is what most PHP and Laravel localisation files contain.
+    The tokens and the tree (including the lexer positions added by
+    :func:`wrap_production`) are the same as the ones of the full grammar.
+    :meth:`parse` returns None for anything else and the full grammar is used
+    instead.
+    """
+
+    token_re = re.compile(
+        r"""
+        (?P<WHITESPACE>[ \t\r\n]+)
+        | (?P<DOC_COMMENT>/\*\*(?:.|\n)*?\*/)
+        | (?P<COMMENT>/\*(?:.|\n)*?\*/
+            | //(?:[^?%\n]|[?%](?!>))*\n?
+            | \#(?:[^?%\n]|[?%](?!>))*\n?)
+        | (?P<VARIABLE>\$[A-Za-z_][\w_]*)
+        | (?P<STRING>[A-Za-z_][\w_]*)
+        | (?P<LNUMBER>\d+)
+        | (?P<CONSTANT_ENCAPSED_STRING>'(?:[^\\']|\\(?:.|\n))*')
+        | (?P<DOUBLE_ARROW>=>)
+        | (?P<EQUALS>=)
+        | (?P<SEMI>;)
+        | (?P<COMMA>,)
+        | (?P<LBRACKET>\[)
+        | (?P<RBRACKET>\])
+        | (?P<LPAREN>\()
+        | (?P<RPAREN>\))
+        | (?P<CLOSE_TAG>\?>\r?\n?)
+        """,
+        re.VERBOSE,
+    )
+    open_tag_re = re.compile(r"<\?[Pp][Hh][Pp][ \t\r\n]?")
+    reserved = {"ARRAY", "RETURN"}
+    ignored = {"WHITESPACE", "COMMENT", "DOC_COMMENT"}
+
+    class Unsupported(Exception):
+        pass
+
+    def tokenize(self, text):
+        match = self.open_tag_re.match(text)
+        if match is None:
+            raise self.Unsupported()
+        tokens = [PHPToken("OPEN_TAG", match.group(), 0)]
+        pos = match.end()
+        token_re = self.token_re
+        while pos < len(text):
+            match = token_re.match(text, pos)
+            if match is None:
+                raise self.Unsupported()
+            kind = match.lastgroup
+            value = match.group()
+            if kind == "STRING":
+                kind = value.upper()
+                if kind not in self.reserved:
+                    raise self.Unsupported()
+            elif kind == "LNUMBER" and len(value) > 1 and value[0] == "0":
+                raise self.Unsupported()
+            elif kind == "CLOSE_TAG" and match.end() != len(text):
+                raise self.Unsupported()
+            tokens.append(PHPToken(kind, value, pos))
+            pos = match.end()
+        return tokens
+
+    def parse(self, text):
+        """Parse ``text`` and return the tree and the list of all tokens, or
+        None if the file needs the full grammar.
+        """
+        try:
+            self.tokens = self.tokenize(text)
+            self.significant = [
+                token for token in self.tokens[1:] if token.type not in self.ignored
+            ]
+            if self.significant and self.significant[-1].type == "CLOSE_TAG":
+                if len(self.significant) < 2 or self.significant[-2].type != "SEMI":
+                    raise self.Unsupported()
+                self.significant.pop()
+            self.index = 0
+            tree = []
+            while self.index < len(self.significant):
+                tree.append(self.statement())
+        except self.Unsupported:
+            return None
+        return tree, self.tokens
+
+    def next(self, *types):
+        if self.index >= len(self.significant):
+            raise self.Unsupported()
+        token = self.significant[self.index]
+        if types and token.type not in types:
+            raise self.Unsupported()
+        self.index += 1
+        return token
+
+    def peek(self):
+        if self.index >= len(self.significant):
+            raise self.Unsupported()
+        return self.significant[self.index].type
+
+    def statement(self):
+        start = self.next("VARIABLE", "RETURN")
+        if start.type == "RETURN":
+            node = self.array()
+            item = Return(node)
+        else:
+            node = Variable(start.value)
+            while self.peek() == "LBRACKET":
+                self.next()
+                node = ArrayOffset(node, self.key())
+                self.next("RBRACKET")
+            self.next("EQUALS")
+            if self.peek() == "CONSTANT_ENCAPSED_STRING":
+                expr = self.string()
+            else:
+                expr = self.array()
+            item = Assignment(node, expr, False)
+        end = self.next("SEMI")
+        item.lexpositions = start.lexpos, end.lexpos
+        return item
+
+    def key(self):
+        if self.peek() == "LNUMBER":
+            return int(self.next().value)
+        return self.string()
+
+    def string(self):
+        value = self.next("CONSTANT_ENCAPSED_STRING").value
+        return value[1:-1].replace("\\'", "'").replace("\\\\", "\\")
+
+    def array(self):
+        opening = self.next("ARRAY", "LBRACKET")
+        if opening.type == "ARRAY":
+            self.next("LPAREN")
+            closing = "RPAREN"
+        else:
+            closing = "RBRACKET"
+        nodes = []
+        trailing_comma = False
+        while self.peek() != closing:
+            if not nodes:
+                # All the elements start where the first one does
+                start = self.significant[self.index].lexpos
+            key = self.key()
+            self.next("DOUBLE_ARROW")
+            if self.peek() == "CONSTANT_ENCAPSED_STRING":
+                value = self.string()
+            else:
+                value = self.array()
+            element = ArrayElement(key, value, False)
+            element.lexpositions = start, self.significant[self.index - 1].lexpos
+            nodes.append(element)
+            if self.peek() != closing:
+                comma = self.next("COMMA")
+                if self.peek() == closing:
+                    element.lexpositions = start, comma.lexpos
+                    trailing_comma = True
+        token = self.next(closing)
+        if nodes and not trailing_comma:
+            # The last element ends where the lexer stood after reading the
+            # closing bracket
+            nodes[-1].lexpositions = start, token.lexpos + 1
+        return Array(nodes)
+
+
 def phpencode(text, quotechar="'"):
     """Convert Python string to PHP escaping.
 
@@ -457,11 +655,13 @@ class phpfile(base.TranslationStore):
             assert isinstance(item, BinaryOp)
             return concatenate(item.left) + concatenate(item.right)
 
-        parser = make_parser()
-        for item in parser.productions:
-            item.callable = wrap_production(item.callable)
+        text = phpsrc.decode(self.encoding)
         lexer = PHPLexer()
-        tree = parser.parse(phpsrc.decode(self.encoding), lexer=lexer, tracking=True)
+        result = PHPFastParser().parse(text)
+        if result is None:
+            tree = parse_with_grammar(text, lexer)
+        else:
+            tree, lexer.tokens = result
         # Handle text without PHP start
         if len(tree) == 1 and isinstance(tree[0], InlineHTML):
             self.parse(b"<?php\n" + phpsrc)
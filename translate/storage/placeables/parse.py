@@ -21,11 +21,130 @@ Contains the ``parse`` function that parses normal strings into StringElem-
 based "rich" string element trees.
 """
 
+import re
 
+from translate.storage.placeables.general import regex_parse
 from translate.storage.placeables.strelem import StringElem
 
 
-def parse(tree, parse_funcs):
+class RegexScanner:
+    """Apply a list of regular expression based parsers to a string.
+
+    This gives the same result as :func:`parse` does with the ``parse``
+    methods of the placeable classes, but the ``StringElem`` tree is built in
+    a single pass instead of being flattened and pruned for every parser.
+    The regular expressions of the parsers are combined in a single
+    alternation in order of priority, so that a string in which none of
+    them matches is only scanned once.
+    """
+
+    def __init__(self, classes):
+        self.classes = classes
+        self.regexes = [cls.regex for cls in classes]
+        self._combined = {}
+
+    def combined(self, index):
+        """Return the alternation of the regular expressions from ``index``.
+
+        The branch of every parser is a group named after its index.
+        """
+        try:
+            return self._combined[index]
+        except KeyError:
+            pass
+        branches = []
+        for i in range(index, len(self.regexes)):
+            regex = self.regexes[i]
+            if regex is None:
+                continue
+            flags = "".join(
+                letter
+                for flag, letter in ((re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x"))
+                if regex.flags & flag
+            )
+            pattern = regex.pattern
+            if pattern.startswith("(?x)"):
+                pattern = pattern[4:]
+                flags += "x"
+            if "x" in flags:
+                # The pattern could end with a comment
+                pattern += "\n"
+            if flags:
+                pattern = f"(?{flags}:{pattern})"
+            branches.append(f"(?P<p{i}>{pattern})")
+        combined = re.compile("|".join(branches)) if branches else None
+        self._combined[index] = combined
+        return combined
+
+    def expand(self, leaf, text, index=0):
+        """Parse placeables in ``text``, the content of ``leaf``, using the
+        parsers from ``index`` onwards.
+        """
+        while index < len(self.classes):
+            combined = self.combined(index)
+            match = combined.search(text) if combined is not None else None
+            if match is None:
+                return
+            # A parser before the one matching first can still match later
+            # in the text, and it takes precedence
+            found = int(match.lastgroup[1:])
+            start = match.start() + 1
+            for i in range(index, found):
+                regex = self.regexes[i]
+                if regex is not None and regex.search(text, start):
+                    found = i
+                    break
+            index = found + 1
+
+            subleaves = regex_parse(self.classes[found], text)
+            if (
+                len(subleaves) == 1
+                and isinstance(subleaves[0], type(leaf))
+                and leaf == subleaves[0]
+            ):
+                continue
+            leaf.sub = subleaves
+            subleaves = leaf.sub
+            for i, subleaf in enumerate(subleaves):
+                if not subleaf.istranslatable or not subleaf.sub[0]:
+                    continue
+                self.expand(subleaf, subleaf.sub[0], index)
+                # This is the only change StringElem.prune() would make to
+                # the new subtree: a string element that only contains a
+                # placeable is replaced by the placeable
+                if (
+                    type(subleaf) is StringElem
+                    and len(subleaf.sub) == 1
+                    and isinstance(subleaf.sub[0], StringElem)
+                ):
+                    subleaves[i] = subleaf.sub[0]
+            return
+
+
+_scanners = {}
+
+
+def get_scanner(parse_funcs):
+    """Return a :class:`RegexScanner` for ``parse_funcs``, or None if they
+    are not all ``parse`` methods based on regular expressions.
+    """
+    classes = []
+    for parse_func in parse_funcs:
+        if (
+            getattr(parse_func, "__func__", None) is not regex_parse
+            or parse_func.__self__ is StringElem
+        ):
+            return None
+        classes.append(parse_func.__self__)
+    key = tuple((cls, cls.regex) for cls in classes)
+    try:
+        return _scanners[key]
+    except KeyError:
+        scanner = _scanners[key] = RegexScanner(classes)
+        return scanner
+
+
+def parse(tree, parse_funcs, fast=True):
     """Parse placeables from the given string or sub-tree by using the
     parsing functions provided.
 
@@ -45,9 +164,16 @@ def parse(tree, parse_funcs):
                         return a list of ``StringElem``s which, together,
                         form the original string. If nothing could be
                         parsed, it should return ``None``.
+    :param fast: Parse strings with a :class:`RegexScanner` when all the
+                 parsing functions allow it.
     """
     if isinstance(tree, str):
+        text = tree
         tree = StringElem(tree)
+        scanner = get_scanner(parse_funcs) if fast and text else None
+        if scanner is not None:
+            scanner.expand(tree, text)
+            return tree
     if not parse_funcs:
         return tree
 
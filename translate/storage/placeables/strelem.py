@@ -24,12 +24,81 @@ parsed rich-string tree. It is the base class of all placeables.
 
 import logging
 import sys
+from bisect import bisect_right
+
+
+_generation = object()
+"""Changed whenever any element tree is modified, which invalidates the
+rendered strings and offsets cached by :class:`StringElem`."""
+
+
+def _invalidate():
+    global _generation
+    _generation = object()
 
 
 class ElementNotFoundError(ValueError):
     pass
 
 
+class SubElements(list):
+    """The list of sub-elements of a :class:`StringElem`.
+
+    Every change to the list invalidates the cached renderings.
+    """
+
+    def __setitem__(self, index, value):
+        _invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        _invalidate()
+        super().__delitem__(index)
+
+    def __iadd__(self, values):
+        _invalidate()
+        return super().__iadd__(values)
+
+    def __imul__(self, count):
+        _invalidate()
+        return super().__imul__(count)
+
+    def append(self, value):
+        _invalidate()
+        super().append(value)
+
+    def clear(self):
+        _invalidate()
+        super().clear()
+
+    def extend(self, values):
+        _invalidate()
+        super().extend(values)
+
+    def insert(self, index, value):
+        _invalidate()
+        super().insert(index, value)
+
+    def pop(self, index=-1):
+        _invalidate()
+        return super().pop(index)
+
+    def remove(self, value):
+        _invalidate()
+        super().remove(value)
+
+    def reverse(self):
+        _invalidate()
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        _invalidate()
+        super().sort(*args, **kwargs)
+
+
+_RENDERING_ATTRIBUTES = frozenset(("sub", "renderer", "isvisible"))
+
+
 class StringElem:
     """
     This class represents a sub-tree of a string parsed into a rich structure.
@@ -39,7 +108,7 @@ class StringElem:
     renderer = None
     """An optional function that returns the Unicode representation of
     the string."""
-    sub = []
+    sub = SubElements()
     """The sub-elements that make up this this string."""
     has_content = True
     """Whether this string can have sub-elements."""
@@ -57,27 +126,49 @@ class StringElem:
 
     # INITIALIZERS #
     def __init__(self, sub=None, id=None, rid=None, xid=None, **kwargs):
+        # A new element is not part of any tree yet, so the attributes are
+        # set without invalidating the cached renderings
+        attributes = self.__dict__
         if sub is None:
-            self.sub = []
+            attributes["sub"] = SubElements()
         elif isinstance(sub, (str, StringElem)):
-            self.sub = [sub]
+            attributes["sub"] = SubElements((sub,))
         else:
             for elem in sub:
                 if not isinstance(elem, (str, StringElem)):
                     raise ValueError(elem)
-            self.sub = sub
+            attributes["sub"] = SubElements(sub)
             self.prune()
 
-        self.id = id
-        self.rid = rid
-        self.xid = xid
+        attributes["id"] = id
+        attributes["rid"] = rid
+        attributes["xid"] = xid
 
         for key, value in kwargs.items():
             if hasattr(self, key):
                 raise ValueError("attribute already exists: %s" % (key))
-            setattr(self, key, value)
+            attributes[key] = value
 
     # SPECIAL METHODS #
+    def __setattr__(self, name, value):
+        if name in _RENDERING_ATTRIBUTES:
+            if name == "sub" and type(value) is not SubElements:
+                value = SubElements(value)
+            _invalidate()
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_rendered", None)
+        state.pop("_offsets", None)
+        state.pop("_parents", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "sub" in state:
+            self.sub = state["sub"]
+
     def __add__(self, rhs):
         """Emulate the ``unicode`` class."""
         return str(self) + rhs
@@ -162,11 +253,79 @@ class StringElem:
         }
 
     def __str__(self):
+        return self._render()[0]
+
+    def _render(self):
+        """Return the rendered string and whether it could be cached.
+
+        The string is cached until any tree is modified, unless a renderer
+        was involved.
+        """
         if callable(self.renderer):
-            return self.renderer(self)
+            return self.renderer(self), False
+        rendered = self.__dict__.get("_rendered")
+        if rendered is not None and rendered[0] is _generation:
+            return rendered[1], True
+        cacheable = True
         if not self.isvisible:
-            return ""
-        return "".join(str(elem) for elem in self.sub)
+            text = ""
+        else:
+            parts = []
+            for elem in self.sub:
+                if not isinstance(elem, StringElem):
+                    parts.append(str(elem))
+                elif type(elem).__str__ is StringElem.__str__:
+                    part, part_cacheable = elem._render()
+                    parts.append(part)
+                    cacheable = cacheable and part_cacheable
+                else:
+                    parts.append(str(elem))
+                    cacheable = False
+            text = "".join(parts)
+        if cacheable:
+            self.__dict__["_rendered"] = (_generation, text)
+        return text, cacheable
+
+    def _get_offsets(self):
+        """Return the offsets of the nodes and leaves in this tree.
+
+        :returns: A dictionary of the ``(node, offset)`` pairs by node id,
+                  the list of leaves as :meth:`flatten` returns them and the
+                  lists of their start and end offsets.
+        """
+        offsets = self.__dict__.get("_offsets")
+        if offsets is not None and offsets[0] is _generation:
+            return offsets[1]
+        nodes = {}
+        leaves = []
+        starts = []
+        ends = []
+        offset = 0
+        cacheable = True
+        # The same order as iter_depth_first()
+        stack = [self]
+        while stack:
+            elem = stack.pop()
+            nodes.setdefault(id(elem), (elem, offset))
+            if not elem.isleaf():
+                stack.extend(
+                    sub for sub in reversed(elem.sub) if isinstance(sub, StringElem)
+                )
+                continue
+            if type(elem).__str__ is StringElem.__str__:
+                text, elem_cacheable = elem._render()
+                cacheable = cacheable and elem_cacheable
+            else:
+                text = str(elem)
+                cacheable = False
+            leaves.append(elem)
+            starts.append(offset)
+            offset += len(text)
+            ends.append(offset)
+        offsets = nodes, leaves, starts, ends
+        if cacheable:
+            self.__dict__["_offsets"] = (_generation, offsets)
+        return offsets
 
     # METHODS #
     def apply_to_strings(self, f):
@@ -423,12 +582,9 @@ class StringElem:
         :returns: The string index where element ``e`` starts, or -1 if ``e``
                   was not found.
         """
-        offset = 0
-        for e in self.iter_depth_first():
-            if e is elem:
-                return offset
-            if e.isleaf():
-                offset += len(e)
+        found = self._get_offsets()[0].get(id(elem))
+        if found is not None and found[0] is elem:
+            return found[1]
 
         # If we can't find the same instance element, settle for one that
         # looks like it
@@ -451,14 +607,15 @@ class StringElem:
         if offset < 0 or offset > len(self):
             return None
 
-        length = 0
-        elem = None
-        for elem in self.flatten():
-            elem_len = len(elem)
-            if length <= offset < length + elem_len:
-                return elem
-            length += elem_len
-        return elem
+        nodes, leaves, starts, ends = self._get_offsets()
+        if not leaves:
+            return None
+        # Empty leaves never contain an offset, and the last leaf is used if
+        # no leaf does
+        i = bisect_right(starts, offset) - 1
+        if offset < ends[i]:
+            return leaves[i]
+        return leaves[-1]
 
     def find(self, x):
         """Find sub-string ``x`` in this string tree and return the position at
@@ -515,6 +672,23 @@ class StringElem:
         """Searches the current sub-tree for and returns the parent of the
         ``child`` element.
         """
+        parents = self.__dict__.get("_parents")
+        if parents is not None and parents[0] is _generation:
+            if parents[1] is None:
+                # Index the parents when the tree is searched again before it
+                # is modified
+                parents = {}
+                for elem in self.iter_depth_first():
+                    for sub in elem.sub:
+                        parents.setdefault(id(sub), (sub, elem))
+                self.__dict__["_parents"] = (_generation, parents)
+            else:
+                parents = parents[1]
+            found = parents.get(id(child))
+            if found is not None and found[0] is child:
+                return found[1]
+            return None
+        self.__dict__["_parents"] = (_generation, None)
         for elem in self.iter_depth_first():
             if not isinstance(elem, StringElem):
                 continue
@@ -886,7 +1060,11 @@ class StringElem:
                         parent.sub[parent.sub.index(elem)] = child
                         changed = True
 
-            if type(elem) is StringElem and elem.isleaf():
+            if (
+                type(elem) is StringElem
+                and elem.isleaf()
+                and not (len(elem.sub) == 1 and type(elem.sub[0]) is str)
+            ):
                 # Collapse all strings in this leaf into one string.
                 elem.sub = ["".join(elem.sub)]
 
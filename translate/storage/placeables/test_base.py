@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+import pickle
+
 from pytest import mark
 
 from translate.storage.placeables import StringElem, base, general, parse, xliff
@@ -188,6 +190,46 @@ class TestStringElem:
         elem.prune()
         assert elem == StringElem("foobar")
 
+    def test_cache_invalidation(self):
+        elem = self.elem.copy()
+        leaf = elem.sub[2]
+        assert str(elem) == self.ORIGSTR
+        assert elem.elem_at_offset(len(self.ORIGSTR) - 1) is elem.sub[3]
+
+        leaf.sub.append("X")
+        assert str(elem) == self.ORIGSTR[:-4] + "X</a>"
+        assert elem.elem_offset(elem.sub[3]) == len(self.ORIGSTR) - 3
+        assert elem.elem_at_offset(len(self.ORIGSTR) - 4) is leaf
+
+        leaf.sub = ["Y"]
+        assert len(elem) == len(self.ORIGSTR) - 10
+        assert elem.elem_offset(elem.sub[3]) == len(self.ORIGSTR) - 14
+
+        leaf.isvisible = False
+        assert str(elem) == self.ORIGSTR[:-15] + "</a>"
+        leaf.isvisible = True
+
+        leaf.renderer = lambda e: "[%s]" % "".join(e.sub)
+        assert str(elem) == self.ORIGSTR[:-15] + "[Y]</a>"
+        assert elem.elem_offset(elem.sub[3]) == len(self.ORIGSTR) - 12
+        leaf.renderer = None
+
+        elem.insert(0, "Z")
+        assert str(elem) == "Z" + self.ORIGSTR[:-15] + "Y</a>"
+        elem.delete_range(0, 5)
+        assert str(elem) == self.ORIGSTR[4:-15] + "Y</a>"
+        assert elem.elem_at_offset(0) is elem.sub[0]
+
+    def test_pickle(self):
+        elem = self.elem.copy()
+        str(elem)
+        elem.elem_at_offset(5)
+        copied = pickle.loads(pickle.dumps(elem))
+        assert copied == elem
+        copied.sub[0].sub.append("X")
+        assert str(copied) == self.ORIGSTR[:4] + "X" + self.ORIGSTR[4:]
+        assert copied.elem_at_offset(4) is copied.sub[0]
+
 
 class TestConverters:
     def setup_method(self, method):
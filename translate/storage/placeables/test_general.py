@@ -1,4 +1,4 @@
-from translate.storage.placeables import general
+from translate.storage.placeables import general, parse
 
 
 def test_placeable_numbers():
@@ -280,4 +280,22 @@ def test_python_placeable():
     assert pfp.parse("There were %(number)Ld cows")[1] == pfp(["%(number)Ld"])
 
 
+def test_parse_scanner():
+    """The scanner gives the same trees as parsing with each parser in turn"""
+    for string in (
+        "Plain text",
+        "FOO",
+        "Hello <b>WORLD</b> 5 times",
+        '<a alt="Hi THERE 5">y</a>',
+        "%s and %1$s, %(name)s or {0}",
+        "Visit http://example.com/ or mail info@example.com --help",
+        "Open ~/.config/app.conf\nand set OPTION_NAME to 1.5…",
+        "&amp; &#123; @@key@@ {{var}} iPod KBabel -v",
+    ):
+        fast = parse(string, general.parsers)
+        regular = parse(string, general.parsers, fast=False)
+        assert repr(fast) == repr(regular)
+        assert fast == regular
+
+
 # TODO: JavaMessageFormatPlaceable, UrlPlaceable, XMLTagPlaceable
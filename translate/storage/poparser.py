@@ -114,16 +114,22 @@ def read_prevmsgid_lines(parse_state):
 
 
 def parse_prev_msgctxt(parse_state, unit):
+    if not startswith(parse_state.next_line, "msgctxt"):
+        return False
     parse_message(parse_state, "msgctxt", 7, unit.prev_msgctxt)
     return len(unit.prev_msgctxt) > 0
 
 
 def parse_prev_msgid(parse_state, unit):
+    if not startswith(parse_state.next_line, "msgid"):
+        return False
     parse_message(parse_state, "msgid", 5, unit.prev_msgid)
     return len(unit.prev_msgid) > 0
 
 
 def parse_prev_msgid_plural(parse_state, unit):
+    if not startswith(parse_state.next_line, "msgid_plural"):
+        return False
     parse_message(parse_state, "msgid_plural", 12, unit.prev_msgid_plural)
     return len(unit.prev_msgid_plural) > 0
 
@@ -242,13 +248,19 @@ def parse_message(
 
 
 def parse_msgctxt(parse_state, unit):
+    if not startswith(parse_state.next_line, "msgctxt"):
+        return False
     parse_message(parse_state, "msgctxt", 7, unit.msgctxt)
     return len(unit.msgctxt) > 0
 
 
 def parse_msgid(parse_state, unit):
-    parse_message(parse_state, "msgid", 5, unit.msgid, unit.msgidcomments)
-    return len(unit.msgid) > 0 or len(unit.msgidcomments) > 0
+    # The comment lists of units are only allocated when they are needed
+    msgidcomments = []
+    parse_message(parse_state, "msgid", 5, unit.msgid, msgidcomments)
+    if msgidcomments:
+        unit.msgidcomments = msgidcomments
+    return len(unit.msgid) > 0 or len(msgidcomments) > 0
 
 
 def parse_msgstr(parse_state, unit):
@@ -257,10 +269,15 @@ def parse_msgstr(parse_state, unit):
 
 
 def parse_msgid_plural(parse_state, unit):
+    if not startswith(parse_state.next_line, "msgid_plural"):
+        return False
+    msgid_pluralcomments = []
     parse_message(
-        parse_state, "msgid_plural", 12, unit.msgid_plural, unit.msgid_pluralcomments
+        parse_state, "msgid_plural", 12, unit.msgid_plural, msgid_pluralcomments
     )
-    return len(unit.msgid_plural) > 0 or len(unit.msgid_pluralcomments) > 0
+    if msgid_pluralcomments:
+        unit.msgid_pluralcomments = msgid_pluralcomments
+    return len(unit.msgid_plural) > 0 or len(msgid_pluralcomments) > 0
 
 
 MSGSTR_ARRAY_ENTRY_LEN = len("msgstr[")
@@ -395,8 +412,184 @@ def parse_header(parse_state, store):
     return first_unit
 
 
-def parse_units(parse_state, store):
+# States of the fast parser
+FAST_COMMENTS = 0
+FAST_MSGCTXT = 1
+FAST_MSGID = 2
+FAST_MSGID_PLURAL = 3
+FAST_MSGSTR = 4
+FAST_MSGSTR_ARRAY = 5
+
+
+def fast_parse_lines(lines, store, UnitClass):
+    """Parse well-formed units from the decoded ``lines`` into ``store``.
+
+    This is a single pass state machine dispatching on the first character
+    of every line.  Only the common structure of comments (without previous
+    msgid or obsolete entries), an optional msgctxt, msgid and either a msgstr
+    or a msgid_plural with msgstr array is handled.  Parsing stops at the
+    start of the first unit which does not follow it.
+
+    :return: A tuple of the position of the first line which was not parsed
+             and the last non blank line of the last parsed unit (or None).
+    """
+    addunit = store.addunit
+    unit = UnitClass()
+    state = FAST_COMMENTS
+    current = None
+    unit_start = 0
+    last_line = unit_last_line = None
+    pos = 0
+    count = len(lines)
+    while pos < count:
+        line = lines[pos]
+        first = line[0]
+        if first == '"':
+            if current is None:
+                break
+            right = rfind(line, '"')
+            if right == 0:
+                break
+            string = line[: right + 1]
+            if (state == FAST_MSGID or state == FAST_MSGID_PLURAL) and startswith(
+                string, '"_:'
+            ):
+                break
+            append(current, string)
+        elif first == "#":
+            if state >= FAST_MSGSTR:
+                unit.infer_state()
+                addunit(unit)
+                unit = UnitClass()
+                state = FAST_COMMENTS
+                current = None
+                unit_start = pos
+                unit_last_line = last_line
+            elif state != FAST_COMMENTS:
+                break
+            second = line[1]
+            if second == ".":
+                append(unit.automaticcomments, line)
+            elif second == ":":
+                append(unit.sourcecomments, line)
+            elif second == ",":
+                append(unit.typecomments, line)
+            elif second == "|" or second == "~":
+                break
+            else:
+                append(unit.othercomments, line)
+        elif first == "m":
+            left = find(line, '"')
+            if left == -1:
+                break
+            right = rfind(line, '"')
+            if right == left:
+                break
+            keyword = line[:left].rstrip()
+            string = line[left : right + 1]
+            if keyword == "msgstr":
+                if state != FAST_MSGID:
+                    break
+                state = FAST_MSGSTR
+                current = unit.msgstr
+            elif keyword == "msgid" or keyword == "msgctxt":
+                if state >= FAST_MSGSTR:
+                    unit.infer_state()
+                    addunit(unit)
+                    unit = UnitClass()
+                    state = FAST_COMMENTS
+                    unit_start = pos
+                    unit_last_line = last_line
+                if keyword == "msgid":
+                    if state > FAST_MSGCTXT or startswith(string, '"_:'):
+                        break
+                    state = FAST_MSGID
+                    current = unit.msgid
+                else:
+                    if state != FAST_COMMENTS:
+                        break
+                    state = FAST_MSGCTXT
+                    current = unit.msgctxt
+            elif keyword == "msgid_plural":
+                if state != FAST_MSGID or startswith(string, '"_:'):
+                    break
+                state = FAST_MSGID_PLURAL
+                current = unit.msgid_plural
+            elif (
+                startswith(keyword, "msgstr[")
+                and find(keyword, "]") == len(keyword) - 1
+            ):
+                if state == FAST_MSGID_PLURAL:
+                    unit.msgstr = {}
+                elif state != FAST_MSGSTR_ARRAY:
+                    break
+                try:
+                    index = int(keyword[MSGSTR_ARRAY_ENTRY_LEN:-1])
+                except ValueError:
+                    break
+                state = FAST_MSGSTR_ARRAY
+                current = unit.msgstr.setdefault(index, [])
+            else:
+                break
+            append(current, string)
+        elif isspace(line):
+            pos += 1
+            continue
+        else:
+            break
+        last_line = line
+        pos += 1
+    else:
+        if state >= FAST_MSGSTR:
+            unit.infer_state()
+            addunit(unit)
+            return pos, last_line
+    return unit_start, unit_last_line
+
+
+def fast_parse_units(parse_state, store):
+    """Parse the remaining units of ``parse_state`` using the fast path.
+
+    The remaining input is decoded up front and parsed with
+    :func:`fast_parse_lines` until the first unit it can not handle.
+
+    :return: A parse state positioned on the first line that was not parsed,
+             to be used with the regular parser.
+    """
+    if parse_state.eof or parse_state.encoding is None:
+        return parse_state
+    remaining = list(parse_state._input_iterator)
+    encoding = parse_state.encoding
+    try:
+        lines = [parse_state.next_line] + [decode(line, encoding) for line in remaining]
+    except (TypeError, UnicodeDecodeError):
+        # Let the regular parser deal with the input
+        fallback = parse_state.new_input(iter([parse_state.next_line] + remaining))
+        fallback.lineno += parse_state.lineno - 1
+        fallback.last_line = parse_state.last_line
+        return fallback
+
+    pos, last_line = fast_parse_lines(lines, store, parse_state.UnitClass)
+
+    fallback = parse_state.new_input(iter(lines[pos:]))
+    fallback.lineno += parse_state.lineno + pos - 1
+    fallback.last_line = parse_state.last_line if last_line is None else last_line
+    return fallback
+
+
+def parse_units(parse_state, store, fast=True):
+    """Parse all units from ``parse_state`` into ``store``.
+
+    With ``fast`` the units following the header are parsed using
+    :func:`fast_parse_units` as long as they are well formed, the regular
+    parser handles the rest of the input and reports errors.
+    """
     unit = parse_header(parse_state, store)
+    if unit and fast:
+        unit.infer_state()
+        store.addunit(unit)
+        parse_state = fast_parse_units(parse_state, store)
+        unit = parse_unit(parse_state)
     while unit:
         unit.infer_state()
         store.addunit(unit)
@@ -166,15 +166,8 @@ def is_line_continuation(line):
     :return: Does *line* end with a line continuation
     :rtype: Boolean
     """
-    pos = -1
-    count = 0
-    if len(line) == 0:
-        return False
-    # Count the slashes from the end of the line. Ensure we don't
-    # go into infinite loop.
-    while len(line) >= -pos and line[pos:][0] == "\\":
-        pos -= 1
-        count += 1
+    # Count the slashes from the end of the line.
+    count = len(line) - len(line.rstrip("\\"))
     return (count % 2) == 1  # Odd is a line continuation, even is not
 
 
@@ -260,6 +253,11 @@ class Dialect:
     value_wrap_char = ""
     drop_comments = []
     has_plurals = False
+    # Compiled by compile_scanner() from the attributes above
+    _simple_re = None
+    _delimiter_re = None
+    _space_re = None
+    _key_wrap_re = None
 
     @staticmethod
     def encode(string, encoding=None):
@@ -274,6 +272,52 @@ class Dialect:
     def decode(string):
         return quote.propertiesdecode(string)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compile_scanner()
+
+    @classmethod
+    def compile_scanner(cls):
+        """Precompile the regular expressions used by :meth:`find_delimiter`.
+
+        This is done automatically for every dialect class, but needs to be
+        called again if :attr:`delimiters` or :attr:`key_wrap_char` are
+        changed afterwards.
+        """
+        delimiters = [d for d in cls.delimiters if d != " "]
+        if delimiters and all(len(d) == 1 for d in delimiters):
+            # Fast path for the common case of a plain key directly followed
+            # by a delimiter, possibly with some whitespace in between
+            chars = re.escape("".join(delimiters))
+            cls._simple_re = re.compile(
+                r"[^\s\\%s%s]+[ \t]*([%s])"
+                % (chars, re.escape(cls.key_wrap_char), chars)
+            )
+        else:
+            cls._simple_re = None
+        # A delimiter only counts when it is not escaped by a backslash
+        delimiters = [re.escape(d) for d in delimiters]
+        cls._delimiter_re = (
+            re.compile(r"(?<!\\)(?:%s)" % "|".join(delimiters)) if delimiters else None
+        )
+        cls._space_re = re.compile(r"(?<!\\) ") if " " in cls.delimiters else None
+        cls._key_wrap_re = (
+            re.compile(r"(?<!\\)" + re.escape(cls.key_wrap_char))
+            if cls.key_wrap_char
+            else None
+        )
+
+    @staticmethod
+    def _search_delimiter(regex, line, start_pos):
+        if regex is None:
+            return None
+        match = regex.search(line, start_pos)
+        # A delimiter at the very start of the line is considered escaped
+        # when the line ends with a backslash
+        if match is not None and match.start() == 0 and line[-1] == "\\":
+            match = regex.search(line, 1)
+        return match
+
     @classmethod
     def find_delimiter(cls, line):
         """Find the type and position of the delimiter in a property line.
@@ -284,53 +328,36 @@ class Dialect:
 
         :param line: A properties line
         :type line: str
-        :param delimiters: valid delimiters
-        :type delimiters: list
         :return: delimiter character and offset within *line*
         :rtype: Tuple (delimiter char, Offset Integer)
         """
-        delimiter_dict = {}
-        for delimiter in cls.delimiters:
-            delimiter_dict[delimiter] = -1
-        delimiters = delimiter_dict
         # Figure out starting position
         start_pos = len(line) - len(line.lstrip())  # Skip initial whitespace
-        if cls.key_wrap_char != "" and line[start_pos] == cls.key_wrap_char:
+        if cls._simple_re is not None:
+            match = cls._simple_re.match(line, start_pos)
+            if match is not None:
+                return (match.group(1), match.start(1))
+        if cls._key_wrap_re is not None and line[start_pos : start_pos + 1] == (
+            cls.key_wrap_char
+        ):
             # Skip the key if it is delimited by some char
-            start_pos += 1
-            while line[start_pos] != cls.key_wrap_char or line[start_pos - 1] == "\\":
-                start_pos += 1
-        # Find the position of each delimiter type
-        for delimiter in delimiters:
-            pos = line.find(delimiter, start_pos)
-            while pos != -1:
-                if delimiters[delimiter] == -1 and line[pos - 1] != "\\":
-                    delimiters[delimiter] = pos
-                    break
-                pos = line.find(delimiter, pos + 1)
-        # Find the first delimiter
-        mindelimiter = None
-        minpos = -1
-        for delimiter, pos in delimiters.items():
-            if pos == -1 or delimiter == " ":
-                continue
-            if minpos == -1 or pos < minpos:
-                minpos = pos
-                mindelimiter = delimiter
-        if mindelimiter is None and delimiters.get(" ", -1) != -1:
+            match = cls._key_wrap_re.search(line, start_pos + 1)
+            start_pos = len(line) if match is None else match.start()
+        match = cls._search_delimiter(cls._delimiter_re, line, start_pos)
+        space = cls._search_delimiter(cls._space_re, line, start_pos)
+        if match is None:
+            if space is None:
+                return (None, -1)
             # Use space delimiter if we found nothing else
-            return (" ", delimiters[" "])
-        if (
-            mindelimiter is not None
-            and " " in delimiters
-            and delimiters[" "] < delimiters[mindelimiter]
-        ):
+            return (" ", space.start())
+        pos = match.start()
+        if space is not None and space.start() < pos:
             # If space delimiter occurs earlier than ":" or "=" then it is the
             # delimiter only if there are non-whitespace characters between it and
             # the other detected delimiter.
-            if len(line[delimiters[" "] : delimiters[mindelimiter]].strip()) > 0:
-                return (" ", delimiters[" "])
-        return (mindelimiter, minpos)
+            if line[space.start() : pos].strip():
+                return (" ", space.start())
+        return (match.group(), pos)
 
     @staticmethod
     def key_strip(key):
@@ -811,7 +838,7 @@ class propunit(base.TranslationUnit):
     def __init__(self, source="", personality="java"):
         """Construct a blank propunit."""
         self.personality = get_dialect(personality)
-        super().__init__(source)
+        super().__init__()
         self.name = ""
         self.value = ""
         self.translation = ""
@@ -982,8 +1009,8 @@ class propfile(base.TranslationStore):
         if inputfile is not None:
             propsrc = inputfile.read()
             inputfile.close()
+            # The index is built on demand by require_index()
             self.parse(propsrc)
-            self.makeindex()
 
     def parse(self, propsrc):
         """Read the source of a properties file in and include them as units."""
@@ -998,87 +1025,92 @@ class propfile(base.TranslationStore):
         self.encoding = encoding
         propsrc = text
 
-        newunit = self.UnitClass("", self.personality.name)
+        personality = self.personality
+        find_delimiter = personality.find_delimiter
+        key_strip = personality.key_strip
+        value_strip = personality.value_strip
+        is_continuation = personality.is_line_continuation
+        strip_continuation = personality.strip_line_continuation
+        drop_comments = personality.drop_comments
+        represents_missing = self.UnitClass.represents_missing
+        add_unit = self.addunit
+
+        def new_unit():
+            return self.UnitClass("", personality.name)
+
+        newunit = new_unit()
         inmultilinevalue = False
         inmultilinecomment = False
         was_header = False
 
         for line in propsrc.split("\n"):
+            line = line.rstrip("\r\n")
             # handle multiline value if we're in one
-            line = quote.rstripeol(line)
             if inmultilinevalue:
                 newunit.value += line.lstrip()
                 # see if there's more
-                inmultilinevalue = self.personality.is_line_continuation(newunit.value)
+                inmultilinevalue = is_continuation(newunit.value)
                 # if we're still waiting for more...
                 if inmultilinevalue:
-                    newunit.value = self.personality.strip_line_continuation(
-                        newunit.value
-                    )
-                if not inmultilinevalue:
+                    newunit.value = strip_continuation(newunit.value)
+                else:
                     # we're finished, add it to the list...
-                    newunit.value = self.personality.value_strip(newunit.value)
-                    self.addunit(newunit)
-                    newunit = self.UnitClass("", self.personality.name)
+                    newunit.value = value_strip(newunit.value)
+                    add_unit(newunit)
+                    newunit = new_unit()
+                continue
+            stripped = line.strip()
+            ismissing = represents_missing(line)
             # otherwise, this could be a comment
             # FIXME handle // inline comments
-            elif (
+            if not ismissing and (
                 inmultilinecomment
-                or is_comment_one_line(line)
-                or is_comment_start(line)
-                or is_comment_end(line)
-            ) and not self.UnitClass.represents_missing(line):
+                or stripped.startswith(("#", "!", "//", ";", "/*"))
+                or stripped.endswith("*/")
+            ):
                 # add a comment
-                if line not in self.personality.drop_comments:
+                if line not in drop_comments:
                     newunit.comments.append(line)
-                if is_comment_start(line):
-                    inmultilinecomment = True
-                elif is_comment_end(line):
+                if stripped.startswith("/*"):
+                    if not stripped.endswith("*/"):
+                        inmultilinecomment = True
+                elif stripped.endswith("*/"):
                     inmultilinecomment = False
-            elif not line.strip():
+                continue
+            if not stripped:
                 # this is a blank line...
                 # avoid adding comment only units
                 if newunit.name:
-                    self.addunit(newunit)
-                    newunit = self.UnitClass("", self.personality.name)
+                    add_unit(newunit)
+                    newunit = new_unit()
                 else:
                     newunit.comments.append("")
 
                 if not was_header and str(newunit).strip():
-                    self.addunit(newunit)
-                    newunit = self.UnitClass("", self.personality.name)
+                    add_unit(newunit)
+                    newunit = new_unit()
                     was_header = True
-
+                continue
+            if ismissing:
+                line = self.UnitClass.strip_missing_part(line)
+            newunit.delimiter, delimiter_pos = find_delimiter(line)
+            newunit.missing = ismissing
+            if delimiter_pos == -1:
+                newunit.name = key_strip(line)
+                newunit.value = ""
+                newunit.delimiter = ""
+                add_unit(newunit)
+                newunit = new_unit()
+                continue
+            newunit.name = key_strip(line[:delimiter_pos])
+            value = line[delimiter_pos + 1 :]
+            if is_continuation(value.lstrip()):
+                inmultilinevalue = True
+                newunit.value = strip_continuation(value.lstrip())
             else:
-                ismissing = False
-                if self.UnitClass.represents_missing(line):
-                    line = self.UnitClass.strip_missing_part(line)
-                    ismissing = True
-                newunit.delimiter, delimiter_pos = self.personality.find_delimiter(line)
-                if delimiter_pos == -1:
-                    newunit.name = self.personality.key_strip(line)
-                    newunit.value = ""
-                    newunit.delimiter = ""
-                    newunit.missing = ismissing
-                    self.addunit(newunit)
-                    newunit = self.UnitClass("", self.personality.name)
-                else:
-                    newunit.name = self.personality.key_strip(line[:delimiter_pos])
-                    newunit.missing = ismissing
-                    if self.personality.is_line_continuation(
-                        line[delimiter_pos + 1 :].lstrip()
-                    ):
-                        inmultilinevalue = True
-                        newunit.value = line[delimiter_pos + 1 :].lstrip()[:-1]
-                        newunit.value = self.personality.strip_line_continuation(
-                            line[delimiter_pos + 1 :].lstrip()
-                        )
-                    else:
-                        newunit.value = self.personality.value_strip(
-                            line[delimiter_pos + 1 :]
-                        )
-                        self.addunit(newunit)
-                        newunit = self.UnitClass("", self.personality.name)
+                newunit.value = value_strip(value)
+                add_unit(newunit)
+                newunit = new_unit()
         # see if there is a leftover one...
         if (
             inmultilinevalue
@@ -43,6 +43,7 @@ lsep = "\n#: "
 
 po_unescape_map = {"\\r": "\r", "\\t": "\t", '\\"': '"', "\\n": "\n", "\\\\": "\\"}
 po_escape_map = {value: key for (key, value) in po_unescape_map.items()}
+po_escape_re = re.compile("[%s]" % re.escape("".join(po_escape_map)))
 
 
 def splitlines(text):
@@ -82,18 +83,7 @@ def escapeforpo(line):
 
     :param line: unescaped text
     """
-    special_locations = []
-    for special_key in po_escape_map:
-        special_locations.extend(quote.find_all(line, special_key))
-    special_locations = sorted(dict.fromkeys(special_locations).keys())
-    escaped_line = []
-    last_location = 0
-    for location in special_locations:
-        escaped_line.append(line[last_location:location])
-        escaped_line.append(po_escape_map[line[location : location + 1]])
-        last_location = location + 1
-    escaped_line.append(line[last_location:])
-    return "".join(escaped_line)
+    return po_escape_re.sub(lambda match: po_escape_map[match.group()], line)
 
 
 def unescapehandler(escape):
@@ -109,6 +99,8 @@ def cjklen(text: str) -> int:
 
     Fullwidth and Wide CJK chars are double-width.
     """
+    if text.isascii():
+        return len(text)
     return sum(
         2 if unicodedata.east_asian_width(char) in WIDE_CHARS else 1 for char in text
     )
@@ -250,6 +242,10 @@ def quoteforpo(text, wrapper_obj=None):
     ):
         polines.append('""')
     for line in lines:
+        if line and cjklen(line) <= wrapper_obj.width:
+            # Nothing to wrap
+            polines.append('"%s"' % line)
+            continue
         lns = wrapper_obj.wrap(line)
         for ln in lns:
             polines.append('"%s"' % ln)
@@ -294,7 +290,7 @@ def unquotefrompo(postr):
 
 
 def is_null(lst):
-    return lst == [] or len(lst) == 1 and lst[0] == '""'
+    return lst == [] or lst is _EMPTY or len(lst) == 1 and lst[0] == '""'
 
 
 def extractstr(string):
@@ -305,6 +301,31 @@ def extractstr(string):
     return string[left:] + '"'
 
 
+_EMPTY = ()
+"""Shared placeholder for the lists of a :class:`pounit` which are empty."""
+
+
+def _lazylist(name):
+    """Property for a list of a :class:`pounit` stored in the slot ``name``.
+
+    Absent lists share the :data:`_EMPTY` placeholder and a list is only
+    allocated when the attribute is accessed, so that it can be modified in
+    place.  Code only reading the list should use the slot directly.
+    """
+
+    def getter(self):
+        value = getattr(self, name)
+        if value is _EMPTY:
+            value = []
+            setattr(self, name, value)
+        return value
+
+    def setter(self, value):
+        setattr(self, name, value)
+
+    return property(getter, setter)
+
+
 class pounit(pocommon.pounit):
     # othercomments = []      #   # this is another comment
     # automaticcomments = []  #   #. comment extracted from the source code
@@ -318,21 +339,83 @@ class pounit(pocommon.pounit):
     # msgid = []
     # msgstr = []
 
+    # Catalogs can have many thousands of units, so the state lives in slots
+    # and the lists which are usually empty are only allocated on access (see
+    # _lazylist). The base classes still provide a __dict__ which is only
+    # allocated when other attributes are set.
+    __slots__ = (
+        "wrapper",
+        "obsolete",
+        "msgid",
+        "msgstr",
+        "_othercomments",
+        "_automaticcomments",
+        "_sourcecomments",
+        "_typecomments",
+        "_msgidcomments",
+        "_prev_msgctxt",
+        "_prev_msgid",
+        "_prev_msgid_plural",
+        "_msgctxt",
+        "_msgid_pluralcomments",
+        "_msgid_plural",
+        "_store",
+        "_rich_source",
+        "_rich_target",
+        "_state_n",
+    )
+
+    othercomments = _lazylist("_othercomments")
+    automaticcomments = _lazylist("_automaticcomments")
+    sourcecomments = _lazylist("_sourcecomments")
+    typecomments = _lazylist("_typecomments")
+    msgidcomments = _lazylist("_msgidcomments")
+    prev_msgctxt = _lazylist("_prev_msgctxt")
+    prev_msgid = _lazylist("_prev_msgid")
+    prev_msgid_plural = _lazylist("_prev_msgid_plural")
+    msgctxt = _lazylist("_msgctxt")
+    msgid_pluralcomments = _lazylist("_msgid_pluralcomments")
+    msgid_plural = _lazylist("_msgid_plural")
+
     # Our homegrown way to indicate what must be copied in a shallow
     # fashion
     __shallow__ = ["_store", "wrapper"]
+    # The slots holding lists of strings, which are copied without copying
+    # the strings (msgstr is a dict for plurals)
+    _copied_lists = (
+        "msgid",
+        "msgstr",
+        "_othercomments",
+        "_automaticcomments",
+        "_sourcecomments",
+        "_typecomments",
+        "_msgidcomments",
+        "_prev_msgctxt",
+        "_prev_msgid",
+        "_prev_msgid_plural",
+        "_msgctxt",
+        "_msgid_pluralcomments",
+        "_msgid_plural",
+    )
+    _copied_slots = tuple(
+        sorted(set(__slots__) - set(__shallow__) - set(_copied_lists))
+    )
 
     def __init__(self, source=None, wrapper=None, **kwargs):
         self.wrapper = wrapper
         self.obsolete = False
+        self._store = None
+        self._rich_source = None
+        self._rich_target = None
+        self._state_n = 0
         self._initallcomments(blankall=True)
-        self.prev_msgctxt = []
-        self.prev_msgid = []
-        self.prev_msgid_plural = []
-        self.msgctxt = []
+        self._prev_msgctxt = _EMPTY
+        self._prev_msgid = _EMPTY
+        self._prev_msgid_plural = _EMPTY
+        self._msgctxt = _EMPTY
         self.msgid = []
-        self.msgid_pluralcomments = []
-        self.msgid_plural = []
+        self._msgid_pluralcomments = _EMPTY
+        self._msgid_plural = _EMPTY
         self.msgstr = []
         super().__init__(source)
 
@@ -345,11 +428,11 @@ class pounit(pocommon.pounit):
     def _initallcomments(self, blankall=False):
         """Initialises allcomments"""
         if blankall:
-            self.othercomments = []
-            self.automaticcomments = []
-            self.sourcecomments = []
-            self.typecomments = []
-            self.msgidcomments = []
+            self._othercomments = _EMPTY
+            self._automaticcomments = _EMPTY
+            self._sourcecomments = _EMPTY
+            self._typecomments = _EMPTY
+            self._msgidcomments = _EMPTY
 
     def _get_all_comments(self):
         return [
@@ -382,16 +465,16 @@ class pounit(pocommon.pounit):
             if len(source) > 1:
                 msgid_plural = self.quote(source[1])
             else:
-                msgid_plural = []
+                msgid_plural = _EMPTY
         else:
             msgid = self.quote(source)
-            msgid_plural = []
+            msgid_plural = _EMPTY
         return msgid, msgid_plural
 
     @property
     def source(self):
         """Returns the unescaped msgid"""
-        return self._get_source_vars(self.msgid, self.msgid_plural)
+        return self._get_source_vars(self.msgid, self._msgid_plural)
 
     @source.setter
     def source(self, source):
@@ -404,7 +487,7 @@ class pounit(pocommon.pounit):
 
     def _get_prev_source(self):
         """Returns the unescaped msgid"""
-        return self._get_source_vars(self.prev_msgid, self.prev_msgid_plural)
+        return self._get_source_vars(self._prev_msgid, self._prev_msgid_plural)
 
     def _set_prev_source(self, source):
         """Sets the msgid to the given (unescaped) value.
@@ -475,18 +558,18 @@ class pounit(pocommon.pounit):
         """
         if origin is None:
             comments = "".join(
-                comment[2:] or self.newline for comment in self.othercomments
+                comment[2:] or self.newline for comment in self._othercomments
             )
             comments += "".join(
-                comment[3:] or self.newline for comment in self.automaticcomments
+                comment[3:] or self.newline for comment in self._automaticcomments
             )
         elif origin == "translator":
             comments = "".join(
-                comment[2:] or self.newline for comment in self.othercomments
+                comment[2:] or self.newline for comment in self._othercomments
             )
         elif origin in ["programmer", "developer", "source code"]:
             comments = "".join(
-                comment[3:] or self.newline for comment in self.automaticcomments
+                comment[3:] or self.newline for comment in self._automaticcomments
             )
         else:
             raise ValueError("Comment type not valid")
@@ -524,7 +607,7 @@ class pounit(pocommon.pounit):
 
     def removenotes(self, origin=None):
         """Remove all the translator's notes (other comments)"""
-        self.othercomments = []
+        self._othercomments = _EMPTY
 
     def __deepcopy__(self, memo={}):
         # Make an instance to serve as the copy
@@ -532,8 +615,18 @@ class pounit(pocommon.pounit):
         # We'll be testing membership frequently, so make a set from
         # self.__shallow__
         shallow = set(self.__shallow__)
+        # Copy the lists, sharing their strings
+        for key in self._copied_lists:
+            value = getattr(self, key)
+            if type(value) is list:
+                value = value[:]
+            elif value is not _EMPTY:
+                value = copy.deepcopy(value)
+            setattr(new_unit, key, value)
         # Make deep copies of all members which are not in shallow
-        for key, value in self.__dict__.items():
+        for key in self._copied_slots:
+            setattr(new_unit, key, copy.deepcopy(getattr(self, key)))
+        for key, value in getattr(self, "__dict__", {}).items():
             if key not in shallow:
                 setattr(new_unit, key, copy.deepcopy(value))
         # Make shallow copies of all members which are in shallow
@@ -551,7 +644,7 @@ class pounit(pocommon.pounit):
     def _msgidlen(self):
         if self.hasplural():
             return len(unquotefrompo(self.msgid)) + len(
-                unquotefrompo(self.msgid_plural)
+                unquotefrompo(self._msgid_plural)
             )
         return len(unquotefrompo(self.msgid))
 
@@ -647,17 +740,17 @@ class pounit(pocommon.pounit):
         return (
             is_null(self.msgid)
             and not is_null(self.msgstr)
-            and self.msgidcomments == []
-            and is_null(self.msgctxt)
+            and not self._msgidcomments
+            and is_null(self._msgctxt)
         )
 
     def isblank(self):
-        if self.isheader() or self.msgidcomments:
+        if self.isheader() or self._msgidcomments:
             return False
         if (
             (self._msgidlen() == 0)
             and (self._msgstrlen() == 0)
-            and (is_null(self.msgctxt))
+            and (is_null(self._msgctxt))
         ):
             return True
         return False
@@ -666,7 +759,7 @@ class pounit(pocommon.pounit):
         # return len(self.source.strip()) == 0
 
     def _extracttypecomment(self):
-        for tc in self.typecomments:
+        for tc in self._typecomments:
             for flag in tc.split(","):
                 value = flag.strip()
                 if not value or value == "#":
@@ -675,7 +768,7 @@ class pounit(pocommon.pounit):
 
     def hastypecomment(self, typecomment, parsed=None):
         """Check whether the given type comment is present"""
-        if not self.typecomments:
+        if not self._typecomments:
             return False
         if not parsed:
             parsed = self._extracttypecomment()
@@ -689,7 +782,7 @@ class pounit(pocommon.pounit):
                 # (commentmarker) ...
         """
         commentmarker = "(%s)" % commentmarker
-        for comment in self.othercomments:
+        for comment in self._othercomments:
             if comment.replace("#", "", 1).strip().startswith(commentmarker):
                 return True
         return False
@@ -707,7 +800,7 @@ class pounit(pocommon.pounit):
                 comments_str = ", ".join(typecomments)
                 self.typecomments = [f"#, {comments_str}{self.newline}"]
             else:
-                self.typecomments = []
+                self._typecomments = _EMPTY
 
     def isfuzzy(self):
         return self.hastypecomment("fuzzy")
@@ -737,8 +830,8 @@ class pounit(pocommon.pounit):
         """Makes this unit obsolete"""
         super().makeobsolete()
         self.obsolete = True
-        self.sourcecomments = []
-        self.automaticcomments = []
+        self._sourcecomments = _EMPTY
+        self._automaticcomments = _EMPTY
 
     def resurrect(self):
         """Makes an obsolete unit normal"""
@@ -747,7 +840,7 @@ class pounit(pocommon.pounit):
 
     def hasplural(self):
         """returns whether this pounit contains plural strings..."""
-        return len(self.msgid_plural) > 0
+        return len(self._msgid_plural) > 0
 
     def _getmsgpartstr(self, partname, partlines, partcomments=""):
         if isinstance(partlines, dict):
@@ -816,25 +909,27 @@ class pounit(pocommon.pounit):
                 lines.extend(f"{prefix} {line}\n" for line in var[1:])
 
         def add_prev_msgid_info(lines, prefix):
-            add_prev_msgid_lines(lines, prefix, "msgctxt", self.prev_msgctxt)
-            add_prev_msgid_lines(lines, prefix, "msgid", self.prev_msgid)
-            add_prev_msgid_lines(lines, prefix, "msgid_plural", self.prev_msgid_plural)
+            add_prev_msgid_lines(lines, prefix, "msgctxt", self._prev_msgctxt)
+            add_prev_msgid_lines(lines, prefix, "msgid", self._prev_msgid)
+            add_prev_msgid_lines(lines, prefix, "msgid_plural", self._prev_msgid_plural)
 
         lines = []
-        lines.extend(self.othercomments)
+        lines.extend(self._othercomments)
         if self.isobsolete():
-            lines.extend(self.typecomments)
+            lines.extend(self._typecomments)
             obsoletelines = []
             add_prev_msgid_info(obsoletelines, prefix="#~|")
-            if self.msgctxt:
-                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", self.msgctxt))
+            if self._msgctxt:
+                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", self._msgctxt))
             obsoletelines.append(
-                self._getmsgpartstr("#~ msgid", self.msgid, self.msgidcomments)
+                self._getmsgpartstr("#~ msgid", self.msgid, self._msgidcomments)
             )
-            if self.msgid_plural or self.msgid_pluralcomments:
+            if self._msgid_plural or self._msgid_pluralcomments:
                 obsoletelines.append(
                     self._getmsgpartstr(
-                        "#~ msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                        "#~ msgid_plural",
+                        self._msgid_plural,
+                        self._msgid_pluralcomments,
                     )
                 )
             obsoletelines.append(self._getmsgpartstr("#~ msgstr", self.msgstr))
@@ -847,20 +942,20 @@ class pounit(pocommon.pounit):
         # header this will also discard any comments other than plain
         # othercomments...
         if is_null(self.msgid) and not (
-            self.isheader() or self.getcontext() or self.sourcecomments
+            self.isheader() or self.getcontext() or self._sourcecomments
         ):
             return "".join(lines)
-        lines.extend(self.automaticcomments)
-        lines.extend(self.sourcecomments)
-        lines.extend(self.typecomments)
+        lines.extend(self._automaticcomments)
+        lines.extend(self._sourcecomments)
+        lines.extend(self._typecomments)
         add_prev_msgid_info(lines, prefix="#|")
-        if self.msgctxt:
-            lines.append(self._getmsgpartstr("msgctxt", self.msgctxt))
-        lines.append(self._getmsgpartstr("msgid", self.msgid, self.msgidcomments))
-        if self.msgid_plural or self.msgid_pluralcomments:
+        if self._msgctxt:
+            lines.append(self._getmsgpartstr("msgctxt", self._msgctxt))
+        lines.append(self._getmsgpartstr("msgid", self.msgid, self._msgidcomments))
+        if self._msgid_plural or self._msgid_pluralcomments:
             lines.append(
                 self._getmsgpartstr(
-                    "msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                    "msgid_plural", self._msgid_plural, self._msgid_pluralcomments
                 )
             )
         lines.append(self._getmsgpartstr("msgstr", self.msgstr))
@@ -874,7 +969,7 @@ class pounit(pocommon.pounit):
 
         """
         locations = []
-        for sourcecomment in self.sourcecomments:
+        for sourcecomment in self._sourcecomments:
             locations += quote.rstripeol(sourcecomment)[3:].split()
         for i, loc in enumerate(locations):
             locations[i] = pocommon.unquote_plus(loc)
@@ -899,20 +994,20 @@ class pounit(pocommon.pounit):
         """
 
         if not text:
-            text = unquotefrompo(self.msgidcomments)
+            text = unquotefrompo(self._msgidcomments)
         return text.split(self.newline)[0].replace("_: ", "", 1)
 
     def setmsgidcomment(self, msgidcomment):
         if msgidcomment:
             self.msgidcomments = ['"_: %s\\n"' % msgidcomment]
         else:
-            self.msgidcomments = []
+            self._msgidcomments = _EMPTY
 
     msgidcomment = property(_extract_msgidcomments, setmsgidcomment)
 
     def getcontext(self):
         """Get the message context."""
-        return unquotefrompo(self.msgctxt) + self._extract_msgidcomments()
+        return unquotefrompo(self._msgctxt) + self._extract_msgidcomments()
 
     def setcontext(self, context):
         self.msgctxt = self.quote(context)
@@ -926,7 +1021,7 @@ class pounit(pocommon.pounit):
         # commented out for conformance to gettext.
         #        id = '\0'.join(self.source.strings)
         id = self.source
-        if self.msgidcomments:
+        if self._msgidcomments:
             id = f"_: {context}\n{id}"
         elif context:
             id = f"{context}\04{id}"
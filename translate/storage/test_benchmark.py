@@ -0,0 +1,32 @@
+from pytest import raises
+
+from translate.storage import benchmark
+
+
+def test_select_scenarios():
+    assert benchmark.select_scenarios(["matcher", "matcher"]) == ["matcher"]
+    parse = benchmark.select_scenarios(["parse:"])
+    assert "parse:po" in parse
+    assert all(name.startswith("parse:") for name in parse)
+    assert len(benchmark.select_scenarios(["all"])) == len(benchmark.SCENARIOS)
+    with raises(ValueError):
+        benchmark.select_scenarios(["nonexistent"])
+
+
+def test_sample_data_is_reproducible():
+    assert benchmark.SampleData(1).units(10) == benchmark.SampleData(1).units(10)
+    assert benchmark.SampleData(1).units(10) != benchmark.SampleData(2).units(10)
+
+
+def test_run_suite(capsys):
+    report = benchmark.run_suite(
+        ["parse:po", "parse:qm", "pofilter"], [5], warmup=0, repeat=2
+    )
+    results = {result["scenario"]: result for result in report["results"]}
+    assert results["parse:po"]["repeat"] == 2
+    assert results["parse:po"]["min"] <= results["parse:po"]["median"]
+    assert results["parse:po"]["peak_memory"] > 0
+    assert results["pofilter"]["size"] == 5
+    # Writing of .qm files is not supported
+    assert "skipped" in results["parse:qm"]
+    assert "pofilter [5]" in capsys.readouterr().out
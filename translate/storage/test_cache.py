@@ -0,0 +1,220 @@
+import os
+
+import pytest
+
+from translate.misc.multistring import multistring
+from translate.storage import cache, csvl10n, factory, po, xliff
+
+
+POSOURCE = r"""msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\n"
+
+#. Developer note
+#: file.c:12 file.c:34
+msgctxt "menu"
+msgid "Open"
+msgstr "Oop"
+
+#, fuzzy
+msgid "Close"
+msgstr "Maak toe"
+
+msgid "one file"
+msgid_plural "%d files"
+msgstr[0] "een lêer"
+msgstr[1] "%d lêers"
+
+#~ msgid "Old"
+#~ msgstr "Oud"
+"""
+
+
+@pytest.fixture
+def pofilename(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.po")
+    with open(filename, "wb") as fh:
+        fh.write(POSOURCE.encode("utf-8"))
+    return filename
+
+
+def test_roundtrip(pofilename):
+    original = po.pofile.parsefile(pofilename)
+    cachefile = cache.write_cache(original, pofilename)
+    assert cachefile == pofilename + cache.CACHE_SUFFIX
+    assert cache.is_fresh(pofilename)
+    cached = cache.load_cache(pofilename)
+    assert cached.filename == pofilename
+    assert len(cached.units) == len(original.units)
+    for orig, unit in zip(original.units, cached.units):
+        assert unit.source == orig.source
+        assert unit.target == orig.target
+        assert unit.getcontext() == orig.getcontext()
+        assert unit.getid() == orig.getid()
+        assert unit.getlocations() == orig.getlocations()
+        assert unit.getnotes() == orig.getnotes()
+        assert unit.isfuzzy() == orig.isfuzzy()
+        assert unit.isobsolete() == orig.isobsolete()
+        assert unit.isheader() == orig.isheader()
+        assert unit.get_state_n() == orig.get_state_n()
+    plural = cached.units[3]
+    assert plural.hasplural()
+    assert isinstance(plural.target, multistring)
+    assert plural.target.strings == ["een lêer", "%d lêers"]
+    cached.close()
+
+
+def test_lazy_iteration(pofilename):
+    cache.write_cache(po.pofile.parsefile(pofilename), pofilename)
+    cached = cache.load_cache(pofilename)
+    sources = [unit.source for unit in cached.unit_iter()]
+    assert cached._units is None
+    assert sources[1] == "Open"
+    assert cached.findunit("Close").target == "Maak toe"
+    cached.close()
+
+
+def test_stale(pofilename):
+    cache.write_cache(po.pofile.parsefile(pofilename), pofilename)
+    with open(pofilename, "ab") as fh:
+        fh.write(b'\nmsgid "New"\nmsgstr ""\n')
+    assert not cache.is_fresh(pofilename)
+    assert cache.load_cache(pofilename) is None
+
+
+def test_invalid(pofilename):
+    with open(cache.cache_path(pofilename), "wb") as fh:
+        fh.write(b"garbage")
+    assert not cache.is_fresh(pofilename)
+    assert cache.load_cache(pofilename) is None
+    with pytest.raises(cache.CacheError):
+        cache.cachestore(cache.cache_path(pofilename))
+
+
+def test_serialize(pofilename):
+    cache.write_cache(po.pofile.parsefile(pofilename), pofilename)
+    with open(cache.cache_path(pofilename), "rb") as fh:
+        data = fh.read()
+    cached = cache.cachestore.parsestring(data)
+    assert [unit.source for unit in cached.units][1:3] == ["Open", "Close"]
+    assert bytes(cached) == data
+    with open(cache.cache_path(pofilename), "rb") as fh:
+        assert bytes(cache.cachestore.parsefile(fh)) == data
+
+
+def unit_values(store):
+    return [
+        (
+            unit.source,
+            unit.target,
+            unit.getcontext(),
+            unit.getid(),
+            unit.getlocations(),
+            unit.getnotes("translator"),
+            unit.getnotes("developer"),
+            unit.isfuzzy(),
+            unit.isobsolete(),
+            unit.get_state_n(),
+        )
+        for unit in store.units
+    ]
+
+
+def test_tostore(pofilename):
+    original = po.pofile.parsefile(pofilename)
+    cache.write_cache(original, pofilename)
+    cached = cache.load_cache(pofilename)
+    assert cached.complete
+    rebuilt = cached.tostore(po.pofile)
+    assert isinstance(rebuilt, po.pofile)
+    assert rebuilt.filename == pofilename
+    assert unit_values(rebuilt) == unit_values(original)
+    assert rebuilt.units[3].target.strings == ["een lêer", "%d lêers"]
+    assert rebuilt.units[4].isobsolete()
+    # Only the class the cache was written from can be rebuilt
+    assert cached.tostore(csvl10n.csvfile) is None
+
+
+def test_factory(tmp_path, monkeypatch):
+    # A file written by the toolkit is also serialized identically
+    filename = os.path.join(str(tmp_path), "test.po")
+    original = po.pofile()
+    unit = original.addsourceunit("Open")
+    unit.target = "Oop"
+    unit.setcontext("menu")
+    unit.addlocation("file.c:12")
+    unit.addlocation("file.c:34")
+    unit.addnote("Developer note", origin="developer")
+    unit = original.addsourceunit(multistring(["one file", "%d files"]))
+    unit.target = multistring(["een lêer", "%d lêers"])
+    unit.markfuzzy()
+    original.savefile(filename)
+    store = factory.getobject(filename, use_cache=True)
+    assert isinstance(store, po.pofile)
+    assert os.path.exists(cache.cache_path(filename))
+    with monkeypatch.context() as patch:
+        # A cache hit does not parse the file
+        patch.setattr(po.pofile, "parsefile", None)
+        cached = factory.getobject(filename, use_cache=True)
+    assert type(cached) is type(store)
+    assert unit_values(cached) == unit_values(store)
+    assert bytes(cached) == bytes(store)
+    # Without the flag the cache is ignored
+    assert isinstance(factory.getobject(filename), po.pofile)
+
+
+XLIFFSOURCE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:1.1" version="1.1">
+  <file original="one.txt" source-language="en" datatype="plaintext">
+    <body>
+      <trans-unit xml:space="preserve" id="1" approved="yes">
+        <source>One</source>
+        <target state="translated">Een</target>
+        <note from="developer">Number</note>
+      </trans-unit>
+      <trans-unit xml:space="preserve" id="2">
+        <source>Two</source>
+        <target state="needs-review-translation">Twee</target>
+      </trans-unit>
+    </body>
+  </file>
+  <file original="two.txt" source-language="en" datatype="plaintext">
+    <body>
+      <trans-unit xml:space="preserve" id="1">
+        <source>Three</source>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>
+"""
+
+
+def test_factory_xliff(tmp_path, monkeypatch):
+    filename = os.path.join(str(tmp_path), "test.xlf")
+    with open(filename, "wb") as fh:
+        fh.write(XLIFFSOURCE)
+    store = factory.getobject(filename, use_cache=True)
+    assert cache.load_cache(filename).complete
+    with monkeypatch.context() as patch:
+        patch.setattr(xliff.xlifffile, "parsefile", None)
+        cached = factory.getobject(filename, use_cache=True)
+    assert type(cached) is xliff.xlifffile
+    assert unit_values(cached) == unit_values(store)
+    assert cached.getfilenames() == ["one.txt", "two.txt"]
+
+
+def test_factory_incomplete(tmp_path):
+    # The unit API can not set a final state on a unit which is not approved
+    filename = os.path.join(str(tmp_path), "test.xlf")
+    with open(filename, "wb") as fh:
+        fh.write(
+            XLIFFSOURCE.replace(b'"translated"', b'"final"').replace(b"yes", b"no")
+        )
+    store = factory.getobject(filename, use_cache=True)
+    assert not cache.load_cache(filename).complete
+    cached = factory.getobject(filename, use_cache=True)
+    assert (
+        bytes(cached)
+        == bytes(store)
+        == XLIFFSOURCE.replace(b'"translated"', b'"final"').replace(b"yes", b"no")
+    )
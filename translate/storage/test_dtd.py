@@ -370,6 +370,35 @@ certificate.">
         assert len(dtdfile.units) == 1
         assert recwarn.pop(Warning)
 
+    def test_invalid_encoding(self, recwarn):
+        """test that only the entity with undecodable bytes is dropped"""
+        dtdsource = b'<!ENTITY bad "\xfc">\n<!ENTITY good "correct">\n'
+        dtdfile = self.dtdparse(dtdsource)
+        assert [unit.entity for unit in dtdfile.units] == ["good"]
+        assert recwarn.pop(Warning)
+
+    def test_many_entities(self):
+        """checks that the units are split correctly in a longer file"""
+        dtdsource = "".join(
+            '<!-- LOCALIZATION NOTE (e%d): note -->\n<!ENTITY e%d "Value %d">\n'
+            % (i, i, i)
+            for i in range(200)
+        )
+        dtdfile = self.dtdparse(dtdsource)
+        assert len(dtdfile.units) == 200
+        assert dtdfile.units[150].source == "Value 150"
+        assert bytes(dtdfile).decode("utf-8") == dtdsource
+
+    def test_validate(self, recwarn):
+        """checks that the output is only validated when asked for"""
+        dtdsource = b'<!ENTITY good "correct">\n<!ENTITY bad "&#x;">\n'
+        dtdfile = self.dtdparse(dtdsource)
+        assert bytes(dtdfile) == dtdsource
+        assert not recwarn.list
+        dtdfile.validate = True
+        assert bytes(dtdfile) == b""
+        assert recwarn.pop(Warning)
+
     # Test for bug #68
     def test_entity_escaping(self):
         """Test entities escaping (&amp; &quot; &lt; &gt; &apos;) (bug #68)"""
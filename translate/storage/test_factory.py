@@ -119,6 +119,18 @@ class BaseTestFactory:
         store = factory.getobject(filename)
         assert isinstance(store, self.expected_instance)
 
+    def test_iterunits(self):
+        """Test that iterunits yields the units of the file."""
+        store = factory.getobject(givefile(self.filename, self.file_content))
+        fileobj = givefile(self.filename, self.file_content)
+        units = factory.iterunits(fileobj)
+        assert [unit.source for unit in units] == [unit.source for unit in store.units]
+        filename = os.path.join(self.testdir, self.filename + ".gz")
+        with GzipFile(filename, mode="wb") as gzfile:
+            gzfile.write(self.file_content)
+        units = factory.iterunits(filename)
+        assert [unit.source for unit in units] == [unit.source for unit in store.units]
+
     def test_directory(self):
         """Test that a directory is correctly detected."""
         object = factory.getobject(self.testdir)
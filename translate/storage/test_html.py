@@ -18,6 +18,8 @@
 
 """Tests for the HTML classes"""
 
+from io import BytesIO, StringIO
+
 from pytest import raises
 
 from translate.storage import base, html
@@ -38,6 +40,23 @@ def test_guess_encoding():
         )
         == "iso-8859-1"
     )
+    # Only the document head is searched
+    h = html.htmlfile()
+    assert (
+        h.guess_encoding(
+            b"""<html><head><title>Charsets</title></head><body><p>charset=ISO-8859-1</p><meta charset="UTF-16"></body></html>"""
+        )
+        == "utf-8"
+    )
+    # Only the start of a document without head is searched
+    h = html.htmlfile()
+    assert (
+        h.guess_encoding(
+            b"<p>Text</p>" * 10000
+            + b"""<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">"""
+        )
+        == "utf-8"
+    )
 
 
 class TestHTMLParsing:
@@ -76,6 +95,66 @@ class TestHTMLParsing:
         print(store.units[0].source)
         assert len(store.units) == 1
 
+    @staticmethod
+    def test_parse_file_chunks(monkeypatch):
+        """Parsing a file in small chunks gives the same result"""
+        htmlsrc = """<html><head><meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1"><title>Caf\xe9</title></head>
+<body><h1 title="A &amp; B">First</h1><script>if (a < b) { c(); }</script>
+<p>Some <b>bold</b> text &amp; an <a href="#x" title="Link">anchor</a>.</p>
+<!-- comment --><p>Second<br>line</p></body></html>
+"""
+        expected = html.htmlfile(BytesIO(htmlsrc.encode("iso-8859-1")))
+        monkeypatch.setattr(html.htmlfile, "CHUNK_SIZE", 7)
+        chunked = html.htmlfile(BytesIO(htmlsrc.encode("iso-8859-1")))
+        assert chunked.encoding == "iso-8859-1"
+        assert [unit.source for unit in chunked.units] == [
+            unit.source for unit in expected.units
+        ]
+        assert [unit.getlocations() for unit in chunked.units] == [
+            unit.getlocations() for unit in expected.units
+        ]
+        assert chunked.filesrc == expected.filesrc
+
+    @staticmethod
+    def test_parse_file_headless(monkeypatch):
+        """A large document without head is streamed after its first bytes"""
+        htmlsrc = (
+            b"<p>Some text</p>\n" * 50000
+            + b'<meta http-equiv="Content-Type" content="text/html; charset=UTF-16">'
+        )
+        inputfile = BytesIO(htmlsrc)
+        fed = []
+        feed_text = html.htmlfile.feed_text
+
+        def record_feed(self, text):
+            if not inputfile.closed:
+                fed.append(inputfile.tell())
+            feed_text(self, text)
+
+        monkeypatch.setattr(html.htmlfile, "feed_text", record_feed)
+        store = html.htmlfile(inputfile)
+        # The charset at the end is not seen
+        assert store.encoding == "utf-8"
+        assert len(store.units) == 50000
+        assert fed[0] <= html.htmlfile.SNIFF_SIZE + html.htmlfile.CHUNK_SIZE
+        assert len(fed) > 10
+
+    @staticmethod
+    def test_invalid_charref():
+        """Parsing continues after an invalid character reference"""
+        h = html.htmlfile()
+        store = h.parsestring("<p>One &#; two</p><p>Three</p>")
+        assert [unit.source for unit in store.units] == ["One &#; two", "Three"]
+
+    @staticmethod
+    def test_output():
+        """The document can be written to an output stream"""
+        output = StringIO()
+        h = html.htmlfile(BytesIO(b"<p>Hello</p>"), output=output)
+        assert h.units[0].source == "Hello"
+        assert h.filesrc == ""
+        assert output.getvalue() == "<p>Hello</p>"
+
 
 class TestHTMLExtraction:
     h = html.htmlfile
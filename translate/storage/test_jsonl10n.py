@@ -1,3 +1,4 @@
+import json
 from io import BytesIO
 
 from pytest import raises
@@ -200,6 +201,17 @@ JSON_ARB = b"""{
 """
 
 
+def assert_iterparse(store, data):
+    """Checks that iterparse yields the units parse finds, without adding them"""
+    parsed = type(store)(data)
+    units = list(store.iterparse(data))
+    assert [(unit.getid(), unit.source, unit.getnotes()) for unit in units] == [
+        (unit.getid(), unit.source, unit.getnotes()) for unit in parsed.units
+    ]
+    assert store.units == []
+    return units
+
+
 class TestJSONResourceUnit(test_monolingual.TestMonolingualUnit):
     UnitClass = jsonl10n.BaseJsonUnit
 
@@ -279,6 +291,32 @@ class TestJSONResourceStore(test_monolingual.TestMonolingualStore):
         store.serialize(out)
         assert out.getvalue() == content
 
+    def test_serialize_large(self):
+        data = {f"key{i}": f"value {i}" for i in range(3000)}
+        content = json.dumps(data, indent=4, separators=(",", ": ")) + "\n"
+        store = self.StoreClass()
+        store.parse(content.encode("utf-8-sig"))
+        assert len(store.units) == 3000
+        out = BytesIO()
+        store.serialize(out)
+        assert out.getvalue() == content.encode("utf-8-sig")
+
+    def test_iterparse(self):
+        units = assert_iterparse(self.StoreClass(), JSON_COMPLEX)
+        assert len(units) == 8
+        assert units[7].getid() == ".key4[1][1]"
+        assert assert_iterparse(self.StoreClass(), JSON_COMPLEX_ARRAY)
+        assert assert_iterparse(self.StoreClass(), b'"value"') == []
+
+        store = self.StoreClass(filter=["key"])
+        units = list(store.iterparse('{"key": "value", "other": {"key": "second"}}'))
+        assert [unit.source for unit in units] == ["value", "second"]
+
+        with raises(base.ParseError):
+            list(self.StoreClass().iterparse('{"key": "value", "other": ["x" "y"]}'))
+        with raises(base.ParseError):
+            list(self.StoreClass().iterparse('{"key": "value"} {}'))
+
     def test_complex(self):
         store = self.StoreClass()
         store.parse(JSON_COMPLEX)
@@ -388,6 +426,10 @@ class TestJSONResourceStore(test_monolingual.TestMonolingualStore):
 class TestJSONNestedResourceStore(test_monolingual.TestMonolingualUnit):
     StoreClass = jsonl10n.JsonNestedFile
 
+    def test_iterparse(self):
+        units = assert_iterparse(self.StoreClass(), JSON_COMPLEX)
+        assert all(isinstance(unit, jsonl10n.JsonNestedUnit) for unit in units)
+
     def test_serialize(self):
         store = self.StoreClass()
         store.parse('{"key": {"second": "value"}}')
@@ -560,6 +602,57 @@ class TestJSONNestedResourceStore(test_monolingual.TestMonolingualUnit):
         "nesting": "Test"
     }
 }
+"""
+        )
+
+    def test_shared_prefix(self):
+        data = """{
+    "menu": {
+        "file": {
+            "open": "Open",
+            "save": "Save"
+        },
+        "items": [
+            "Edit",
+            "View"
+        ]
+    }
+}
+"""
+        store = self.StoreClass()
+        store.parse(data)
+        assert [unit.getid() for unit in store.units] == [
+            ".menu.file.open",
+            ".menu.file.save",
+            ".menu.items[0]",
+            ".menu.items[1]",
+        ]
+        assert store.units[1].get_unitid().parts == [
+            ("key", "menu"),
+            ("key", "file"),
+            ("key", "save"),
+        ]
+        store.units[0].target = "Open…"
+        assert bytes(store).decode() == data.replace('"Open"', '"Open…"')
+
+    def test_replace_container(self):
+        store = self.StoreClass()
+        for unitid, source in (
+            (".menu.file", "File"),
+            (".menu.view", "View"),
+            (".menu", "Menu"),
+            (".menu.edit", "Edit"),
+        ):
+            unit = self.StoreClass.UnitClass(source)
+            unit.setid(unitid)
+            store.addunit(unit)
+        assert (
+            bytes(store).decode()
+            == """{
+    "menu": {
+        "edit": "Edit"
+    }
+}
 """
         )
 
@@ -634,6 +727,7 @@ class TestWebExtensionStore(test_monolingual.TestMonolingualStore):
         store = self.StoreClass()
         store.parse(DATA)
         assert store.units[0].placeholders is not None
+        assert assert_iterparse(self.StoreClass(), DATA)[0].placeholders
         out = BytesIO()
         store.serialize(out)
 
@@ -693,6 +787,19 @@ class TestI18NextStore(test_monolingual.TestMonolingualStore):
 
         assert out.getvalue().decode() == JSON_I18NEXT
 
+    def test_iterparse(self):
+        units = assert_iterparse(self.StoreClass(), JSON_I18NEXT)
+        assert units[2].source == multistring(["the singular", "the plural"])
+        assert len(units[3].source.strings) == 6
+        assert assert_iterparse(self.StoreClass(), JSON_I18NEXT_NESTED_ARRAY)
+
+        # The plural keys are grouped across the nested values
+        units = assert_iterparse(
+            self.StoreClass(),
+            '{"a": "A", "b": {"c": "C"}, "a_plural": "As", "d": ["x", {"e": "E"}]}',
+        )
+        assert [unit.getid() for unit in units] == [".a", ".b.c", ".d[0]", ".d[1].e"]
+
     def test_nested_array(self):
         store = self.StoreClass()
         store.parse(JSON_I18NEXT_NESTED_ARRAY)
@@ -800,6 +907,13 @@ class TestGoTextJsonFile(test_monolingual.TestMonolingualStore):
 
         assert bytes(store).decode() == JSON_GOTEXT.decode()
 
+    def test_iterparse(self):
+        # Parsed completely with its own extraction of units
+        store = self.StoreClass()
+        units = list(store.iterparse(JSON_GOTEXT))
+        assert units == store.units
+        assert len(units) == 2
+
     def test_plurals_missing(self):
         store = self.StoreClass()
         store.parse(JSON_GOTEXT)
@@ -1,8 +1,10 @@
 import os
+import struct
 import subprocess
 import sys
 from io import BytesIO
 
+from translate.misc.multistring import multistring
 from translate.storage import factory, mo, test_base
 from translate.tools import pocompile
 
@@ -492,6 +494,89 @@ class TestMOFile(test_base.TestTranslationStore):
         assert len(newstore.units) == 1
         assert newstore.units[0].getcontext(), "context"
 
+    def test_mmap(self, tmp_path):
+        store = self.StoreClass()
+        for source, target, context in (
+            ("", "Content-Type: text/plain; charset=UTF-8\nLanguage: af\n", None),
+            ("Open", "Oop", None),
+            ("Open", "Maak oop", "verb"),
+            (multistring(["file", "files"]), multistring(["lêer", "lêers"]), None),
+        ):
+            unit = self.StoreClass.UnitClass(source)
+            unit.target = target
+            if context:
+                unit.setcontext(context)
+            store.addunit(unit)
+        data = bytes(store)
+        filename = str(tmp_path / "test.mo")
+        with open(filename, "wb") as fh:
+            fh.write(data)
+        # Without a hash table, lookups bisect the sorted keys
+        nohash = bytearray(data)
+        struct.pack_into("<i", nohash, 20, 0)
+        for mmapstore in (mo.mmapmofile(filename), mo.mmapmofile.parsestring(nohash)):
+            assert mmapstore.gettargetlanguage() == "af"
+            assert mmapstore.translate("Open") == "Oop"
+            assert mmapstore.translate("Open", "verb") == "Maak oop"
+            assert mmapstore.translate("file") == multistring(["lêer", "lêers"])
+            assert mmapstore.translate("files") is None
+            assert mmapstore.translate("Close") is None
+            assert mmapstore._units is None
+            sources = [unit.source for unit in mmapstore.unit_iter()]
+            assert sources == [
+                unit.source for unit in self.StoreClass.parsestring(data).units
+            ]
+            mmapstore.close()
+            assert len(mmapstore.units) == 4
+            assert mmapstore.translate("Open", "verb") == "Maak oop"
+
+    def test_charset_roundtrip(self, tmp_path):
+        posource = (
+            b'msgid ""\nmsgstr ""\n'
+            b'"Content-Type: text/plain; charset=ISO-8859-1\\n"\n\n'
+            b'msgid "coffee"\nmsgstr "caf\xe9"\n'
+        )
+        postore = factory.getobject(BytesIO(posource))
+        data = pocompile.POCompile.convertstore(postore)
+        # Like msgfmt, the strings are written in the charset of the header
+        assert b"caf\xe9\0" in data
+        filename = str(tmp_path / "test.mo")
+        with open(filename, "wb") as fh:
+            fh.write(data)
+        assert mo.mofile.parsefile(filename).units[1].target == "café"
+        with mo.mmapmofile(filename) as mmapstore:
+            assert mmapstore.translate("coffee") == "café"
+
+        # Strings that the charset can not represent are written in UTF-8
+        store = mo.mofile.parsestring(data)
+        store.units[1].target = "kōhī"
+        data = bytes(store)
+        assert b"charset=UTF-8" in data
+        assert mo.mofile.parsestring(data).units[1].target == "kōhī"
+
+    def test_charset_legacy(self, tmp_path):
+        """Older versions wrote UTF-8 whatever the charset of the header."""
+        store = self.StoreClass()
+        for source, target in (
+            ("", "Content-Type: text/plain; charset=UTF-8\n"),
+            ("café", "koffie"),
+            ("coffee", "café"),
+        ):
+            unit = self.StoreClass.UnitClass(source)
+            unit.target = target
+            store.addunit(unit)
+        # "latin" is an alias of ISO-8859-1 as long as "UTF-8"
+        data = bytes(store).replace(b"charset=UTF-8", b"charset=latin")
+        legacy = mo.mofile.parsestring(data)
+        assert legacy.encoding == "iso8859-1"
+        assert [unit.target for unit in legacy.units[1:]] == ["koffie", "café"]
+        filename = str(tmp_path / "test.mo")
+        with open(filename, "wb") as fh:
+            fh.write(data)
+        with mo.mmapmofile(filename) as mmapstore:
+            assert mmapstore.translate("café") == "koffie"
+            assert mmapstore.translate("coffee") == "café"
+
     def test_output(self):
         for posource in posources:
             print("PO source file")
@@ -1168,6 +1168,45 @@ $sec = 'second';
         store.addunit(unit)
         assert bytes(store).decode() == expected
 
+    def test_fast_parser(self, monkeypatch):
+        phpsource = r"""<?php
+/* Header comment */
+$lang['title'] = 'It\'s'; // trailing
+$lang = array(
+    // Section
+    'menu' => array('open' => 'Open', 'close' => 'Close', ),
+    5 => 'Five'
+);
+return [
+    'welcome' => 'Welcome', # hash
+    'nested' => ['deep' => 'Deep'],
+];
+?>
+"""
+        tree, tokens = php.PHPFastParser().parse(phpsource)
+        assert len(tree) == 3
+        assert "".join(token.value for token in tokens) == phpsource
+        fast = self.phpparse(phpsource)
+        # Compare with the full grammar
+        monkeypatch.setattr(php.PHPFastParser, "parse", lambda self, text: None)
+        full = self.phpparse(phpsource)
+        assert [
+            (unit.name, unit.source, unit.escape_type, unit.getnotes())
+            for unit in fast.units
+        ] == [
+            (unit.name, unit.source, unit.escape_type, unit.getnotes())
+            for unit in full.units
+        ]
+        assert fast.units[0].getnotes() == "/* Header comment */\n// trailing"
+
+    def test_fast_parser_fallback(self):
+        parser = php.PHPFastParser()
+        assert parser.parse("<?php\n$lang['a'] = \"double\";\n") is None
+        assert parser.parse("<?php\ndefine('A', 'a');\n") is None
+        assert parser.parse("$lang['a'] = 'b';\n") is None
+        assert parser.parse("<?php\n$lang['a'] = 'b' . 'c';\n") is None
+        assert parser.parse("<?php\n$lang['a'] = 'b';\n?>\n<p>HTML</p>\n") is None
+
 
 class TestLaravelPhpUnit(test_monolingual.TestMonolingualUnit):
     UnitClass = php.LaravelPHPUnit
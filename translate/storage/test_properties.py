@@ -635,6 +635,48 @@ key=value
             == r"value with \\ signs but also a \n line break"
         )
 
+    def test_mac_strings_unterminated_key(self):
+        """test that a key without closing quote does not break parsing"""
+        propsource = '"key = "value";\n"key2" = "value2";\n'.encode("utf-16")
+        propfile = self.propparse(propsource, personality="strings")
+        assert len(propfile.units) == 2
+        assert propfile.units[0].name == 'key = "value";'
+        assert propfile.units[0].delimiter == ""
+        assert propfile.units[1].name == "key2"
+        assert propfile.units[1].value == "value2"
+
+    def test_lazy_index(self):
+        """test that the index is only built when it is needed"""
+        propfile = properties.propfile(BytesIO(b"key=value\nkey2=value2\n"))
+        assert propfile.id_index == {}
+        assert propfile.findid("key2").source == "value2"
+        assert propfile.findunit("value").name == "key"
+
+    def test_all_dialects_roundtrip(self):
+        """test that every dialect reads back what it has written"""
+        for name, dialect in properties.dialects.items():
+            propsource = (
+                "# Comment\n"
+                "/* Multi line\n"
+                "   comment */\n"
+                "\n"
+                "key = value\n"
+                "key\\:2 : value \\\n"
+                "    continued\n"
+                "key3\n"
+            )
+            if dialect.key_wrap_char:
+                propsource = '"key" = "value with \\"quotes\\"";\n'
+            propfile = self.propparse(
+                propsource.encode(dialect.default_encoding), personality=name
+            )
+            serialized = bytes(propfile)
+            reparsed = self.propparse(serialized, personality=name)
+            assert [(unit.name, unit.value) for unit in reparsed.units] == [
+                (unit.name, unit.value) for unit in propfile.units
+            ], name
+            assert bytes(reparsed) == serialized, name
+
     def test_override_encoding(self):
         """test that we can override the encoding of a properties file"""
         propsource = "key = value".encode("cp1252")
@@ -3,7 +3,7 @@ from io import BytesIO
 from pytest import mark, raises
 
 from translate.misc.multistring import multistring
-from translate.storage import pypo, test_po
+from translate.storage import poparser, pypo, test_po
 
 
 class TestHelpers:
@@ -233,6 +233,27 @@ msgstr ""
         unit = self.UnitClass(idstring)
         assert str(unit) == expected
 
+    def test_lazy_lists(self):
+        """Test that empty lists are shared until they are modified."""
+        unit = self.UnitClass("Open")
+        assert unit._othercomments is pypo._EMPTY
+        assert unit._msgctxt is pypo._EMPTY
+        assert not unit.isheader()
+        assert unit.getlocations() == []
+        assert str(unit) == 'msgid "Open"\nmsgstr ""\n'
+        assert unit._sourcecomments is pypo._EMPTY
+        unit.sourcecomments.append("#: file.c:12\n")
+        assert unit.getlocations() == ["file.c:12"]
+        assert unit.othercomments == []
+        copied = unit.copy()
+        copied.sourcecomments.append("#: file.c:34\n")
+        assert unit.getlocations() == ["file.c:12"]
+        assert copied.getlocations() == ["file.c:12", "file.c:34"]
+        assert copied._store is unit._store
+        # The strings are shared, the empty lists stay shared
+        assert copied.sourcecomments[0] is unit.sourcecomments[0]
+        assert copied._msgctxt is pypo._EMPTY
+
 
 class TestPYPOFile(test_po.TestPOFile):
     StoreClass = pypo.pofile
@@ -620,3 +641,41 @@ msgstr ""\r
         assert len(pofile.units) == 1
         assert pofile.units[0].source == "test me"
         assert bytes(pofile) == posource
+
+    @staticmethod
+    def _parse_units(posource, fast):
+        store = pypo.pofile()
+        lines, store.newline = pypo.splitlines(posource)
+        store.units = []
+        try:
+            poparser.parse_units(
+                poparser.ParseState(iter(lines), store.create_unit), store, fast=fast
+            )
+        except poparser.PoParseError as error:
+            return str(error)
+        return [str(unit) for unit in store.units] + [
+            unit.getnotes() for unit in store.units
+        ]
+
+    @mark.parametrize(
+        "posource",
+        [
+            b'#. auto\n#: a.c:1\n#, fuzzy, c-format\n# note\nmsgctxt "ctx"\n'
+            b'msgid "one"\nmsgstr ""\n"een"\n\nmsgid "file"\n'
+            b'msgid_plural "files"\nmsgstr[0] "leer"\nmsgstr[1] "leers"\n',
+            b'msgid "a"\nmsgstr "b"\n#| msgid "old"\nmsgid "c"\nmsgstr "d"\n',
+            b'msgid "a"\nmsgstr "b"\n\n#~ msgid "old"\n#~ msgstr "oud"\n',
+            b'msgid "_: kde\\n"\n"a"\nmsgstr "b"\n',
+            b'msgid "a"\nmsgstr "b"\nmsgstr "c"\n',
+            b'msgid "a"\nmsgstr "b"\n\nmsgid "c\nmsgstr "d"\n',
+            b'msgid "a"\nmsgstr "b"\n# trailing comment\n',
+            b'msgid "a"\r\nmsgstr "b"\r\n\r\nmsgid "c"\r\nmsgstr "d"\r\n',
+        ],
+    )
+    def test_fast_parser(self, posource):
+        """checks that the fast path parses like the regular parser"""
+        posource = (
+            b'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+            + posource
+        )
+        assert self._parse_units(posource, True) == self._parse_units(posource, False)
@@ -101,3 +101,53 @@ class TestTMXfile(test_base.TestTranslationStore):
         print(bytes(tmxfile))
         assert newfile.translate("Client Version:14 %s") == "test one"
         assert newfile.translate("Client Version:\n%s") == "test two"
+
+    def test_iterparse(self):
+        """tests that iterparse() yields the units and releases them"""
+        tmxfile = tmx.tmxfile()
+        tmxfile.addtranslation("First", "en", "Eerste", "af", "comment")
+        tmxfile.addtranslation("Second", "en", "Tweede", "af")
+        streamed = tmx.tmxfile()
+        units = streamed.iterparse(bytes(tmxfile))
+        unit = next(units)
+        assert unit.source == "First"
+        assert unit.target == "Eerste"
+        assert unit.getnotes() == "comment"
+        assert unit.gettargetlanguage() is None
+        unit = next(units)
+        assert (unit.source, unit.target) == ("Second", "Tweede")
+        assert list(units) == []
+        assert streamed.units == []
+        assert len(streamed.body) == 0
+
+    def test_writer(self):
+        """tests that tmxwriter writes like serialize()"""
+        tmxfile = tmx.tmxfile()
+        tmxfile.addtranslation("Mail & News", "en", "Nuus & pos", "af", "comment")
+        tmxfile.addtranslation("First line\nSecond line", "en", "Eerste\nTweede", "af")
+        output = BytesIO()
+        with tmx.tmxwriter(tmx.tmxfile(), output) as writer:
+            writer.addtranslation("Mail & News", "en", "Nuus & pos", "af", "comment")
+            writer.addtranslation(
+                "First line\nSecond line", "en", "Eerste\nTweede", "af"
+            )
+        assert output.getvalue() == bytes(tmxfile)
+        newfile = self.tmxparse(output.getvalue())
+        assert newfile.translate("Mail & News") == "Nuus & pos"
+
+    def test_copy(self):
+        """tests that copies of units don't change the original"""
+        tmxfile = tmx.tmxfile()
+        tmxfile.addtranslation("First", "en", "Eerste", "af", "comment")
+        unit = tmxfile.units[0]
+        copied = unit.copy()
+        assert copied.xmlelement.getparent() is None
+        assert (copied.source, copied.target) == ("First", "Eerste")
+        assert copied.getnotes() == "comment"
+        copied.target = "Een"
+        copied.addnote("another")
+        assert unit.target == "Eerste"
+        assert unit.getnotes() == "comment"
+        tmxfile.addunit(copied)
+        newfile = self.tmxparse(bytes(tmxfile))
+        assert [unit.target for unit in newfile.units] == ["Eerste", "Een"]
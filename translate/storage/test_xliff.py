@@ -1,7 +1,9 @@
+from io import BytesIO
+
 from lxml import etree
 
 from translate.misc.xml_helpers import setXMLspace
-from translate.storage import test_base, xliff
+from translate.storage import lisa, test_base, xliff
 from translate.storage.placeables import StringElem
 from translate.storage.placeables.xliff import G, X
 
@@ -124,6 +126,46 @@ class TestXLIFFfile(test_base.TestTranslationStore):
         print(bytes(xlifffile))
         assert xlifffile.units[0].source == "File 1"
 
+    @staticmethod
+    def test_iterparse():
+        xlfsource = """<?xml version="1.0" encoding="utf-8"?>
+<xliff:xliff version="1.2" xmlns:xliff="urn:oasis:names:tc:xliff:document:1.2">
+    <xliff:file original="doc.txt" source-language="en-US" target-language="af">
+        <xliff:body>
+            <xliff:trans-unit id="1">
+                <xliff:source>File 1</xliff:source>
+                <xliff:target>Lêer 1</xliff:target>
+            </xliff:trans-unit>
+            <xliff:group>
+                <xliff:trans-unit id="2">
+                    <xliff:source>File 2</xliff:source>
+                </xliff:trans-unit>
+            </xliff:group>
+        </xliff:body>
+    </xliff:file>
+</xliff:xliff>"""
+        xlifffile = xliff.xlifffile()
+        units = [
+            (unit.getid(), unit.source, unit.target, unit.gettargetlanguage())
+            for unit in xlifffile.iterparse(xlfsource.encode("utf-8"))
+        ]
+        assert units == [
+            ("doc.txt\x041", "File 1", "Lêer 1", "af"),
+            ("doc.txt\x042", "File 2", None, "af"),
+        ]
+        assert xlifffile.units == []
+
+    @staticmethod
+    def test_writer():
+        xlifffile = xliff.xlifffile()
+        output = BytesIO()
+        with lisa.LISAwriter(xliff.xlifffile(), output) as writer:
+            for source in ("Bla", "Dit"):
+                unit = xlifffile.addsourceunit(source)
+                unit.target = source.upper()
+                writer.write(unit)
+        assert output.getvalue() == bytes(xlifffile)
+
     @staticmethod
     def test_rich_source():
         xlifffile = xliff.xlifffile()
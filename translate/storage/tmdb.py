@@ -27,6 +27,7 @@ import time
 from sqlite3 import dbapi2
 
 from translate.lang import data
+from translate.misc import instrumentation
 from translate.search.lshtein import LevenshteinComparer
 
 
@@ -248,8 +249,12 @@ DROP TRIGGER IF EXISTS sources_delete_trig;
 
     def add_store(self, store, source_lang, target_lang, commit=True):
         """insert all units in store in database"""
+        return self.add_units(store.units, source_lang, target_lang, commit)
+
+    def add_units(self, units, source_lang, target_lang, commit=True):
+        """insert all translated units from an iterable in database"""
         count = 0
-        for unit in store.units:
+        for unit in units:
             if unit.istranslatable() and unit.istranslated():
                 self.add_unit(unit, source_lang, target_lang, commit=False)
                 count += 1
@@ -269,6 +274,7 @@ DROP TRIGGER IF EXISTS sources_delete_trig;
             self.connection.commit()
         return count
 
+    @instrumentation.instrumented("tmdb.translate_unit")
     def translate_unit(self, unit_source, source_langs, target_langs):
         """return TM suggestions for unit_source"""
         if isinstance(source_langs, list):
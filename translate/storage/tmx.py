@@ -103,17 +103,6 @@ class tmxunit(lisa.LISAunit):
             errordict[errorname] = errortext
         return errordict
 
-    def copy(self):
-        """Make a copy of the translation unit.
-
-        We don't want to make a deep copy - this could duplicate the whole XML
-        tree. For now we just serialise and reparse the unit's XML.
-        """
-        # TODO: check performance
-        new_unit = self.__class__(None, empty=True)
-        new_unit.xmlelement = etree.fromstring(etree.tostring(self.xmlelement))
-        return new_unit
-
 
 class tmxfile(lisa.LISAfile):
     """Class representing a TMX file store."""
@@ -150,6 +139,9 @@ class tmxfile(lisa.LISAfile):
     def addtranslation(self, source, srclang, translation, translang, comment=None):
         """addtranslation method for testing old unit tests"""
         unit = self.addsourceunit(source)
+        self._settranslation(unit, srclang, translation, translang, comment)
+
+    def _settranslation(self, unit, srclang, translation, translang, comment=None):
         unit.target = translation
         if comment is not None and len(comment) > 0:
             unit.addnote(comment)
@@ -161,3 +153,17 @@ class tmxfile(lisa.LISAfile):
     def translate(self, sourcetext, sourcelang=None, targetlang=None):
         """method to test old unit tests"""
         return getattr(self.findunit(sourcetext), "target", None)
+
+
+class tmxwriter(lisa.LISAwriter):
+    """Writes TMX translation units incrementally.
+
+    See :class:`translate.storage.lisa.LISAwriter`.
+    """
+
+    def addtranslation(self, source, srclang, translation, translang, comment=None):
+        """Writes a translation unit like :meth:`tmxfile.addtranslation`."""
+        unit = self.store.UnitClass(source)
+        unit.namespace = self.store.namespace
+        self.store._settranslation(unit, srclang, translation, translang, comment)
+        self.write(unit)
@@ -85,6 +85,11 @@ ASCII_CONTROL_CHARACTERS_ESCAPES = {
     code: "&#x%s;" % code.lstrip("0") or "0" for code in ASCII_CONTROL_CODES
 }
 
+ASCII_CONTROL_ESCAPE_TABLE = {
+    ord(character): ASCII_CONTROL_CHARACTERS_ESCAPES[code]
+    for code, character in ASCII_CONTROL_CHARACTERS.items()
+}
+
 
 class xliffunit(lisa.LISAunit):
     """A single term in the xliff file."""
@@ -137,7 +142,7 @@ class xliffunit(lisa.LISAunit):
     def getNodeText(self, languageNode, xml_space="preserve"):
         """Retrieves the term from the given :attr:`languageNode`."""
         text = super().getNodeText(languageNode, xml_space=xml_space)
-        if text is not None:
+        if text is not None and "&#x" in text:
             # Unescape the unaccepted ASCII control characters.
             for code, character in ASCII_CONTROL_CHARACTERS.items():
                 text = text.replace(ASCII_CONTROL_CHARACTERS_ESCAPES[code], character)
@@ -156,8 +161,7 @@ class xliffunit(lisa.LISAunit):
         # setXMLlang(langset, lang)
 
         # Escape the unaccepted ASCII control characters.
-        for code in ASCII_CONTROL_CODES:
-            text = text.replace(chr(int(code, 16)), "&#x%s;" % code.lstrip("0") or "0")
+        text = text.translate(ASCII_CONTROL_ESCAPE_TABLE)
 
         langset.text = text
         return langset
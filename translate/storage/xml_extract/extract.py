@@ -17,6 +17,7 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 from contextlib import contextmanager
+from io import BytesIO
 
 from lxml import etree
 
@@ -329,46 +330,77 @@ def _make_store_adder(store):
         """Construct a new translation unit, set its source and location
         information and add it to 'store'.
         """
-        unit = store.UnitClass("")
-        unit.rich_source = [
-            StringElem(_to_placeables(parent_translatable, translatable, id_maker))
-        ]
-        unit.addlocation(translatable.xpath)
-        store.addunit(unit)
+        add_store_unit(
+            store,
+            _to_placeables(parent_translatable, translatable, id_maker),
+            translatable.xpath,
+        )
 
     return add_translatable_to_store
 
 
+def add_store_unit(store, placeables, xpath):
+    """Add a unit with the given placeables as source and xpath as location
+    to 'store'.
+    """
+    unit = store.UnitClass("")
+    unit.rich_source = [StringElem(placeables)]
+    unit.addlocation(xpath)
+    store.addunit(unit)
+
+
 def make_postore_adder(store, id_maker, filename):
     """Return a function which, when called with a Translatable will add
     a unit to 'store'. The placeables will be represented as strings according
     to 'placeable_quoter'.
     """
-    from translate.storage.xliff import xliffunit
 
     def add_translatable_to_store(parent_translatable, translatable):
         """Construct a new translation unit, set its source and location
         information and add it to 'store'.
         """
-        xliff_unit = xliffunit("")
-        placeables = _to_placeables(parent_translatable, translatable, id_maker)
-        xliff_unit.rich_source = [StringElem(placeables)]
-
-        # Get the plain text for the unit source. The output is enclosed within
-        # XLIFF source tags we don't want, so strip them.
-        unit_source = etree.tostring(xliff_unit.source_dom, encoding="unicode")
-        unit_source = unit_source[unit_source.find(">", 1) + 1 :]
-        unit_source = unit_source[: unit_source.rfind("<", 1)]
-
-        # Create the PO unit and add it to the PO store.
-        po_unit = store.UnitClass(unit_source)
-        po_unit.addlocation(translatable.xpath)
-        po_unit.addlocation(filename)
-        store.addunit(po_unit)
+        add_postore_unit(
+            store,
+            _to_placeables(parent_translatable, translatable, id_maker),
+            translatable.xpath,
+            filename,
+        )
 
     return add_translatable_to_store
 
 
+def add_postore_unit(store, placeables, xpath, filename):
+    """Add a PO unit with the given placeables, rendered as XLIFF, as source
+    and xpath and filename as locations to 'store'.
+    """
+    from translate.storage.xliff import xliffunit
+
+    xliff_unit = xliffunit("")
+    xliff_unit.rich_source = [StringElem(placeables)]
+
+    # Get the plain text for the unit source. The output is enclosed within
+    # XLIFF source tags we don't want, so strip them.
+    unit_source = etree.tostring(xliff_unit.source_dom, encoding="unicode")
+    unit_source = unit_source[unit_source.find(">", 1) + 1 :]
+    unit_source = unit_source[: unit_source.rfind("<", 1)]
+
+    # Create the PO unit and add it to the PO store.
+    po_unit = store.UnitClass(unit_source)
+    po_unit.addlocation(xpath)
+    po_unit.addlocation(filename)
+    store.addunit(po_unit)
+
+
+def offset_placeable_ids(placeables, offset):
+    """Add offset to the ids of placeables and their sub placeables."""
+    for placeable in placeables:
+        if isinstance(placeable, str):
+            continue
+        if isinstance(placeable, (xliff.G, xliff.X)):
+            placeable.id = str(int(placeable.id) + offset)
+        offset_placeable_ids(placeable.sub, offset)
+
+
 def _walk_idml_translatable_tree(translatables, store_adder, parent_translatable):
     """Traverse all the found IDML translatables and add them to the Store.
 
@@ -433,3 +465,30 @@ def build_store(odf_file, store, parse_state, store_adder=None):
     translatables = find_translatable_dom_nodes(root, parse_state)
     _walk_translatable_tree(translatables, store_adder, None)
     return tree
+
+
+def extract_units(xml_data, parse_state, build=build_store):
+    """Extract the units of an XML document without adding them to a store.
+
+    This allows to extract several documents in parallel, see
+    :func:`misc.map_parts`.  The placeable ids are numbered from 0 for every
+    document.
+
+    :param build: :func:`build_store` or :func:`build_idml_store`.
+    :return: A list of (placeables, xpath) tuples, as accepted by
+        :func:`add_store_unit` and :func:`add_postore_unit`, and the number of
+        placeable ids used.
+    """
+    units = []
+    id_maker = IdMaker()
+
+    def add_translatable_to_units(parent_translatable, translatable):
+        units.append(
+            (
+                _to_placeables(parent_translatable, translatable, id_maker),
+                translatable.xpath,
+            )
+        )
+
+    build(BytesIO(xml_data), None, parse_state, store_adder=add_translatable_to_units)
+    return units, id_maker._max_id
@@ -18,6 +18,8 @@
 
 import re
 
+from translate.misc import parallel
+
 
 def reduce_tree(f, parent_unit_node, unit_node, get_children, *state):
     """Enumerate a tree, applying f to in a pre-order fashion to each node.
@@ -60,6 +62,16 @@ def compose_mappings(left, right):
     return result_map
 
 
+def map_parts(function, parts, jobs=1):
+    """Yield the result of applying function to each of parts, in order.
+
+    With jobs other than 1 the parts are processed by a pool of up to jobs
+    worker processes, 0 using one per CPU, see
+    :func:`translate.misc.parallel.imap`.  The results must be picklable.
+    """
+    return parallel.imap(function, list(parts), jobs)
+
+
 tag_pattern = re.compile(r"({(?P<namespace>(\w|[-:./])*)})?(?P<tag>(\w|[-])*)")
 
 
@@ -64,6 +64,20 @@ def test_compose_mappings():
     assert composed_mapping == misc.compose_mappings(left_mapping, right_mapping)
 
 
+# map_parts
+
+
+def test_map_parts():
+    parts = list(range(10))
+    offset = 3
+    expected = [part * part + offset for part in parts]
+    assert expected == list(misc.map_parts(lambda part: part * part + offset, parts))
+    assert expected == list(
+        misc.map_parts(lambda part: part * part + offset, parts, jobs=3)
+    )
+    assert [] == list(misc.map_parts(str, [], jobs=0))
+
+
 # parse_tag
 
 
@@ -22,17 +22,28 @@ import logging
 import os
 from argparse import ArgumentParser
 
+from translate.lang import factory as lang_factory
 from translate.storage import factory, tmdb
+from translate.tools import posegment
 
 
 logger = logging.getLogger(__name__)
 
 
 class Builder:
-    def __init__(self, tmdbfile, source_lang, target_lang, filenames):
+    def __init__(
+        self, tmdbfile, source_lang, target_lang, filenames, segment=False, jobs=1
+    ):
         self.tmdb = tmdb.TMDB(tmdbfile)
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self.segmenter = None
+        if segment:
+            self.segmenter = posegment.segment(
+                lang_factory.getlanguage(source_lang),
+                lang_factory.getlanguage(target_lang),
+            )
+        self.jobs = jobs
 
         for filename in filenames:
             if not os.path.exists(filename):
@@ -46,15 +57,14 @@ class Builder:
 
     def handlefile(self, filename):
         try:
-            store = factory.getobject(filename)
+            units = factory.iterunits(filename)
+            if self.segmenter is not None:
+                units = self.segmenter.segmentunits(units, self.jobs)
+            # Large translation memories are parsed while they are added
+            self.tmdb.add_units(units, self.source_lang, self.target_lang, commit=False)
         except Exception as e:
             logger.error(str(e))
             return
-        # do something useful with the store and db
-        try:
-            self.tmdb.add_store(store, self.source_lang, self.target_lang, commit=False)
-        except Exception as e:
-            print(e)
         print("File added:", filename)
 
     def handlefiles(self, dirname, filenames):
@@ -96,12 +106,33 @@ def main():
         help="target language of translation files",
         required=True,
     )
+    parser.add_argument(
+        "--segment",
+        dest="segment",
+        action="store_true",
+        help="add the sentences of the translations, segmented like posegment does",
+    )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        metavar="JOBS",
+        help="segment in JOBS processes, 0 for one per CPU (default: %(default)s)",
+    )
     parser.add_argument("files", metavar="input files", nargs="+")
     args = parser.parse_args()
 
     logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
 
-    Builder(args.tmdb_file, args.source_lang, args.target_lang, args.files)
+    Builder(
+        args.tmdb_file,
+        args.source_lang,
+        args.target_lang,
+        args.files,
+        segment=args.segment,
+        jobs=args.jobs,
+    )
 
 
 if __name__ == "__main__":
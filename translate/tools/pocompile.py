@@ -89,6 +89,7 @@ def main():
     }
     parser = convert.ConvertOptionParser(formats, usepots=False, description=__doc__)
     parser.add_fuzzy_option()
+    parser.setjobsoptions()
     parser.run()
 
 
@@ -32,6 +32,7 @@ from argparse import ArgumentParser
 from collections import defaultdict
 
 from translate.lang.common import Common
+from translate.misc import instrumentation
 from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.workflow import StateEnum
@@ -146,18 +147,25 @@ def wordsinunit(unit):
     return sourcewords, targetwords
 
 
-def calcstats(filename):
+def calcstats(filename, use_cache=False):
     """This is the previous implementation of calcstats() and is left for
     comparison and debuging purposes.
+
+    :param use_cache: Load the file from a binary cache next to it, see
+        :func:`translate.storage.factory.getobject`.
     """
     # ignore totally blank or header units
     try:
-        store = factory.getobject(filename)
+        if use_cache:
+            units = factory.getobject(filename, use_cache=True).units
+        else:
+            # Stores which can be read incrementally are not kept in memory
+            units = factory.iterunits(filename)
+        units = [unit for unit in units if unit.istranslatable()]
     except ValueError as e:
         logger.warning(e)
         return {}
 
-    units = [unit for unit in store.units if unit.istranslatable()]
     translated = translatedmessages(units)
     fuzzy = fuzzymessages(units)
     review = [unit for unit in units if unit.isreview()]
@@ -416,12 +424,15 @@ def untranslatedmessages(units):
 
 
 class summarizer:
-    def __init__(self, filenames, style=default_style, incomplete_only=False):
+    def __init__(
+        self, filenames, style=default_style, incomplete_only=False, use_cache=False
+    ):
         self.totals = {}
         self.filecount = 0
         self.longestfilename = 0
         self.style = style
         self.incomplete_only = incomplete_only
+        self.use_cache = use_cache
         self.complete_count = 0
 
         if self.style == style_csv:
@@ -467,7 +478,7 @@ Review Messages, Review Source Words"""
 
     def handlefile(self, filename):
         try:
-            stats = calcstats(filename)
+            stats = calcstats(filename, self.use_cache)
             self.updatetotals(stats)
             self.complete_count += summarize(
                 filename, stats, self.style, self.longestfilename, self.incomplete_only
@@ -501,6 +512,20 @@ def main():
         dest="incomplete_only",
         help="skip 100%% translated files.",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        dest="use_cache",
+        help="keep the parsed files in binary caches next to them.",
+    )
+    parser.add_argument(
+        "--profile-report",
+        choices=instrumentation.REPORT_FORMATS,
+        metavar="FORMAT",
+        help="report timings and counters of the processing on stderr as: %s"
+        % (", ".join(instrumentation.REPORT_FORMATS)),
+    )
     output_group = parser.add_argument_group("Output format")
     megroup = output_group.add_mutually_exclusive_group()
     megroup.add_argument(
@@ -549,8 +574,10 @@ def main():
 
     logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
     ConsoleColor.color_mode = not args.no_color
+    if args.profile_report:
+        instrumentation.report_at_exit(args.profile_report)
 
-    summarizer(args.files, args.style, args.incomplete_only)
+    summarizer(args.files, args.style, args.incomplete_only, args.use_cache)
 
 
 if __name__ == "__main__":
@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-"""Grep XLIFF, Gettext PO and TMX localization files.
+"""Grep XLIFF, Gettext PO, TMX and JSON localization files.
 
 Matches are output to snippet files of the same type which can then be reviewed
 and later merged using :doc:`pomerge </commands/pomerge>`.
@@ -32,7 +32,7 @@ import re
 from translate.lang import data
 from translate.misc import optrecurse
 from translate.misc.multistring import multistring
-from translate.storage import factory
+from translate.storage import factory, jsonl10n
 from translate.storage.poheader import poheader
 
 
@@ -233,12 +233,18 @@ class GrepFilter:
                 return True
         return False
 
-    def filterfile(self, thefile):
-        """runs filters on a translation file object"""
+    def filterfile(self, thefile, units=None):
+        """runs filters on a translation file object
+
+        :param units: the units to filter instead of those of ``thefile``,
+            like the ones yielded while it is parsed.
+        """
         thenewfile = type(thefile)()
         thenewfile.setsourcelanguage(thefile.sourcelanguage)
         thenewfile.settargetlanguage(thefile.targetlanguage)
-        for unit in thefile.units:
+        if units is None:
+            units = thefile.units
+        for unit in units:
             if self.filterunit(unit):
                 thenewfile.addunit(unit)
 
@@ -359,8 +365,13 @@ class GrepOptionParser(optrecurse.RecursiveOptionParser):
 
 def rungrep(inputfile, outputfile, templatefile, checkfilter):
     """reads in inputfile, filters using checkfilter, writes to outputfile"""
-    fromfile = factory.getobject(inputfile)
-    tofile = checkfilter.filterfile(fromfile)
+    if factory.getclass(inputfile) is jsonl10n.JsonFile:
+        # The units are filtered as they are read
+        fromfile = jsonl10n.JsonFile()
+        tofile = checkfilter.filterfile(fromfile, fromfile.iterparse(inputfile))
+    else:
+        fromfile = factory.getobject(inputfile)
+        tofile = checkfilter.filterfile(fromfile)
     if tofile.isempty():
         return False
     tofile.serialize(outputfile)
@@ -373,6 +384,7 @@ def cmdlineparser():
         "pot": ("pot", rungrep),
         "mo": ("mo", rungrep),
         "gmo": ("gmo", rungrep),
+        "json": ("json", rungrep),
         "tmx": ("tmx", rungrep),
         "xliff": ("xliff", rungrep),
         "xlf": ("xlf", rungrep),
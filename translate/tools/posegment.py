@@ -22,23 +22,52 @@ See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/command
 for examples and usage instructions.
 """
 
+import collections
+import itertools
+
 from translate.lang import factory as lang_factory
-from translate.storage import factory, poheader
+from translate.misc import parallel
+from translate.storage import factory, poheader, tmx
 
 
 class segment:
+    batchsize = 500
+    """The number of units of which the sentences are found by a worker
+    process at a time."""
+
     def __init__(self, sourcelang, targetlang, stripspaces=True, onlyaligned=False):
         self.sourcelang = sourcelang
         self.targetlang = targetlang
         self.stripspaces = stripspaces
         self.onlyaligned = onlyaligned
 
-    def segmentunit(self, unit):
+    def segmenttexts(self, source, target):
+        """Returns the sentences of the source and of the target text."""
+        return (
+            self.sourcelang.sentences(source, strip=self.stripspaces),
+            self.targetlang.sentences(target, strip=self.stripspaces),
+        )
+
+    @staticmethod
+    def getunittexts(unit):
+        """Returns the source and target text of unit if it can be segmented."""
+        if unit.isheader() or unit.hasplural():
+            return None
+        return unit.source, unit.target
+
+    def segmentunit(self, unit, segments=None):
+        """Returns the units of the sentences of unit.
+
+        :param segments: The sentences returned by :meth:`segmenttexts` for
+            the texts of unit, if they are already known.
+        """
         if unit.isheader() or unit.hasplural():
             return [unit]
-        sourcesegments = self.sourcelang.sentences(unit.source, strip=self.stripspaces)
-        targetsegments = self.targetlang.sentences(unit.target, strip=self.stripspaces)
-        if unit.istranslated() and (len(sourcesegments) != len(targetsegments)):
+        if segments is None:
+            segments = self.segmenttexts(unit.source, unit.target)
+        sourcesegments, targetsegments = segments
+        translated = unit.istranslated()
+        if translated and (len(sourcesegments) != len(targetsegments)):
             if not self.onlyaligned:
                 return [unit]
             else:
@@ -48,27 +77,67 @@ class segment:
         # start.
         units = []
         for i in range(len(sourcesegments)):
+            # The copies share the strings of the notes and locations
             newunit = unit.copy()
             newunit.source = sourcesegments[i]
-            if not unit.istranslated():
+            if not translated:
                 newunit.target = ""
             else:
                 newunit.target = targetsegments[i]
             units.append(newunit)
         return units
 
-    def convertstore(self, fromstore):
+    def segmentunits(self, units, jobs=1):
+        """Yields the units of the sentences of units, in order.
+
+        The units are read while the segmented units are produced, so this can
+        feed a :class:`~translate.storage.lisa.LISAwriter` or a
+        :class:`~translate.storage.tmdb.TMDB` without building a store.
+
+        :param jobs: The number of worker processes finding the sentences of
+            the units, 0 for one per CPU.  The texts of the units are sent to
+            them in batches of :attr:`batchsize`, the units are still copied
+            in this process.
+        """
+        if parallel.getjobcount(jobs) == 1:
+            for unit in units:
+                newunits = self.segmentunit(unit)
+                if newunits:
+                    yield from newunits
+            return
+        batches = collections.deque()
+        for segments in parallel.imap(
+            self._segmentbatch, self._readbatches(units, batches), jobs
+        ):
+            for unit, unitsegments in zip(batches.popleft(), segments):
+                newunits = self.segmentunit(unit, unitsegments)
+                if newunits:
+                    yield from newunits
+
+    def _readbatches(self, units, batches):
+        """Yields the texts of units in batches of :attr:`batchsize`, adding
+        the units of each batch to batches.
+        """
+        units = iter(units)
+        while True:
+            batch = list(itertools.islice(units, self.batchsize))
+            if not batch:
+                return
+            batches.append(batch)
+            yield [self.getunittexts(unit) for unit in batch]
+
+    def _segmentbatch(self, texts):
+        return [None if text is None else self.segmenttexts(*text) for text in texts]
+
+    def convertstore(self, fromstore, jobs=1):
         tostore = type(fromstore)()
         if isinstance(fromstore, poheader.poheader):
             # We don't want the default header in the case of PO, but rather the
             # one from `fromstore`.
             if fromstore.header() is not None:
                 tostore.units = []
-        for unit in fromstore.units:
-            newunits = self.segmentunit(unit)
-            if newunits:
-                for newunit in newunits:
-                    tostore.addunit(newunit)
+        for newunit in self.segmentunits(fromstore.units, jobs):
+            tostore.addunit(newunit)
         return tostore
 
 
@@ -80,18 +149,30 @@ def segmentfile(
     targetlanguage=None,
     stripspaces=True,
     onlyaligned=False,
+    jobs=1,
 ):
     """reads in inputfile, segments it then, writes to outputfile"""
     # note that templatefile is not used, but it is required by the converter...
-    inputstore = factory.getobject(inputfile)
-    if inputstore.isempty():
-        return 0
     sourcelang = lang_factory.getlanguage(sourcelanguage)
     targetlang = lang_factory.getlanguage(targetlanguage)
     convertor = segment(
         sourcelang, targetlang, stripspaces=stripspaces, onlyaligned=onlyaligned
     )
-    outputstore = convertor.convertstore(inputstore)
+    if factory.getclass(inputfile) is tmx.tmxfile:
+        # Translation memories are written while they are parsed
+        inputunits = factory.iterunits(inputfile)
+        firstunit = next(inputunits, None)
+        if firstunit is None:
+            return 0
+        inputunits = itertools.chain([firstunit], inputunits)
+        with tmx.tmxwriter(tmx.tmxfile(), outputfile) as writer:
+            for unit in convertor.segmentunits(inputunits, jobs):
+                writer.write(unit)
+        return 1
+    inputstore = factory.getobject(inputfile)
+    if inputstore.isempty():
+        return 0
+    outputstore = convertor.convertstore(inputstore, jobs)
     outputstore.serialize(outputfile)
     return 1
 
@@ -142,6 +223,8 @@ def main():
         help="Removes units where sentence number does not correspond",
     )
     parser.passthrough.append("onlyaligned")
+    parser.setjobsoptions()
+    parser.passthrough.append("jobs")
     parser.run()
 
 
@@ -19,6 +19,7 @@
 See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/commands/poterminology.html
 for examples and usage instructions.
 """
+import copy
 import logging
 import os
 import re
@@ -61,6 +62,95 @@ def create_termunit(
     return termunit
 
 
+class TermOccurrences:
+    """Summary of the occurrences of a term in the processed units.
+
+    Only what :meth:`TerminologyExtractor.extract_terms` needs is kept, so
+    that the units don't have to stay in memory.  The example of a full
+    message term is referenced by the input file and index of its unit.
+    """
+
+    __slots__ = (
+        "count",
+        "sources",
+        "filecounts",
+        "locations",
+        "fullmsg",
+        "targets",
+        "sourcenotes",
+        "transnotes",
+        "example",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.sources = set()
+        self.filecounts = {}
+        # The locations and notes are kept in dictionaries to output them in
+        # the order they were found
+        self.locations = {}
+        self.fullmsg = False
+        self.targets = {}
+        self.sourcenotes = {}
+        self.transnotes = {}
+        self.example = None
+
+    def add(self, record):
+        """adds an occurrence in a unit described by ``record``"""
+        source, filename, locations = record
+        self.count += 1
+        self.sources.add(source)
+        self.filecounts[filename] = self.filecounts.get(filename, 0) + 1
+        for location in locations:
+            self.locations[location] = None
+
+    def update(self, other):
+        """adds the occurrences counted in ``other``"""
+        self.count += other.count
+        self.sources.update(other.sources)
+        for filename, count in other.filecounts.items():
+            self.filecounts[filename] = self.filecounts.get(filename, 0) + count
+        self.locations.update(other.locations)
+        if other.fullmsg:
+            self.fullmsg = True
+            for target, filenames in other.targets.items():
+                self.targets.setdefault(target, []).extend(filenames)
+            self.sourcenotes.update(other.sourcenotes)
+            self.transnotes.update(other.transnotes)
+            self.example = other.example
+
+    def resetfullmsg(self):
+        """forgets about full messages, after a change of the term"""
+        self.fullmsg = False
+        self.targets = {}
+        self.sourcenotes = {}
+        self.transnotes = {}
+        self.example = None
+
+    def getexample(self, term):
+        """returns a unit with the translation of the full message example"""
+        if self.example is None:
+            return None
+        _unitid, target, context, fuzzy = self.example
+        unit = po.pounit(term)
+        unit.target = target
+        if context:
+            unit.setcontext(context)
+        unit.markfuzzy(fuzzy)
+        return unit
+
+    @classmethod
+    def fromvalue(cls, value):
+        """returns the occurrences for a glossary value, which is the record
+        of the unit for terms that occurred only once
+        """
+        if isinstance(value, cls):
+            return value
+        occurrences = cls()
+        occurrences.add(value)
+        return occurrences
+
+
 class TerminologyExtractor:
     def __init__(
         self,
@@ -107,9 +197,60 @@ class TerminologyExtractor:
             flags=re.UNICODE | re.IGNORECASE,
         )
 
+        # strips line numbers from locations
+        self.locre = re.compile(r":[0-9]+$")
+
         self.units = 0
         self.glossary = {}
 
+    def shard(self):
+        """returns an extractor with the same settings and an empty glossary"""
+        shard = copy.copy(self)
+        shard.units = 0
+        shard.glossary = {}
+        return shard
+
+    def merge(self, glossary, units=0):
+        """merges the glossary of another extractor, like a :meth:`shard`"""
+        self.units += units
+        for term, value in glossary.items():
+            self.mergeterm(term, value)
+
+    def mergeterm(self, term, value):
+        """adds the occurrences of term in a glossary value"""
+        existing = self.glossary.get(term)
+        if existing is None:
+            self.glossary[term] = value
+        else:
+            existing = self.glossary[term] = TermOccurrences.fromvalue(existing)
+            existing.update(TermOccurrences.fromvalue(value))
+
+    def reduceplurals(self):
+        """merges the plurals of the words into their singular
+
+        This is done once all the units are processed, in the order the words
+        were first found, so that it doesn't depend on how the units were
+        split between :meth:`shard` extractors.
+        """
+        glossary = self.glossary
+        self.glossary = {}
+        for term, value in glossary.items():
+            if " " not in term:
+                if len(term) > 3 and term[-1] == "s" and term[0:-1] in self.glossary:
+                    term = term[0:-1]
+                    value = TermOccurrences.fromvalue(value)
+                    value.resetfullmsg()
+                elif len(term) > 2 and term + "s" in self.glossary:
+                    self.renameterm(term + "s", term)
+            self.mergeterm(term, value)
+
+    def renameterm(self, oldterm, newterm):
+        """moves the occurrences of oldterm to newterm"""
+        value = self.glossary.pop(oldterm)
+        if isinstance(value, TermOccurrences):
+            value.resetfullmsg()
+        self.glossary[newterm] = value
+
     def parse_stopword_file(self):
         actions = {
             "+": frozenset(),
@@ -120,6 +261,8 @@ class TerminologyExtractor:
             "@": frozenset(["word", "phrase"]),
         }
 
+        # case-mapped words, depending on the case mapping directives
+        self.stopmaps = {}
         with open(self.stopfile) as stopfile:
             line = 0
             try:
@@ -170,22 +313,59 @@ class TerminologyExtractor:
 
     def stopmap(self, word):
         """return case-mapped stopword for input word"""
+        try:
+            return self.stopmaps[word]
+        except KeyError:
+            pass
+        mapped = word
         if self.stopignorecase or (self.stopfoldtitle and word.istitle()):
-            word = word.lower()
-        return word
+            mapped = word.lower()
+        self.stopmaps[word] = mapped
+        return mapped
 
     def stopword(self, word, defaultset=frozenset()):
         """return stoplist frozenset for input word"""
         return self.stopwords.get(self.stopmap(word), defaultset)
 
-    def addphrases(self, words, skips, translation, partials=True):
+    def addterm(self, term, occurrence):
+        """adds an occurrence of term in a unit to the glossary"""
+        record, fullsource, unit, unitid = occurrence
+        value = self.glossary.get(term)
+        if term.lower() != fullsource:
+            if value is None:
+                # The unit record is shared by all its terms
+                self.glossary[term] = record
+            else:
+                if not isinstance(value, TermOccurrences):
+                    value = self.glossary[term] = TermOccurrences.fromvalue(value)
+                value.add(record)
+            return
+        occurrences = self.glossary[term] = (
+            TermOccurrences() if value is None else TermOccurrences.fromvalue(value)
+        )
+        occurrences.add(record)
+        occurrences.fullmsg = True
+        target = self.clean(unit.target)
+        if self.ignorecase or (self.foldtitle and target.istitle()):
+            target = target.lower()
+        if target != "":
+            occurrences.targets.setdefault(target, []).append(record[1])
+        if term.lower() == unit.source.strip().lower():
+            occurrences.sourcenotes[unit.getnotes("source code")] = None
+            occurrences.transnotes[unit.getnotes("translator")] = None
+        if isinstance(unit, po.pounit):
+            occurrences.example = (unitid, target, unit.getcontext(), unit.isfuzzy())
+        else:
+            occurrences.example = (unitid, target, "", False)
+
+    def addphrases(self, words, skips, occurrence, partials=True):
         """adds (sub)phrases with non-skipwords and more than one word"""
         if (
             len(words) > skips + 1
             and "skip" not in self.stopword(words[0])
             and "skip" not in self.stopword(words[-1])
         ):
-            self.glossary.setdefault(" ".join(words), []).append(translation)
+            self.addterm(" ".join(words), occurrence)
         if partials:
             part = list(words)
             while len(part) > 2:
@@ -196,24 +376,31 @@ class TerminologyExtractor:
                     and "skip" not in self.stopword(part[0])
                     and "skip" not in self.stopword(part[-1])
                 ):
-                    self.glossary.setdefault(" ".join(part), []).append(translation)
+                    self.addterm(" ".join(part), occurrence)
 
     def processunits(self, units, fullinputpath):
         sourcelang = lang_factory.getlanguage(self.sourcelanguage)
         rematchignore = frozenset(("word", "phrase"))
         defaultignore = frozenset()
-        for unit in units:
+        for index, unit in enumerate(units):
             self.units += 1
             if unit.isheader():
                 continue
             if not self.invert:
                 source = self.clean(unit.source)
-                target = self.clean(unit.target)
             else:
-                target = self.clean(unit.source)
                 source = self.clean(unit.target)
             if len(source) <= 1:
                 continue
+            locations = tuple(
+                dict.fromkeys(self.locre.sub("", loc) for loc in unit.getlocations())
+            )
+            occurrence = (
+                (source, fullinputpath, locations),
+                self.clean(unit.source).lower(),
+                unit,
+                (fullinputpath, index),
+            )
             for sentence in sourcelang.sentences(source):
                 words = []
                 skips = 0
@@ -229,26 +416,16 @@ class TerminologyExtractor:
                             if stopre.match(stword) is not None:
                                 ignore = rematchignore
                                 break
-                    translation = (source, target, unit, fullinputpath)
                     if "word" not in ignore:
-                        # reduce plurals
-                        root = word
-                        if (
-                            len(word) > 3
-                            and word[-1] == "s"
-                            and word[0:-1] in self.glossary
-                        ):
-                            root = word[0:-1]
-                        elif len(root) > 2 and root + "s" in self.glossary:
-                            self.glossary[root] = self.glossary.pop(root + "s")
-                        self.glossary.setdefault(root, []).append(translation)
+                        # plurals are reduced by extract_terms
+                        self.addterm(word, occurrence)
                     if self.termlength > 1:
                         if "phrase" in ignore:
                             # add trailing phrases in previous words
                             while len(words) > 2:
                                 if "skip" in self.stopword(words.pop(0)):
                                     skips -= 1
-                                self.addphrases(words, skips, translation)
+                                self.addphrases(words, skips, occurrence)
                             words = []
                             skips = 0
                         else:
@@ -259,17 +436,17 @@ class TerminologyExtractor:
                                 while len(words) > self.termlength + skips:
                                     if "skip" in self.stopword(words.pop(0)):
                                         skips -= 1
-                                self.addphrases(words, skips, translation)
+                                self.addphrases(words, skips, occurrence)
                             else:
                                 self.addphrases(
-                                    words, skips, translation, partials=False
+                                    words, skips, occurrence, partials=False
                                 )
                 if self.termlength > 1:
                     # add trailing phrases in sentence after reaching end
                     while self.termlength > 1 and len(words) > 2:
                         if "skip" in self.stopword(words.pop(0)):
                             skips -= 1
-                        self.addphrases(words, skips, translation)
+                        self.addphrases(words, skips, occurrence)
 
     def extract_terms(
         self,
@@ -280,47 +457,18 @@ class TerminologyExtractor:
         locmin=2,
     ):
         terms = {}
-        locre = re.compile(r":[0-9]+$")
+        self.reduceplurals()
         logger.info("%d terms from %d units", len(self.glossary), self.units)
-        for term, translations in self.glossary.items():
-            if len(translations) <= 1:
+        for term, occurrences in self.glossary.items():
+            if not isinstance(occurrences, TermOccurrences) or occurrences.count <= 1:
                 continue
-            filecounts = {}
-            sources = set()
-            locations = set()
-            sourcenotes = set()
-            transnotes = set()
-            targets = {}
-            fullmsg = False
-            bestunit = None
-            for source, target, unit, filename in translations:
-                sources.add(source)
-                filecounts[filename] = filecounts.setdefault(filename, 0) + 1
-                # FIXME: why reclean source and target?!
-                if term.lower() == self.clean(unit.source).lower():
-                    fullmsg = True
-                    target = self.clean(unit.target)
-                    if self.ignorecase or (self.foldtitle and target.istitle()):
-                        target = target.lower()
-                    unit.target = target
-                    if target != "":
-                        targets.setdefault(target, []).append(filename)
-                    if term.lower() == unit.source.strip().lower():
-                        sourcenotes.add(unit.getnotes("source code"))
-                        transnotes.add(unit.getnotes("translator"))
-                    unit.source = term
-                    bestunit = unit
-                # FIXME: figure out why we did a merge to begin with
-                # termunit.merge(unit, overwrite=False, comments=False)
-                for loc in unit.getlocations():
-                    locations.add(locre.sub("", loc))
-
-            numsources = len(sources)
-            numfiles = len(filecounts)
+            numsources = len(occurrences.sources)
+            numfiles = len(occurrences.filecounts)
+            locations = occurrences.locations
             numlocs = len(locations)
             if numfiles < inputmin or 0 < numlocs < locmin:
                 continue
-            if fullmsg:
+            if occurrences.fullmsg:
                 if numsources < fullmsgmin:
                     continue
             elif numsources < substrmin:
@@ -334,7 +482,13 @@ class TerminologyExtractor:
                 )
 
             termunit = create_termunit(
-                term, bestunit, targets, locations, sourcenotes, transnotes, filecounts
+                term,
+                occurrences.getexample(term),
+                occurrences.targets,
+                locations,
+                occurrences.sourcenotes,
+                occurrences.transnotes,
+                occurrences.filecounts,
             )
             terms[term] = ((10 * numfiles) + numsources, termunit)
         return terms
@@ -343,41 +497,67 @@ class TerminologyExtractor:
 
     def filter_terms(self, terms, nonstopmin=1, sortorders=sortorders_default):
         """reduce subphrases from extracted terms"""
-        # reduce subphrase
-        termlist = sorted(terms.keys(), key=len)
-        logger.info("%d terms after thresholding", len(termlist))
-        for term in termlist:
+        logger.info("%d terms after thresholding", len(terms))
+        stopflags = _StopwordFlags(self)
+        # Which terms are removed doesn't depend on the order in which they
+        # are considered, so they are all removed at the end
+        removed = set()
+        for term, value in terms.items():
             words = term.split()
-            nonstop = [word for word in words if not self.stopword(word)]
-            if len(nonstop) < nonstopmin and len(nonstop) != len(words):
-                del terms[term]
+            numwords = len(words)
+            nonstop = numwords - sum(map(stopflags.__getitem__, words))
+            if nonstop < nonstopmin and nonstop != numwords:
+                removed.add(term)
                 continue
-            if len(words) <= 2:
+            if numwords <= 2:
                 continue
-            while len(words) > 2:
-                words.pop()
-                if terms[term][0] == terms.get(" ".join(words), [0])[0]:
-                    del terms[" ".join(words)]
-            words = term.split()
-            while len(words) > 2:
-                words.pop(0)
-                if terms[term][0] == terms.get(" ".join(words), [0])[0]:
-                    del terms[" ".join(words)]
-        logger.info("%d terms after subphrase reduction", len(terms.keys()))
-        termitems = list(terms.values())
+            # reduce subphrases of two or more words at the start and at the
+            # end of the term with the same count, cutting the term at its
+            # spaces instead of joining words
+            phrase = " ".join(words)
+            space = phrase.find(" ")
+            subphrases = [phrase[space + 1 :]]
+            for prefixwords in range(2, numwords):
+                space = phrase.find(" ", space + 1)
+                subphrases.append(phrase[:space])
+                if prefixwords < numwords - 1:
+                    subphrases.append(phrase[space + 1 :])
+            for subphrase in subphrases:
+                if terms.get(subphrase, (0,))[0] == value[0]:
+                    removed.add(subphrase)
+        for term in removed:
+            del terms[term]
+        logger.info("%d terms after subphrase reduction", len(terms))
         if sortorders is None:
             sortorders = self.sortorders_default
-        while len(sortorders) > 0:
-            order = sortorders.pop()
+        # The items are sorted with the source of their unit, which is only
+        # looked up once
+        if "dictionary" in sortorders or "length" in sortorders:
+            termitems = [(item, item[1].source) for item in terms.values()]
+        else:
+            termitems = [(item, None) for item in terms.values()]
+        for order in reversed(sortorders):
             if order == "frequency":
-                termitems.sort(key=itemgetter(0), reverse=True)
+                termitems.sort(key=lambda x: x[0][0], reverse=True)
             elif order == "dictionary":
-                termitems.sort(key=lambda x: x[1].source.lower())
+                termitems.sort(key=lambda x: x[1].lower())
             elif order == "length":
-                termitems.sort(key=lambda x: x[1].source)
+                termitems.sort(key=itemgetter(1))
             else:
                 logger.warning("unknown sort order %s", order)
-        return termitems
+        return [item for item, source in termitems]
+
+
+class _StopwordFlags(dict):
+    """Whether words are stopwords, looked up once for every word."""
+
+    def __init__(self, extractor):
+        super().__init__()
+        self.extractor = extractor
+
+    def __missing__(self, word):
+        flag = self[word] = bool(self.extractor.stopword(word))
+        return flag
 
 
 class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
@@ -480,6 +660,20 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             options.output = os.path.join(options.output, "pootle-terminology.pot")
 
         progress_bar = optrecurse.ProgressBar(options.progress, inputfiles)
+        if self.getjobcount(options, len(inputfiles)) > 1:
+            # The files are processed by worker processes, and the glossaries
+            # extracted from them are merged in the order of the files
+            jobs = [
+                (inputpath, self.getfullinputpath(options, inputpath))
+                for inputpath in inputfiles
+            ]
+            for inputpath, shard in self.processjobs(options, jobs):
+                self.files += 1
+                if shard is not None:
+                    self.extractor.merge(*shard)
+                progress_bar.report_progress(inputpath, shard is not None)
+            self.outputterminology(options)
+            return
         for inputpath in inputfiles:
             self.files += 1
             fullinputpath = self.getfullinputpath(options, inputpath)
@@ -496,11 +690,32 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             progress_bar.report_progress(inputpath, success)
         self.outputterminology(options)
 
-    def processfile(self, fileprocessor, options, fullinputpath):
+    def processjob(self, options, job):
+        """Extract the terms of one file in a worker process.
+
+        :return: The glossary and the number of units of the file, or None if
+                 it couldn't be processed.
+        """
+        _inputpath, fullinputpath = job
+        extractor = self.extractor.shard()
+        try:
+            self.processfile(None, options, fullinputpath, extractor)
+        except Exception:
+            self.warning(
+                "Error processing: input %s" % (fullinputpath),
+                options,
+                sys.exc_info(),
+            )
+            return None
+        return extractor.glossary, extractor.units
+
+    def processfile(self, fileprocessor, options, fullinputpath, extractor=None):
         """process an individual file"""
+        if extractor is None:
+            extractor = self.extractor
         inputfile = self.openinputfile(options, fullinputpath)
         inputfile = factory.getobject(inputfile)
-        self.extractor.processunits(inputfile.units, fullinputpath)
+        extractor.processunits(inputfile.units, fullinputpath)
 
     def outputterminology(self, options):
         """saves the generated terminology glossary"""
@@ -533,6 +748,7 @@ def preserve_case_option(option, opt_str, value, parser):
 def main():
     formats = {"po": ("po", None), "pot": ("pot", None), None: ("po", None)}
     parser = TerminologyOptionParser(formats)
+    parser.setjobsoptions()
 
     parser.add_option(
         "-u",
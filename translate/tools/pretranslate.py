@@ -31,15 +31,23 @@ from translate.storage import factory
 tmmatcher = None
 
 
-def memory(tmfiles, max_candidates=1, min_similarity=75, max_length=1000):
-    """Returns the TM store to use. Only initialises on first call."""
+def memory(
+    tmfiles, max_candidates=1, min_similarity=75, max_length=1000, use_cache=False
+):
+    """Returns the TM store to use. Only initialises on first call.
+
+    :param use_cache: Load the TM files from binary caches next to them, see
+        :func:`translate.storage.factory.getobject`.
+    """
     global tmmatcher
     # Only initialise first time
     if tmmatcher is None:
         if isinstance(tmfiles, list):
-            tmstore = [factory.getobject(tmfile) for tmfile in tmfiles]
+            tmstore = [
+                factory.getobject(tmfile, use_cache=use_cache) for tmfile in tmfiles
+            ]
         else:
-            tmstore = factory.getobject(tmfiles)
+            tmstore = factory.getobject(tmfiles, use_cache=use_cache)
         tmmatcher = match.matcher(
             tmstore,
             max_candidates=max_candidates,
@@ -56,6 +64,7 @@ def pretranslate_file(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    cache_tm=False,
 ):
     """Pretranslate any factory supported file with old translations and
     translation memory.
@@ -66,7 +75,7 @@ def pretranslate_file(
         template_store = factory.getobject(template_file)
 
     output = pretranslate_store(
-        input_store, template_store, tm, min_similarity, fuzzymatching
+        input_store, template_store, tm, min_similarity, fuzzymatching, cache_tm
     )
     output.serialize(output_file)
     return 1
@@ -170,7 +179,12 @@ def pretranslate_unit(
 
 
 def pretranslate_store(
-    input_store, template_store, tm=None, min_similarity=75, fuzzymatching=True
+    input_store,
+    template_store,
+    tm=None,
+    min_similarity=75,
+    fuzzymatching=True,
+    cache_tm=False,
 ):
     """Do the actual pretranslation of a whole store."""
     # preperation
@@ -201,7 +215,11 @@ def pretranslate_store(
     if tm and fuzzymatching:
         # FIXME: max_length hardcoded
         matcher = memory(
-            tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+            tm,
+            max_candidates=1,
+            min_similarity=min_similarity,
+            max_length=1000,
+            use_cache=cache_tm,
         )
         matcher.addpercentage = False
         matchers.append(matcher)
@@ -240,6 +258,15 @@ def main(argv=None):
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    parser.add_option(
+        "",
+        "--cache-tm",
+        dest="cache_tm",
+        action="store_true",
+        default=False,
+        help="Keep the parsed translation memory in a binary cache next to it",
+    )
+    parser.passthrough.append("cache_tm")
     defaultsimilarity = 75
     parser.add_option(
         "-s",
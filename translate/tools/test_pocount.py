@@ -1,8 +1,9 @@
+import os
 from io import BytesIO
 
 from pytest import mark
 
-from translate.storage import po
+from translate.storage import cache, po
 from translate.tools import pocount
 
 
@@ -162,3 +163,21 @@ msgstr ""
         pofile = BytesIO(self.inputdata)
         stats = pocount.calcstats(pofile)
         assert stats["totalsourcewords"] == 6
+
+    def test_cache(self, tmp_path):
+        filename = str(tmp_path / "test.po")
+        with open(filename, "wb") as fh:
+            fh.write(self.inputdata)
+        stats = pocount.calcstats(filename)
+        assert pocount.calcstats(filename, use_cache=True) == stats
+        assert os.path.exists(cache.cache_path(filename))
+        assert cache.load_cache(filename).complete
+        assert pocount.calcstats(filename, use_cache=True) == stats
+
+    def test_json(self, tmp_path):
+        filename = str(tmp_path / "test.json")
+        with open(filename, "w") as fh:
+            fh.write('{"one": "One word", "two": {"three": ["Three more words"]}}')
+        stats = pocount.calcstats(filename)
+        assert stats["total"] == 2
+        assert stats["totalsourcewords"] == 5
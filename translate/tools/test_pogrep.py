@@ -1,3 +1,4 @@
+import json
 from io import BytesIO
 
 from translate.storage import po, xliff
@@ -198,3 +199,21 @@ class TestXLiffGrep:
             self.xliff_grep(xliff_text, "unavailable string")
         )
         assert xliff_result.isempty()
+
+
+class TestJsonGrep:
+    def test_rungrep(self, tmp_path):
+        """grep the units of a JSON file while it is read."""
+        filename = tmp_path / "test.json"
+        filename.write_text('{"a": "Hello world", "b": {"c": "Bye", "d": ["Hello"]}}')
+        options, args = pogrep.cmdlineparser().parse_args(["xxx.json"])
+        grepfilter = pogrep.GrepFilter(
+            "Hello", options.searchparts, options.ignorecase, options.useregexp
+        )
+        outputfile = BytesIO()
+        with open(filename, "rb") as inputfile:
+            assert pogrep.rungrep(inputfile, outputfile, None, grepfilter)
+        assert json.loads(outputfile.getvalue()) == {
+            "a": "Hello world",
+            "b": {"d": ["Hello"]},
+        }
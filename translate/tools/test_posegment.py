@@ -1,7 +1,7 @@
 from io import BytesIO
 
 from translate.lang import factory as lang_factory
-from translate.storage import po
+from translate.storage import po, tmx
 from translate.tools import posegment
 
 
@@ -80,3 +80,43 @@ msgstr ""
         assert (
             out_unit.target == "トランクバージョンで開発を行う場合､ Django の継続インテグレーションビルドをチェックしてください｡"
         )
+
+    def test_segmentunits_jobs(self):
+        """checks that segmenting in worker processes gives the same units"""
+        posource = "".join(
+            f"""
+#: file.c:{i}
+#, fuzzy
+msgid "First {i}. Second {i}."
+msgstr "Eerste {i}. Tweede {i}."
+"""
+            for i in range(25)
+        )
+        inputpo = po.pofile(BytesIO(posource.encode()))
+        convertor = posegment.segment(
+            lang_factory.getlanguage("en"), lang_factory.getlanguage("af")
+        )
+        convertor.batchsize = 4
+        units = list(convertor.segmentunits(inputpo.units))
+        assert len(units) == 50
+        assert units[1].source == "Second 0."
+        assert units[1].target == ""
+        assert units[1].getlocations() == ["file.c:0"]
+        parallel = list(convertor.segmentunits(iter(inputpo.units), jobs=2))
+        assert [str(unit) for unit in parallel] == [str(unit) for unit in units]
+
+    def test_tmx_stream(self):
+        """checks that TMX files are segmented to a TMX writer"""
+        inputtmx = tmx.tmxfile()
+        inputtmx.addtranslation("First. Second.", "en", "Eerste. Tweede.", "af")
+        inputtmx.addtranslation("Third.", "en", "Derde.", "af")
+        outputfile = BytesIO()
+        assert posegment.segmentfile(
+            BytesIO(bytes(inputtmx)), outputfile, None, targetlanguage="af"
+        )
+        outputtmx = tmx.tmxfile.parsestring(outputfile.getvalue())
+        assert [(unit.source, unit.target) for unit in outputtmx.units] == [
+            ("First.", "Eerste."),
+            ("Second.", "Tweede."),
+            ("Third.", "Derde."),
+        ]
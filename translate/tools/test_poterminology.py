@@ -1,6 +1,7 @@
 import os
+import pickle
 
-from translate.storage import factory
+from translate.storage import factory, po
 from translate.tools import poterminology
 
 
@@ -25,3 +26,92 @@ class TestPOTerminology:
 
         filtered_terms = extractor.filter_terms(terms)
         assert filtered_terms[0][0] > filtered_terms[-1][0]
+
+    @staticmethod
+    def test_merge_shards():
+        """Test that merging the glossaries of several files gives the same
+        terms as extracting them from all the files.
+        """
+        with open(sample_po_file, "rb") as fh:
+            inputfile = factory.getobject(fh)
+        half = len(inputfile.units) // 2
+        parts = [("one.po", inputfile.units[:half]), ("two.po", inputfile.units[half:])]
+        extractor = poterminology.TerminologyExtractor()
+        merged = poterminology.TerminologyExtractor()
+        for filename, units in parts:
+            extractor.processunits(units, filename)
+            shard = merged.shard()
+            shard.processunits(units, filename)
+            # The glossary of a worker process is pickled
+            merged.merge(*pickle.loads(pickle.dumps((shard.glossary, shard.units))))
+        assert merged.units == extractor.units == len(inputfile.units)
+
+        terms = extractor.extract_terms(inputmin=2, locmin=0)
+        merged_terms = merged.extract_terms(inputmin=2, locmin=0)
+        assert len(terms) > 10
+        assert {term: (count, str(unit)) for term, (count, unit) in terms.items()} == {
+            term: (count, str(unit)) for term, (count, unit) in merged_terms.items()
+        }
+
+    @staticmethod
+    def test_jobs(tmp_path, monkeypatch):
+        """Test that the plurals are reduced the same way whatever the
+        number of processes, when they are found in different files.
+        """
+        sources = {
+            "one.po": ["Open accesss", "Open access", "Open acces"],
+            "two.po": ["Log accesss", "Grant accesss", "Open access"],
+        }
+        for filename, units in sources.items():
+            store = po.pofile()
+            for source in units:
+                store.addsourceunit(source).addlocation(f"{filename}.c:1")
+            store.savefile(str(tmp_path / filename))
+        outputs = []
+        for jobs in ("1", "2"):
+            output = tmp_path / f"terms{jobs}.pot"
+            monkeypatch.setattr(
+                "sys.argv",
+                [
+                    "poterminology",
+                    "--progress=none",
+                    f"--jobs={jobs}",
+                    "--inputs-needed=1",
+                    "--locs-needed=1",
+                    "--substr-needed=1",
+                    *(str(tmp_path / filename) for filename in sources),
+                    "--output",
+                    str(output),
+                ],
+            )
+            poterminology.main()
+            outputs.append(output.read_bytes())
+        assert b'msgid "acces"' in outputs[0]
+        assert outputs[0] == outputs[1]
+
+    @staticmethod
+    def test_filter_terms():
+        """Test subphrase reduction and sorting of the extracted terms."""
+        extractor = poterminology.TerminologyExtractor()
+        sources = {
+            "open the file": 3,
+            "open the": 3,
+            "the file": 2,
+            "file": 5,
+            "of the": 4,
+        }
+        terms = {
+            term: (count, po.pounit(term.capitalize()))
+            for term, count in sources.items()
+        }
+        sortorders = ["frequency", "dictionary"]
+        filtered = extractor.filter_terms(terms, sortorders=sortorders)
+        # "open the" has the count of "open the file", "of the" only has
+        # stopwords
+        assert [(count, unit.source) for count, unit in filtered] == [
+            (5, "File"),
+            (3, "Open the file"),
+            (2, "The file"),
+        ]
+        assert sortorders == ["frequency", "dictionary"]
+        assert extractor.sortorders_default == ["frequency", "dictionary", "length"]
@@ -365,6 +365,7 @@ class TestPretranslateCommand(test_convert.TestConvertCommand, TestPretranslate)
     expected_options = [
         "-t TEMPLATE, --template=TEMPLATE",
         "--tm",
+        "--cache-tm",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
     ]